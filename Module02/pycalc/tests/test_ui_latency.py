@@ -0,0 +1,18 @@
+from PySide6.QtWidgets import QPushButton
+
+from pycalc.calculator import Pycalc
+
+
+def test_pycalc_latency(ui_latency):
+    calculator = Pycalc()
+    ui_latency.show(calculator)
+    buttons = {b.text(): b for b in calculator.findChildren(QPushButton)}
+
+    for key in "12+34=":
+        ui_latency.click(f"click {key}", buttons[key])
+    assert calculator.display.text() == "46.0"
+    for key in "*2=":
+        ui_latency.click(f"click {key}", buttons[key])
+    assert calculator.display.text() == "92.0"
+    ui_latency.assert_within_budget()
+    ui_latency.assert_repainted()
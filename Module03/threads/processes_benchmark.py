@@ -0,0 +1,79 @@
+"""Measure CPU-bound work (amortisation schedules) split in jobs run on
+1, 2, 4... threads of a TaskPool and processes of a ProcessPool, up to the
+number of processors.  Threads take turns holding the interpreter lock,
+processes run at the same time.
+Run with: uv run python processes_benchmark.py [LOANS]"""
+
+import os
+import sys
+import time
+
+from PySide6.QtCore import QCoreApplication, QEventLoop
+
+from threads.loan_schedules import total_interest
+from threads.process_pool import ProcessPool
+from threads.task_pool import TaskPool
+
+loans = int(sys.argv[1]) if len(sys.argv) > 1 else 40_000
+cpus = os.cpu_count() or 1
+
+
+def chunks(jobs):
+    size = -(-loans // jobs)
+    return [(first, min(size, loans - first)) for first in range(0, loans, size)]
+
+
+def run(submit, jobs):
+    """Answer the seconds taken by `jobs` jobs, and their total."""
+    loop = QEventLoop()
+    results = []
+
+    def finished(result):
+        results.append(result)
+        if len(results) == jobs:
+            loop.quit()
+
+    start = time.perf_counter()
+    for first, count in chunks(jobs):
+        submit(first, count).finished.connect(finished)
+    loop.exec()
+    return time.perf_counter() - start, sum(results)
+
+
+def on_threads(jobs):
+    pool = TaskPool(jobs)
+    result = run(
+        lambda first, count: (
+            pool.submit(lambda task: total_interest(first, count, task.report)).signals
+        ),
+        jobs,
+    )
+    pool.shutdown()
+    return result
+
+
+def in_processes(jobs):
+    pool = ProcessPool(jobs)
+    # start the processes before timing, as an application would early on
+    run(lambda first, count: pool.submit(total_interest, first, 1), jobs)
+    result = run(lambda first, count: pool.submit(total_interest, first, count), jobs)
+    pool.shutdown()
+    return result
+
+
+if __name__ == "__main__":
+    app = QCoreApplication(sys.argv)
+    print(f"{loans} loans, {cpus} processors")
+    base = None
+    jobs = 1
+    while True:
+        for name, measure in (("threads", on_threads), ("processes", in_processes)):
+            elapsed, total = measure(jobs)
+            base = base or elapsed
+            print(
+                f"{jobs:3} {name:<10} {elapsed:6.2f} s  "
+                f"speed-up {base / elapsed:4.1f}  interest {total:,.0f}"
+            )
+        if jobs >= cpus:
+            break
+        jobs = min(2 * jobs, cpus)
@@ -0,0 +1,115 @@
+"""Measure a worker reporting progress on every iteration, with and without
+a ProgressThrottle: how many events queue up in the GUI thread, how late
+its timers fire meanwhile, and how long after the worker is done the
+progress bar shows 100%.
+Run with: uv run python progress_benchmark.py [ITERATIONS]"""
+
+import sys
+import time
+
+from PySide6.QtCore import QObject, QThread, QTimer, Signal, Slot
+from PySide6.QtWidgets import QApplication, QProgressBar
+
+from threads.progress_throttle import ProgressThrottle
+
+iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+probe_ms = 10
+
+
+class Counted:
+    """A signal that counts how often it is emitted."""
+
+    def __init__(self, signal):
+        self.signal = signal
+        self.count = 0
+
+    def emit(self, value):
+        self.count += 1
+        self.signal.emit(value)
+
+
+class Worker(QObject):
+    progress = Signal(int)
+    finished = Signal()
+
+    def __init__(self, throttled):
+        super().__init__()
+        self.throttled = throttled
+        self.emitted = None
+        self.done_at = None
+
+    @Slot()
+    def go(self):
+        self.emitted = Counted(self.progress)
+        throttle = ProgressThrottle(self.emitted)
+        report = throttle.report if self.throttled else self.emitted.emit
+        total = 0
+        for i in range(1, iterations + 1):
+            total += i * i  # work
+            report(100 * i // iterations)
+        throttle.flush()
+        self.done_at = time.perf_counter()
+        self.finished.emit()
+
+
+class Receiver(QObject):
+    def __init__(self, worker, bar):
+        super().__init__()
+        self.worker = worker
+        self.bar = bar
+        self.delivered = 0
+        self.max_backlog = 0
+        self.max_late_ms = 0.0
+        self.shown_at = None
+        self._last_probe = time.perf_counter()
+
+    def progress(self, percent):
+        self.delivered += 1
+        self.bar.setValue(percent)
+        if percent == 100:
+            self.shown_at = time.perf_counter()
+
+    def probe(self):
+        # the events emitted and not delivered yet, roughly
+        now = time.perf_counter()
+        late_ms = (now - self._last_probe) * 1000 - probe_ms
+        self.max_late_ms = max(self.max_late_ms, late_ms)
+        self._last_probe = now
+        emitted = self.worker.emitted
+        backlog = 0 if emitted is None else emitted.count - self.delivered
+        self.max_backlog = max(self.max_backlog, backlog)
+
+
+def measure(app, bar, throttled):
+    worker = Worker(throttled)
+    receiver = Receiver(worker, bar)
+    thread = QThread()
+    worker.moveToThread(thread)
+    worker.progress.connect(receiver.progress)
+    thread.started.connect(worker.go)
+    timer = QTimer()
+    timer.timeout.connect(receiver.probe)
+    timer.start(probe_ms)
+    bar.setValue(0)
+    start = time.perf_counter()
+    thread.start()
+    while receiver.shown_at is None:
+        app.processEvents()
+    timer.stop()
+    thread.quit()
+    thread.wait()
+    name = "throttled" if throttled else "every update"
+    print(
+        f"{name:<13} {worker.done_at - start:6.2f} s work  "
+        f"{receiver.delivered:8} updates  backlog up to {receiver.max_backlog:8}  "
+        f"timers up to {receiver.max_late_ms:7.1f} ms late  "
+        f"100% shown {(receiver.shown_at - worker.done_at) * 1000:8.1f} ms after"
+    )
+
+
+app = QApplication(sys.argv)
+bar = QProgressBar(minimum=0, maximum=100)
+bar.show()
+print(f"{iterations} iterations")
+measure(app, bar, throttled=False)
+measure(app, bar, throttled=True)
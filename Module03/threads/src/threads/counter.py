@@ -2,16 +2,31 @@ import time
 
 from PySide6.QtCore import QObject, QThread, Signal, Slot
 
+from threads.progress_throttle import ProgressThrottle
+
 
 class Counter(QObject):
     finished = Signal(name="finished")
-    progress = Signal(int, name="progress")
+    progress = Signal(int, name="progress")  # percent
+
+    steps = 100
+    delay = 0.05  # seconds of work per step
 
     @Slot()
     def go(self):
-        for i in range(0, 101):
+        progress = ProgressThrottle(self.progress)
+        for i in range(0, self.steps + 1):
             if QThread.currentThread().isInterruptionRequested():
                 return
-            self.progress.emit(i)
-            time.sleep(0.05)
+            progress.report(100 * i // self.steps)
+            time.sleep(self.delay)
+        progress.flush()
         self.finished.emit()
+
+
+def count(task, steps=100, delay=0.05):
+    """`Counter.go` as a function for a `task_pool.TaskPool`."""
+    for i in range(0, steps + 1):
+        task.report(100 * i // steps)
+        time.sleep(delay)
+    return steps
@@ -0,0 +1,39 @@
+"""CPU-bound work to offload: the amortisation schedules of many loans."""
+
+from threads.process_pool import report_progress
+
+
+def amortisation_schedule(
+    principal: float, annual_rate: float, months: int
+) -> list[tuple[int, float, float, float]]:
+    """Answer (month, interest, repayment, balance) for every month of a
+    loan paid back in equal monthly payments."""
+    rate = annual_rate / 12
+    if rate:
+        payment = principal * rate / (1 - (1 + rate) ** -months)
+    else:
+        payment = principal / months
+    schedule = []
+    balance = principal
+    for month in range(1, months + 1):
+        interest = balance * rate
+        repayment = payment - interest
+        balance -= repayment
+        schedule.append((month, interest, repayment, balance))
+    return schedule
+
+
+def total_interest(first: int, count: int, report=report_progress) -> float:
+    """Answer the interest paid on the loans `first` to `first + count - 1`
+    of a made up portfolio, reporting the progress in percent to `report`.
+    Run in a process pool as is, or in a `task_pool.TaskPool` with
+    `task.report` as `report`."""
+    total = 0.0
+    for n in range(first, first + count):
+        principal = 10_000 + 1_000 * (n % 90)
+        annual_rate = 0.01 + 0.001 * (n % 70)
+        months = 12 * (5 + n % 26)
+        schedule = amortisation_schedule(principal, annual_rate, months)
+        total += sum(interest for _, interest, _, _ in schedule)
+        report(100 * (n - first + 1) // count)
+    return total
@@ -0,0 +1,181 @@
+"""Run CPU-bound functions in other processes and hear from them through
+signals.
+
+Threads do not make CPU-bound Python faster: only the thread holding the
+interpreter lock runs Python code.  `ProcessPool` runs each job in one of
+a `ProcessPoolExecutor`'s processes, each with its own interpreter, and
+answers a `Job` whose signals report the progress, the result or an error
+in the thread that submitted it, like a `task_pool.Task`.
+
+The function and its arguments are pickled to the process and the result
+back, so the function must be defined at the top level of a module and
+should get and answer little data compared to the work it does.  It
+reports progress by calling `report_progress(percent)`, which sends at
+most 30 reports a second (see `progress_throttle`); the pool collects them
+every `poll_interval_ms`.  A job can be cancelled until it starts; a
+running job runs to its end, but its result is dropped.  Only `shutdown`
+with a timeout stops running jobs, by terminating their processes.
+"""
+
+import multiprocessing
+import time
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor, wait
+from functools import partial
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from threads.progress_throttle import ProgressThrottle
+
+# in the processes of a pool: the progress reports, and the current job
+_progress: Optional[ProgressThrottle] = None
+_job_id = None
+
+
+class _ProgressSender:
+    def __init__(self, progress_queue):
+        self._queue = progress_queue
+
+    def emit(self, percent: int) -> None:
+        self._queue.put((_job_id, percent))
+
+
+def report_progress(percent: int) -> None:
+    """Report the progress of the job running in this process."""
+    if _progress is not None:
+        _progress.report(percent)
+
+
+def _start_process(progress_queue) -> None:
+    global _progress
+    _progress = ProgressThrottle(_ProgressSender(progress_queue))
+
+
+def _run(job_id: int, function: Callable[..., Any], args: tuple) -> Any:
+    global _job_id
+    _job_id = job_id
+    try:
+        return function(*args)
+    finally:
+        _progress.flush()
+
+
+class Job(QObject):
+    progress = Signal(int)  # percent
+    finished = Signal(object)  # the result
+    failed = Signal(str)  # error message
+    cancelled = Signal()
+
+    def __init__(self, job_id: int, parent=None):
+        super().__init__(parent)
+        self.id = job_id
+        self.future: Optional[Future] = None
+
+
+class ProcessPool(QObject):
+    poll_interval_ms = 30
+
+    # the job id and future of a job that is done, emitted in the
+    # executor's thread
+    _future_done = Signal(int, object)
+
+    def __init__(self, max_processes: Optional[int] = None, parent=None):
+        """Run at most `max_processes` jobs at once, by default as many as
+        there are processors.  The processes are spawned, not forked: a
+        forked copy of a process running Qt threads is not safe to use."""
+        super().__init__(parent)
+        context = multiprocessing.get_context("spawn")
+        self._progress_queue = context.SimpleQueue()
+        self._executor = ProcessPoolExecutor(
+            max_processes,
+            context,
+            initializer=_start_process,
+            initargs=(self._progress_queue,),
+        )
+        self._jobs: dict[int, Job] = {}
+        self._next_id = 1
+        self._future_done.connect(self._job_done)
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(self.poll_interval_ms)
+        self._poll_timer.timeout.connect(self._poll_progress)
+
+    def submit(self, function: Callable[..., Any], *args) -> Job:
+        """Run `function(*args)` in one of the processes.  Answer the job;
+        its signals are emitted in this thread once control returns to the
+        event loop."""
+        job = Job(self._next_id)
+        self._next_id += 1
+        self._jobs[job.id] = job
+        job.future = self._executor.submit(_run, job.id, function, args)
+        job.future.add_done_callback(partial(self._future_done.emit, job.id))
+        self._poll_timer.start()
+        return job
+
+    def cancel(self, job: Job) -> None:
+        """Cancel `job`, which runs to its end if it has started already."""
+        job.future.cancel()
+        if self._jobs.pop(job.id, None) is not None:
+            job.cancelled.emit()
+            self._stop_polling_if_idle()
+
+    def cancel_all(self) -> None:
+        for job in list(self._jobs.values()):
+            self.cancel(job)
+
+    def active_count(self) -> int:
+        """The number of jobs running or waiting to."""
+        return len(self._jobs)
+
+    def shutdown(self, timeout_ms: Optional[int] = None) -> bool:
+        """Cancel the jobs and end the processes once the running jobs are
+        done, and take no more.  This blocks: a running job cannot be
+        stopped, so with `timeout_ms` the processes of the jobs still
+        running after it are terminated.  Answer whether the running jobs
+        ended by themselves."""
+        not_done = {job.future for job in self._jobs.values()}
+        self.cancel_all()
+        deadline = None if timeout_ms is None else time.monotonic() + timeout_ms / 1000
+        while not_done:
+            # a job blocks when the progress queue is full, so keep reading
+            # it, and drop the reports
+            self._poll_progress()
+            slice_s = self.poll_interval_ms / 1000
+            if deadline is not None:
+                slice_s = min(slice_s, deadline - time.monotonic())
+                if slice_s <= 0:
+                    break
+            _, not_done = wait(not_done, slice_s)
+        if not_done:
+            self._executor.terminate_workers()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        return not not_done
+
+    def _poll_progress(self) -> None:
+        latest = {}
+        while not self._progress_queue.empty():
+            job_id, percent = self._progress_queue.get()
+            latest[job_id] = percent
+        for job_id, percent in latest.items():
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.progress.emit(percent)
+
+    def _job_done(self, job_id: int, future: Future) -> None:
+        if job_id not in self._jobs:
+            return  # cancelled
+        # the progress reported before the end, then the end
+        self._poll_progress()
+        job = self._jobs.pop(job_id)
+        try:
+            result = future.result()
+        except CancelledError:
+            job.cancelled.emit()
+        except Exception as e:
+            job.failed.emit(str(e) or type(e).__name__)
+        else:
+            job.finished.emit(result)
+        self._stop_polling_if_idle()
+
+    def _stop_polling_if_idle(self) -> None:
+        if not self._jobs:
+            self._poll_timer.stop()
@@ -0,0 +1,66 @@
+import asyncio
+import sys
+
+from PySide6 import QtAsyncio
+from PySide6.QtWidgets import (
+    QApplication,
+    QCheckBox,
+    QLabel,
+    QLineEdit,
+    QProgressBar,
+    QPushButton,
+    QVBoxLayout,
+    QWidget,
+)
+
+
+class CoroutineProgressBarDemo(QWidget):
+    """The task of `progress_bar_transient_thread` as a coroutine.  It runs
+    on the GUI thread, which stays free while the task waits."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.task = None
+
+        self.button = QPushButton("Run Task...")
+        self.button.clicked.connect(self._button_clicked)
+        input = QLineEdit()
+        checkbox = QCheckBox("Click me")
+        self.bar = QProgressBar(minimum=0, maximum=100)
+        self.status = QLabel("")
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.button)
+        layout.addWidget(input)
+        layout.addWidget(checkbox)
+        layout.addWidget(self.bar)
+        layout.addWidget(self.status)
+
+    def _button_clicked(self):
+        self.task = asyncio.ensure_future(self._count())
+        self.button.setEnabled(False)
+        self.status.setText("Started")
+
+    async def _count(self):
+        for i in range(0, 101):
+            self.bar.setValue(i)
+            await asyncio.sleep(0.05)  # waiting, e.g. for a file or database
+        self.task = None
+        self.status.setText("Finished")
+        self.button.setEnabled(True)
+
+    def about_to_quit(self):
+        if self.task is not None:
+            self.task.cancel()
+
+
+def main():
+    app = QApplication(sys.argv)
+    w = CoroutineProgressBarDemo()
+    app.aboutToQuit.connect(w.about_to_quit)
+    w.show()
+    QtAsyncio.run(handle_sigint=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+import os
+import sys
+import time
+
+from PySide6.QtWidgets import (
+    QApplication,
+    QHBoxLayout,
+    QLabel,
+    QProgressBar,
+    QPushButton,
+    QVBoxLayout,
+    QWidget,
+)
+
+from threads.loan_schedules import total_interest
+from threads.process_pool import ProcessPool
+from threads.task_pool import Task, TaskPool
+
+LOANS = 20_000
+
+
+class ProcessPoolDemo(QWidget):
+    """Compute the amortisation schedules of many loans, split in as many
+    jobs as there are processors, on threads or in processes."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.jobs = os.cpu_count() or 1
+        self.threads = TaskPool(self.jobs, self)
+        self.processes = ProcessPool(self.jobs, self)
+        self._jobs = {}  # signals -> job number
+        self._progress = []
+        self._running = 0
+        self._total = 0.0
+        self._errors = []
+        self._start = 0.0
+
+        self.thread_button = QPushButton("Run on Threads")
+        self.thread_button.clicked.connect(self._run_on_threads)
+        self.process_button = QPushButton("Run in Processes")
+        self.process_button.clicked.connect(self._run_in_processes)
+        self.bar = QProgressBar(minimum=0, maximum=100)
+        self.status = QLabel(f"{LOANS} loans in {self.jobs} jobs")
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.thread_button)
+        buttons.addWidget(self.process_button)
+        layout = QVBoxLayout(self)
+        layout.addLayout(buttons)
+        layout.addWidget(self.bar)
+        layout.addWidget(self.status)
+
+    def _chunks(self):
+        size = -(-LOANS // self.jobs)
+        return [(first, min(size, LOANS - first)) for first in range(0, LOANS, size)]
+
+    def _run_on_threads(self):
+        self._started("threads")
+        for n, (first, count) in enumerate(self._chunks()):
+            task = Task(
+                lambda task, first=first, count=count: total_interest(
+                    first, count, task.report
+                )
+            )
+            self._connect(n, task.signals)
+            self.threads.start(task)
+
+    def _run_in_processes(self):
+        self._started("processes")
+        for n, (first, count) in enumerate(self._chunks()):
+            self._connect(n, self.processes.submit(total_interest, first, count))
+
+    def _started(self, where):
+        self.thread_button.setEnabled(False)
+        self.process_button.setEnabled(False)
+        self._where = where
+        self._jobs = {}
+        self._progress = [0] * len(self._chunks())
+        self._running = len(self._progress)
+        self._total = 0.0
+        self._errors = []
+        self._start = time.perf_counter()
+        self.bar.setValue(0)
+        self.status.setText(f"Running on {where}...")
+
+    def _connect(self, n, signals):
+        # to methods, a lambda would be called in the thread of a task
+        self._jobs[signals] = n
+        signals.progress.connect(self._job_progress)
+        signals.finished.connect(self._job_finished)
+        signals.failed.connect(self._job_failed)
+        signals.cancelled.connect(self._job_cancelled)
+
+    def _job_progress(self, percent):
+        self._progress[self._jobs[self.sender()]] = percent
+        self.bar.setValue(sum(self._progress) // len(self._progress))
+
+    def _job_finished(self, result):
+        self._job_progress(100)
+        self._total += result
+        self._job_ended()
+
+    def _job_failed(self, message):
+        self._errors.append(message)
+        self._job_ended()
+
+    def _job_cancelled(self):
+        self._errors.append("cancelled")
+        self._job_ended()
+
+    def _job_ended(self):
+        self._running -= 1
+        if self._running:
+            return
+        if self._errors:
+            self.status.setText(f"{self._where}: {self._errors[0]}")
+        else:
+            self.status.setText(
+                f"{self._where}: {time.perf_counter() - self._start:.2f} s, "
+                f"interest {self._total:,.0f}"
+            )
+        self.thread_button.setEnabled(True)
+        self.process_button.setEnabled(True)
+
+    def about_to_quit(self):
+        self.threads.shutdown(TaskPool.shutdown_timeout_ms)
+        # blocks the quitting application until the running jobs are done,
+        # or their processes terminated
+        self.processes.shutdown(TaskPool.shutdown_timeout_ms)
+
+
+def main():
+    app = QApplication(sys.argv)
+    w = ProcessPoolDemo()
+    app.aboutToQuit.connect(w.about_to_quit)
+    w.show()
+    sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()
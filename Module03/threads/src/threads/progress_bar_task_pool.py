@@ -0,0 +1,68 @@
+import sys
+
+from PySide6.QtWidgets import (
+    QApplication,
+    QHBoxLayout,
+    QLabel,
+    QProgressBar,
+    QPushButton,
+    QSpinBox,
+    QVBoxLayout,
+    QWidget,
+)
+
+from threads.counter import count
+from threads.task_pool import Task, application_pool
+
+
+class TaskPoolDemo(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = application_pool()
+
+        run_button = QPushButton("Run Task")
+        run_button.clicked.connect(self._run_button_clicked)
+        self.priority = QSpinBox(prefix="Priority ", minimum=-10, maximum=10)
+        cancel_button = QPushButton("Cancel All")
+        cancel_button.clicked.connect(self.pool.cancel_all)
+        self.pool.task_done.connect(self._show_status)
+        self.status = QLabel("")
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(run_button)
+        buttons.addWidget(self.priority)
+        buttons.addWidget(cancel_button)
+        self.bars = QVBoxLayout()
+        layout = QVBoxLayout(self)
+        layout.addLayout(buttons)
+        layout.addLayout(self.bars)
+        layout.addWidget(self.status)
+        layout.addStretch()
+
+    def _run_button_clicked(self):
+        bar = QProgressBar(minimum=0, maximum=100)
+        bar.setFormat(f"priority {self.priority.value()}: %p%")
+        self.bars.addWidget(bar)
+        # connected before it starts, so that no signal of it is missed
+        task = Task(count)
+        task.signals.progress.connect(bar.setValue)
+        task.signals.cancelled.connect(bar.deleteLater)
+        self.pool.start(task, self.priority.value())
+        self._show_status()
+
+    def _show_status(self):
+        self.status.setText(
+            f"{self.pool.active_count()} tasks, "
+            f"at most {self.pool.max_threads()} at once"
+        )
+
+
+def main():
+    app = QApplication(sys.argv)
+    w = TaskPoolDemo()
+    w.show()
+    sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()
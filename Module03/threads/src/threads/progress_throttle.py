@@ -0,0 +1,42 @@
+"""Keep a busy worker from flooding the GUI thread with progress.
+
+Every signal a worker emits to an object in the GUI thread is a queued
+event there.  A worker reporting progress on each of a million iterations
+queues a million events, the GUI thread falls behind delivering them and
+the progress bar shows where the worker was long ago.
+
+`ProgressThrottle` emits at most `max_rate` updates a second, each with the
+latest value, and `flush` delivers the last value held back, so the final
+progress is never lost.  Use it from one thread, the worker's.
+"""
+
+import time
+
+_NOTHING = object()
+
+
+class ProgressThrottle:
+    def __init__(self, signal, max_rate: float = 30.0):
+        """Emit `signal` with the progress at most `max_rate` times a
+        second."""
+        self._emit = signal.emit
+        self._interval = 1.0 / max_rate
+        self._next_time = 0.0
+        self._pending = _NOTHING
+
+    def report(self, value) -> None:
+        """Emit `value` if the last update is long enough ago, otherwise keep
+        it for the next one (or `flush`)."""
+        now = time.monotonic()
+        if now < self._next_time:
+            self._pending = value
+            return
+        self._next_time = now + self._interval
+        self._pending = _NOTHING
+        self._emit(value)
+
+    def flush(self) -> None:
+        """Emit the value held back, if any.  Call it when the work is done."""
+        if self._pending is not _NOTHING:
+            value, self._pending = self._pending, _NOTHING
+            self._emit(value)
@@ -0,0 +1,198 @@
+"""Run functions on threads that end together.
+
+Threads started by hand are easily let go: nobody joins them, and an error
+in one is printed and lost while the others run on.  A `TaskGroup` runs
+each function on a thread of its own and is only over once all of them
+are:
+
+    with TaskGroup() as group:
+        group.start(task_a)
+        group.start(task_c)
+        task_b()
+
+When a function raises, the group cancels the others and, once they have
+stopped, raises the first error.  Cancelling is cooperative, as in
+`task_pool`: a function stops at its next `check_cancelled()` or `sleep()`,
+which do what their names say outside a group too.  Each task records how
+it ended and how long it ran; `report()` lists them.
+
+`with` blocks until the group is over, which would freeze a GUI.
+`QtTaskGroup` runs a group and reports its end through signals instead.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import QObject, Signal
+
+from threads.task_pool import Cancelled, CancelToken
+
+# the token of the group running the function of the current thread
+_current = threading.local()
+
+
+def check_cancelled() -> None:
+    """Raise `Cancelled` if the group of this thread is cancelled."""
+    token = getattr(_current, "token", None)
+    if token is not None:
+        token.check()
+
+
+def sleep(seconds: float) -> None:
+    """Sleep, but raise `Cancelled` as soon as the group of this thread is
+    cancelled."""
+    token = getattr(_current, "token", None)
+    if token is None:
+        time.sleep(seconds)
+    elif token.wait(seconds):
+        raise Cancelled
+
+
+@dataclass
+class GroupTask:
+    name: str
+    outcome: str = "running"  # then "finished", "failed" or "cancelled"
+    result: Any = None
+    error: Optional[Exception] = None
+    seconds: float = 0.0
+
+
+class TaskGroup:
+    def __init__(self, on_done: Optional[Callable[[], None]] = None):
+        """Call `on_done`, if given, once the group is closed and all its
+        tasks have ended, in the thread of the last one."""
+        self.token = CancelToken()
+        self.tasks: list[GroupTask] = []
+        self.error: Optional[Exception] = None
+        self._on_done = on_done
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._running = 0
+        self._closed = False
+
+    def start(
+        self, function: Callable[..., Any], *args, name: Optional[str] = None, **kwargs
+    ) -> GroupTask:
+        """Run `function(*args, **kwargs)` on a thread of its own."""
+        task = GroupTask(name or function.__name__)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("the task group is closed")
+            self.tasks.append(task)
+            self._running += 1
+        thread = threading.Thread(
+            target=self._run, args=(task, function, args, kwargs), name=task.name
+        )
+        self._threads.append(thread)
+        thread.start()
+        return task
+
+    def cancel(self) -> None:
+        self.token.cancel()
+
+    def close(self) -> None:
+        """Take no more tasks."""
+        with self._lock:
+            self._closed = True
+            done = self._running == 0
+        if done:
+            self._done()
+
+    def join(self) -> None:
+        """Close the group and wait until all its tasks have ended.  Raise
+        the first error of a task, if any."""
+        self.close()
+        for thread in self._threads:
+            thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def __enter__(self) -> "TaskGroup":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc is not None:
+            # the error of the body wins over those of the tasks
+            self.cancel()
+            self.close()
+            for thread in self._threads:
+                thread.join()
+        else:
+            self.join()
+
+    def report(self) -> str:
+        """Answer how each task ended and how long it ran."""
+        return "\n".join(
+            f"{task.name:<20}{task.outcome:<10}{task.seconds:8.3f} s"
+            for task in self.tasks
+        )
+
+    def _run(self, task: GroupTask, function, args, kwargs) -> None:
+        _current.token = self.token
+        start = time.perf_counter()
+        try:
+            self.token.check()
+            task.result = function(*args, **kwargs)
+            task.outcome = "finished"
+        except Cancelled:
+            task.outcome = "cancelled"
+        except Exception as e:
+            task.outcome = "failed"
+            task.error = e
+            with self._lock:
+                if self.error is None:
+                    self.error = e
+            self.cancel()
+        finally:
+            task.seconds = time.perf_counter() - start
+            _current.token = None
+        with self._lock:
+            self._running -= 1
+            done = self._closed and self._running == 0
+        if done:
+            self._done()
+
+    def _done(self) -> None:
+        if self._on_done is not None:
+            self._on_done()
+
+
+class QtTaskGroup(QObject):
+    finished = Signal(object)  # the tasks, all finished
+    failed = Signal(str)  # the first error message, the others cancelled
+    cancelled = Signal()
+
+    # all tasks ended, emitted in the thread of the last one
+    _group_done = Signal()
+
+    def __init__(self, parent=None):
+        """Start the tasks, then `close()` the group; its signals are
+        emitted in this thread once all tasks have ended."""
+        super().__init__(parent)
+        self.group = TaskGroup(on_done=self._group_done.emit)
+        self._group_done.connect(self._done)
+
+    def start(
+        self, function: Callable[..., Any], *args, name: Optional[str] = None, **kwargs
+    ) -> GroupTask:
+        return self.group.start(function, *args, name=name, **kwargs)
+
+    def close(self) -> None:
+        self.group.close()
+
+    def cancel(self) -> None:
+        self.group.cancel()
+
+    def report(self) -> str:
+        return self.group.report()
+
+    def _done(self) -> None:
+        error = self.group.error
+        if error is not None:
+            self.failed.emit(str(error) or type(error).__name__)
+        elif self.group.token.is_cancelled():
+            self.cancelled.emit()
+        else:
+            self.finished.emit(self.group.tasks)
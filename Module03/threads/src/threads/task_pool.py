@@ -0,0 +1,234 @@
+"""Run functions on a pool of threads and hear from them through signals.
+
+The demos in this package each create a `QThread` and a worker object.
+`TaskPool` does that once for any function: `pool.submit(count, 100)` runs
+`count(task, 100)` on one of the pool's threads and answers the `Task`,
+whose signals report the progress, the result, an error or that the task
+was cancelled.  Connected to the methods of widgets (or other objects of
+the thread that submitted the task) the signals are delivered in that
+thread; a lambda would be called in the pool's thread.
+
+The function is handed its task to report progress with (`task.report`)
+and to check whether it should stop (`task.check_cancelled`).  Cancelling
+is cooperative: a task that has not started yet is dropped, a running one
+stops at its next check.  At most `max_threads` tasks run at once, the
+others wait in order of their priority.
+
+`application_pool()` is a pool for the whole application.  Its threads are
+reused from task to task, and when the application is about to quit it
+cancels all tasks and waits for them, at most `shutdown_timeout_ms`, so no
+widget has to tear down threads of its own.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import (
+    QCoreApplication,
+    QEventLoop,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
+
+from threads.progress_throttle import ProgressThrottle
+
+
+class Cancelled(Exception):
+    pass
+
+
+class CancelToken:
+    """A flag that can be set in one thread and checked in another."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def check(self) -> None:
+        if self._event.is_set():
+            raise Cancelled
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until cancelled, at most `timeout` seconds if given.  Answer
+        whether it is."""
+        return self._event.wait(timeout)
+
+
+class TaskSignals(QObject):
+    progress = Signal(int)  # percent
+    finished = Signal(object)  # the result
+    failed = Signal(str)  # error message
+    cancelled = Signal()
+    # the task, after finished, failed or cancelled
+    done = Signal(object)
+
+
+class Task(QRunnable):
+    def __init__(
+        self,
+        function: Callable[..., Any],
+        *args,
+        token: Optional[CancelToken] = None,
+        **kwargs,
+    ):
+        """Run `function(task, *args, **kwargs)`.  Tasks sharing a `token`
+        are cancelled together."""
+        super().__init__()
+        # the pool keeps the task until it is done, not Qt
+        self.setAutoDelete(False)
+        self.signals = TaskSignals()
+        self.token = token if token is not None else CancelToken()
+        self._function = function
+        self._args = args
+        self._kwargs = kwargs
+        self._percent = -1
+        self._progress = ProgressThrottle(self.signals.progress)
+
+    def report(self, percent: int) -> None:
+        """Emit the progress if it changed, at most 30 times a second, and
+        stop if cancelled."""
+        self.token.check()
+        if percent != self._percent:
+            self._percent = percent
+            self._progress.report(percent)
+
+    def check_cancelled(self) -> None:
+        self.token.check()
+
+    def run(self):
+        try:
+            self.token.check()
+            result = self._function(self, *self._args, **self._kwargs)
+        except Cancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.failed.emit(str(e) or type(e).__name__)
+        else:
+            self._progress.flush()
+            self.signals.finished.emit(result)
+        self.signals.done.emit(self)
+
+
+_log = logging.getLogger(__name__)
+_application_pool: Optional["TaskPool"] = None
+
+
+class TaskPool(QObject):
+    # a task is done and no longer counted
+    task_done = Signal(object)
+    # all tasks are done
+    idle = Signal()
+
+    # how long the application waits for the tasks to stop when it quits
+    shutdown_timeout_ms = 5000
+
+    def __init__(self, max_threads: Optional[int] = None, parent=None):
+        """Run at most `max_threads` tasks at once, by default as many as
+        there are processors."""
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        if max_threads is not None:
+            self._pool.setMaxThreadCount(max_threads)
+        # the tasks submitted and not done yet
+        self._tasks: set[Task] = set()
+        self._shut_down = False
+
+    def max_threads(self) -> int:
+        return self._pool.maxThreadCount()
+
+    def submit(
+        self, function: Callable[..., Any], *args, priority: int = 0, **kwargs
+    ) -> Task:
+        """Run `function(task, *args, **kwargs)` on the pool, before the
+        waiting tasks of lower `priority`.  Answer the task, which may be
+        running already: a short one may even be over before you connect to
+        its signals.  To hear from it for sure, create a `Task`, connect to
+        it, then `start` it."""
+        task = Task(function, *args, **kwargs)
+        self.start(task, priority)
+        return task
+
+    def start(self, task: Task, priority: int = 0) -> None:
+        if self._shut_down:
+            raise RuntimeError("the task pool is shut down")
+        self._tasks.add(task)
+        # to a method, so that it is called in this thread
+        task.signals.done.connect(self._task_done)
+        self._pool.start(task, priority)
+
+    def cancel(self, task: Task) -> None:
+        task.token.cancel()
+        if self._pool.tryTake(task):
+            # never started, it ends here
+            task.signals.cancelled.emit()
+            task.signals.done.emit(task)
+
+    def cancel_all(self) -> None:
+        for task in list(self._tasks):
+            self.cancel(task)
+
+    def active_count(self) -> int:
+        """The number of tasks running or waiting to."""
+        return len(self._tasks)
+
+    def tasks(self) -> list[Task]:
+        """The tasks running or waiting to."""
+        return list(self._tasks)
+
+    def wait(self, timeout_ms: Optional[int] = None) -> bool:
+        """Wait until all tasks are done and their signals delivered, at most
+        `timeout_ms` if given.  Answer whether they are.  The events of this
+        thread are processed meanwhile: the `done` and `finished` signals of
+        the tasks are queued to this thread, and only its event loop
+        delivers them, which `QThreadPool.waitForDone` would not run."""
+        if not self._tasks:
+            return True
+        loop = QEventLoop()
+        self.idle.connect(loop.quit)
+        if timeout_ms is not None:
+            QTimer.singleShot(timeout_ms, loop, loop.quit)
+        loop.exec()
+        self.idle.disconnect(loop.quit)
+        return not self._tasks
+
+    def _task_done(self, task: Task) -> None:
+        self._tasks.discard(task)
+        self.task_done.emit(task)
+        if not self._tasks:
+            self.idle.emit()
+
+    def shutdown(self, timeout_ms: Optional[int] = None) -> bool:
+        """Cancel all tasks and wait until they have stopped, at most
+        `timeout_ms` if given, and take no more.  Answer whether they all
+        have stopped; a task that never checks whether it is cancelled runs
+        on until it is done."""
+        self._shut_down = True
+        self.cancel_all()
+        return self.wait(timeout_ms)
+
+    def _application_quitting(self) -> None:
+        if not self.shutdown(self.shutdown_timeout_ms):
+            _log.warning(
+                "%d tasks still running %d ms after the application quit",
+                len(self._tasks),
+                self.shutdown_timeout_ms,
+            )
+
+
+def application_pool() -> TaskPool:
+    """Answer the task pool of the application, created on first use."""
+    global _application_pool
+    if _application_pool is None:
+        app = QCoreApplication.instance()
+        _application_pool = TaskPool(parent=app)
+        app.aboutToQuit.connect(_application_pool._application_quitting)
+    return _application_pool
@@ -1,22 +1,27 @@
-import time
-from threading import Thread
+import asyncio
+
+from PySide6 import QtAsyncio
+
+from threads import task_group
+from threads.task_group import TaskGroup
 
 
 def task_a():
     for i in range(0, 20):
-        time.sleep(0.5)
+        # stops early when another task of the group fails
+        task_group.sleep(0.5)
         print(i)
 
 
 def task_b():
     for i in ["a", "b", "c", "d", "e", "f", "g", "h", "i", "j"]:
-        time.sleep(0.5)
+        task_group.sleep(0.5)
         print(i)
 
 
 def task_c():
     for i in ["k", "l", "m", "n", "o", "p", "q", "r", "s", "t"]:
-        time.sleep(0.5)
+        task_group.sleep(0.5)
         print(i)
 
 
@@ -26,14 +31,50 @@ def main_sequential():
 
 
 def main_threaded():
-    thread_a = Thread(target=task_a)
-    thread_a.start()
-    thread_c = Thread(target=task_c)
-    thread_c.start()
+    # the group waits for both threads, and raises if one fails
+    with TaskGroup() as group:
+        group.start(task_a)
+        group.start(task_c)
+        task_b()
+    print(group.report())
 
-    task_b()
-    thread_a.join()
-    thread_c.join()
+
+# the same tasks as coroutines: they wait without blocking the thread, so
+# they can take turns on one thread, the GUI thread included
+
+
+async def task_a_async():
+    for i in range(0, 20):
+        await asyncio.sleep(0.5)
+        print(i)
+
+
+async def task_b_async():
+    for i in ["a", "b", "c", "d", "e", "f", "g", "h", "i", "j"]:
+        await asyncio.sleep(0.5)
+        print(i)
+
+
+async def task_c_async():
+    for i in ["k", "l", "m", "n", "o", "p", "q", "r", "s", "t"]:
+        await asyncio.sleep(0.5)
+        print(i)
+
+
+async def run_concurrently():
+    async with asyncio.TaskGroup() as group:
+        group.create_task(task_a_async())
+        group.create_task(task_c_async())
+        await task_b_async()
+
+
+def main_async():
+    asyncio.run(run_concurrently())
+
+
+def main_qt_async():
+    # on the Qt event loop, as a GUI would
+    QtAsyncio.run(run_concurrently(), keep_running=False)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,8 @@
+import pytest
+from PySide6.QtCore import QCoreApplication
+
+
+@pytest.fixture(scope="session")
+def qapp_cls():
+    # the pools need an event loop, not widgets
+    return QCoreApplication
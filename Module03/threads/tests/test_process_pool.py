@@ -0,0 +1,89 @@
+import time
+
+import pytest
+
+from threads import process_pool
+from threads.loan_schedules import amortisation_schedule, total_interest
+from threads.process_pool import ProcessPool
+
+
+def flood_progress(reports):
+    # past the throttle, more than the pipe of the progress queue holds
+    for n in range(reports):
+        process_pool._progress._emit(n % 101)
+    return reports
+
+
+@pytest.fixture
+def pool():
+    pool = ProcessPool(2)
+    yield pool
+    pool.shutdown()
+
+
+def test_job_reports_progress_and_result(qtbot, pool):
+    job = pool.submit(total_interest, 0, 10)
+    progress = []
+    job.progress.connect(progress.append)
+
+    with qtbot.waitSignal(job.finished, timeout=30_000) as blocker:
+        pass
+
+    assert blocker.args == [pytest.approx(total_interest(0, 10, lambda _: None))]
+    assert progress[-1] == 100
+    assert pool.active_count() == 0
+
+
+def test_job_error_is_reported(qtbot, pool):
+    job = pool.submit(amortisation_schedule, 1_000, 0.0, 0)
+
+    with qtbot.waitSignal(job.failed, timeout=30_000) as blocker:
+        pass
+
+    assert "division by zero" in blocker.args[0]
+
+
+def test_cancelled_waiting_job_never_runs(qtbot):
+    pool = ProcessPool(1)
+    running = pool.submit(time.sleep, 0.5)
+    waiting = pool.submit(total_interest, 0, 1)
+    finished = []
+    waiting.finished.connect(finished.append)
+
+    with qtbot.waitSignal(waiting.cancelled, timeout=1_000):
+        pool.cancel(waiting)
+
+    assert pool.active_count() == 1
+    with qtbot.waitSignal(running.finished, timeout=30_000):
+        pass
+    pool.shutdown()
+    assert finished == []
+
+
+def test_shutdown_waits_for_running_jobs():
+    pool = ProcessPool(1)
+    pool.submit(total_interest, 0, 2_000)
+    time.sleep(0.5)  # running
+
+    assert pool.shutdown()
+
+    assert pool.active_count() == 0
+
+
+def test_shutdown_reads_the_progress_of_the_jobs_it_waits_for():
+    pool = ProcessPool(1)
+    pool.submit(flood_progress, 100_000)
+    time.sleep(0.5)  # running, blocked on the full queue
+
+    assert pool.shutdown(timeout_ms=10_000)
+
+
+def test_shutdown_with_timeout_terminates_jobs_running_on():
+    pool = ProcessPool(1)
+    pool.submit(time.sleep, 60)
+    time.sleep(0.5)  # running
+
+    start = time.perf_counter()
+    assert not pool.shutdown(timeout_ms=200)
+
+    assert time.perf_counter() - start < 10
@@ -0,0 +1,54 @@
+import time
+
+from threads.progress_throttle import ProgressThrottle
+
+
+class Emitted:
+    def __init__(self):
+        self.values = []
+
+    def emit(self, value):
+        self.values.append(value)
+
+
+def test_first_report_is_emitted_at_once():
+    signal = Emitted()
+    throttle = ProgressThrottle(signal)
+
+    throttle.report(1)
+
+    assert signal.values == [1]
+
+
+def test_reports_in_between_are_held_back_and_flushed_last():
+    signal = Emitted()
+    throttle = ProgressThrottle(signal, max_rate=0.001)
+
+    for value in range(1, 101):
+        throttle.report(value)
+    throttle.flush()
+
+    assert signal.values == [1, 100]
+
+
+def test_flush_emits_nothing_when_nothing_is_held_back():
+    signal = Emitted()
+    throttle = ProgressThrottle(signal)
+
+    throttle.flush()
+    throttle.report(1)
+    throttle.flush()
+
+    assert signal.values == [1]
+
+
+def test_reports_are_emitted_again_after_the_interval():
+    signal = Emitted()
+    throttle = ProgressThrottle(signal, max_rate=100)
+
+    throttle.report(1)
+    throttle.report(2)
+    time.sleep(0.02)
+    throttle.report(3)
+
+    assert signal.values == [1, 3]
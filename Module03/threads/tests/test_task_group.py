@@ -0,0 +1,106 @@
+import threading
+
+import pytest
+
+from threads import task_group
+from threads.task_group import QtTaskGroup, TaskGroup, check_cancelled
+from threads.task_pool import Cancelled
+
+
+def answer(value):
+    return value
+
+
+def fail_soon(message):
+    task_group.sleep(0.02)
+    raise ValueError(message)
+
+
+def wait_until_cancelled():
+    while True:
+        task_group.sleep(0.01)
+
+
+def test_group_ends_when_all_tasks_have_finished():
+    with TaskGroup() as group:
+        a = group.start(answer, 1, name="a")
+        b = group.start(answer, 2)
+
+    assert (a.name, a.outcome, a.result) == ("a", "finished", 1)
+    assert (b.name, b.outcome, b.result) == ("answer", "finished", 2)
+    assert "a" in group.report()
+
+
+def test_first_error_is_raised_and_the_others_are_cancelled():
+    started = threading.Event()
+
+    def fail_later_when_cancelled():
+        started.set()
+        try:
+            wait_until_cancelled()
+        except Cancelled:
+            raise RuntimeError("second")
+
+    with pytest.raises(ValueError, match="first"):
+        with TaskGroup() as group:
+            sibling = group.start(wait_until_cancelled)
+            late = group.start(fail_later_when_cancelled)
+            started.wait(5)
+            failing = group.start(fail_soon, "first")
+
+    assert failing.outcome == "failed"
+    assert sibling.outcome == "cancelled"
+    assert late.outcome == "failed"
+    assert group.token.is_cancelled()
+
+
+def test_error_of_the_body_wins_and_cancels_the_tasks():
+    with pytest.raises(KeyError):
+        with TaskGroup() as group:
+            task = group.start(wait_until_cancelled)
+            raise KeyError("body")
+
+    assert task.outcome == "cancelled"
+
+
+def test_closed_group_takes_no_more_tasks():
+    group = TaskGroup()
+    group.join()
+
+    with pytest.raises(RuntimeError):
+        group.start(answer, 1)
+
+
+def test_cancel_checks_raise_only_in_a_cancelled_group():
+    check_cancelled()
+    task_group.sleep(0)
+
+    group = TaskGroup()
+    group.cancel()
+    task = group.start(answer, 1)
+    group.join()
+
+    assert task.outcome == "cancelled"
+
+
+def test_qt_group_reports_the_first_error(qtbot):
+    group = QtTaskGroup()
+    group.start(wait_until_cancelled)
+    group.start(fail_soon, "broken")
+
+    with qtbot.waitSignal(group.failed, timeout=5_000) as blocker:
+        group.close()
+
+    assert blocker.args == ["broken"]
+    assert [task.outcome for task in group.group.tasks] == ["cancelled", "failed"]
+
+
+def test_qt_group_reports_the_finished_tasks(qtbot):
+    group = QtTaskGroup()
+    group.start(answer, 1)
+    group.start(answer, 2)
+
+    with qtbot.waitSignal(group.finished, timeout=5_000) as blocker:
+        group.close()
+
+    assert [task.result for task in blocker.args[0]] == [1, 2]
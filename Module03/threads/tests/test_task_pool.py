@@ -0,0 +1,182 @@
+import random
+import threading
+import time
+
+from PySide6.QtCore import QObject
+
+from threads import task_pool
+from threads.counter import count
+from threads.task_pool import Task, TaskPool, application_pool
+
+TASKS = 1_000
+
+
+def identity(task, n):
+    return n
+
+
+def fail(task):
+    raise ValueError("no good")
+
+
+def busy(task):
+    # until cancelled, checking often like a well-behaved task
+    while True:
+        task.check_cancelled()
+        time.sleep(0.001)
+
+
+class Ends(QObject):
+    """Record how each task ended, in the thread of the test."""
+
+    def __init__(self):
+        super().__init__()
+        self.results = []
+        self.progress = []
+        self.errors = []
+        self.cancelled = 0
+
+    def watch(self, task):
+        task.signals.progress.connect(self.reported)
+        task.signals.finished.connect(self.finished)
+        task.signals.failed.connect(self.failed)
+        task.signals.cancelled.connect(self.was_cancelled)
+        return task
+
+    def reported(self, percent):
+        self.progress.append(percent)
+
+    def finished(self, result):
+        self.results.append(result)
+
+    def failed(self, message):
+        self.errors.append(message)
+
+    def was_cancelled(self):
+        self.cancelled += 1
+
+    def total(self):
+        return len(self.results) + len(self.errors) + self.cancelled
+
+
+def test_task_reports_progress_and_result(qtbot):
+    pool = TaskPool(2)
+    ends = Ends()
+    pool.start(ends.watch(Task(count, 10, 0)))
+
+    assert pool.wait(5_000)
+
+    assert ends.results == [10]
+    assert ends.progress[0] == 0
+    assert ends.progress[-1] == 100
+    pool.shutdown()
+
+
+def test_task_error_is_reported(qtbot):
+    pool = TaskPool(2)
+    ends = Ends()
+    pool.start(ends.watch(Task(fail)))
+
+    assert pool.wait(5_000)
+
+    assert ends.errors == ["no good"]
+    assert ends.results == []
+    pool.shutdown()
+
+
+def test_waiting_tasks_start_by_priority(qtbot):
+    pool = TaskPool(1)
+    release = threading.Event()
+    order = []
+    pool.submit(lambda task: release.wait(5))
+    for name, priority in [("low", 0), ("high", 5), ("middle", 2)]:
+        pool.submit(lambda task, name=name: order.append(name), priority=priority)
+
+    release.set()
+    assert pool.wait(5_000)
+
+    assert order == ["high", "middle", "low"]
+    pool.shutdown()
+
+
+def test_cancelled_waiting_task_never_runs(qtbot):
+    pool = TaskPool(1)
+    ends = Ends()
+    running = pool.submit(busy)
+    waiting = ends.watch(Task(identity, 1))
+    pool.start(waiting)
+
+    pool.cancel(waiting)
+
+    assert ends.cancelled == 1
+    assert pool.tasks() == [running]
+    pool.shutdown()
+    assert ends.results == []
+
+
+def test_pool_tells_each_task_done_then_idle(qtbot):
+    pool = TaskPool(2)
+    done = []
+    pool.task_done.connect(done.append)
+    tasks = [pool.submit(identity, n) for n in range(3)]
+
+    with qtbot.waitSignal(pool.idle, timeout=5_000):
+        pass
+
+    assert set(done) == set(tasks)
+    assert pool.active_count() == 0
+    pool.shutdown()
+
+
+def test_every_task_ends_exactly_once_when_some_are_cancelled(qtbot):
+    pool = TaskPool(4)
+    ends = Ends()
+    for n in range(TASKS):
+        # connected before it starts, a tiny task is over at once
+        task = ends.watch(Task(identity, n))
+        pool.start(task, random.randint(-5, 5))
+        if n % 3 == 0:
+            pool.cancel(task)
+
+    assert pool.wait(10_000)
+
+    assert ends.total() == TASKS
+    assert ends.errors == []
+    assert len(set(ends.results)) == len(ends.results)
+    assert all(n % 3 == 0 or n in ends.results for n in range(TASKS))
+    assert pool.active_count() == 0
+    pool.shutdown()
+
+
+def test_shutdown_stops_busy_tasks_and_takes_no_more(qtbot):
+    pool = TaskPool(8)
+    ends = Ends()
+    for _ in range(TASKS // 10):
+        pool.start(ends.watch(Task(busy)))
+    time.sleep(0.05)  # some of them running
+
+    assert pool.shutdown(timeout_ms=5_000)
+
+    assert ends.cancelled == TASKS // 10
+    assert pool.active_count() == 0
+    try:
+        pool.submit(identity, 0)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("the pool took a task after shutdown")
+
+
+def test_application_pool_stops_busy_tasks_when_quitting(qapp, monkeypatch):
+    monkeypatch.setattr(task_pool, "_application_pool", None)
+    pool = application_pool()
+    assert application_pool() is pool
+    for _ in range(TASKS // 10):
+        pool.submit(busy)
+
+    start = time.perf_counter()
+    qapp.aboutToQuit.emit()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    assert pool.active_count() == 0
+    assert elapsed_ms < TaskPool.shutdown_timeout_ms
@@ -0,0 +1,61 @@
+"""Compare thousands of concurrent waits (like file or database calls) done
+by threads and by coroutines, on asyncio's own event loop and on Qt's.
+Run with: uv run python waits_benchmark.py [WAITS] [SECONDS]"""
+
+import asyncio
+import resource
+import sys
+import threading
+import time
+
+from PySide6 import QtAsyncio
+from PySide6.QtCore import QCoreApplication
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+
+
+def with_threads():
+    threads = [
+        threading.Thread(target=time.sleep, args=(seconds,)) for _ in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+async def wait_all():
+    await asyncio.gather(*(asyncio.sleep(seconds) for _ in range(count)))
+
+
+def with_asyncio():
+    asyncio.run(wait_all())
+
+
+def with_qt_asyncio():
+    QtAsyncio.run(wait_all(), keep_running=False)
+
+
+def max_rss_mib():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure(name, action):
+    rss = max_rss_mib()
+    start = time.perf_counter()
+    action()
+    elapsed = time.perf_counter() - start
+    print(
+        f"{name:<12} {elapsed:6.2f} s  "
+        f"overhead {(elapsed - seconds) / count * 1e6:7.1f} µs per wait  "
+        f"memory +{max_rss_mib() - rss:6.1f} MiB"
+    )
+
+
+app = QCoreApplication(sys.argv)
+print(f"{count} waits of {seconds} s")
+# the threads last, their stacks grow the process the most
+measure("asyncio", with_asyncio)
+measure("QtAsyncio", with_qt_asyncio)
+measure("threads", with_threads)
@@ -0,0 +1,58 @@
+"""Measure bulk edits and deletes of a large selection in the issues window.
+Run with: uv run python bulk_edit_benchmark.py [ISSUES] [SELECTED]"""
+
+import os
+import sys
+import time
+
+from PySide6.QtCore import QItemSelection, QItemSelectionModel
+from PySide6.QtWidgets import QApplication
+
+from issue_tracker.issue import Status
+from issue_tracker.issues_table_window import IssuesTableWindow
+from issue_tracker.sample_issues import get_samples
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+selected = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+app = QApplication(sys.argv)
+
+issues = [issue for _ in range(count // 12) for issue in get_samples()]
+window = IssuesTableWindow(issues=issues)
+window.show()
+table = window.issues_table
+model = table.model()
+table.sortByColumn(0, table.horizontalHeader().sortIndicatorOrder())
+
+
+def measure(name, action):
+    app.processEvents()
+    start = time.perf_counter()
+    action()
+    app.processEvents()
+    print(f"{name:<22} {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+
+def select_block():
+    # a shift-click selection of the title sorted table: the issues are
+    # scattered all over the unsorted model
+    first = (model.rowCount() - selected) // 2
+    table.selectionModel().select(
+        QItemSelection(model.index(first, 0), model.index(first + selected - 1, 3)),
+        QItemSelectionModel.SelectionFlag.Select,
+    )
+
+
+def choose_closed():
+    window.status_combo.setCurrentIndex(window.status_combo.findData(Status.CLOSED))
+
+
+print(f"{len(issues)} issues, {selected} selected")
+measure("select", select_block)
+measure("read selection", window._get_selected_rows)
+choose_closed()
+measure("bulk edit", window.save_button.click)
+measure("undo edit", window.undo_stack().undo)
+measure("redo edit", window.undo_stack().redo)
+measure("bulk delete", window.delete_issue_button.click)
+measure("undo delete", window.undo_stack().undo)
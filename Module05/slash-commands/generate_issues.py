@@ -0,0 +1,40 @@
+"""Fill a database with generated issues for trying the tracker on a large backlog.
+Run with: uv run python generate_issues.py [COUNT] [DATABASE]"""
+
+import itertools
+import random
+import sys
+import time
+
+from issue_tracker.issue import Issue, Priority, Status
+from issue_tracker.issue_db import IssueDB
+from issue_tracker.sample_issues import get_samples
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+path = sys.argv[2] if len(sys.argv) > 2 else "issues.db"
+
+samples = get_samples()
+names = sorted({s.assigned_to for s in samples})
+rng = random.Random(0)
+
+
+def generate():
+    for n, sample in zip(range(count), itertools.cycle(samples)):
+        yield Issue(
+            f"{sample.title} #{n}",
+            rng.choice(list(Status)),
+            rng.choice(list(Priority)),
+            rng.choice(names),
+            sample.notes,
+        )
+
+
+start = time.perf_counter()
+with IssueDB(path) as db:
+    saved = db.save_all(generate())
+print(f"Inserted {saved} issues into {path} in {time.perf_counter() - start:.1f}s")
+
+start = time.perf_counter()
+with IssueDB(path) as db:
+    total = sum(1 for _ in db.iter_all())
+print(f"Read {total} issues in {time.perf_counter() - start:.1f}s")
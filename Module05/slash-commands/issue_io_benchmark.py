@@ -0,0 +1,73 @@
+"""Measure streaming issues to and from CSV and JSON Lines files, and
+validating them batch by batch as an import does.
+Run with: uv run python issue_io_benchmark.py [ISSUES]"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from itertools import islice
+
+from issue_tracker.issue_io import read_issues, write_issues
+from issue_tracker.issue_transfer import IssueImporter
+from issue_tracker.sample_issues import get_samples
+from issue_tracker.validators import (
+    ISSUE_RULES,
+    ValidationReport,
+    check_issues,
+    check_values,
+)
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+samples = get_samples()
+
+
+def issues():
+    # generated on the fly, like rows streamed from the database
+    for number in range(count):
+        yield samples[number % len(samples)]
+
+
+def measure(name, action):
+    start = time.perf_counter()
+    action()
+    elapsed = time.perf_counter() - start
+    # once more for the memory, tracing slows it down
+    tracemalloc.start()
+    action()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{name:<14} {elapsed:7.2f} s  peak {peak / 2**20:6.1f} MiB")
+
+
+def read(path):
+    for _ in read_issues(path):
+        pass
+
+
+print(f"{count} issues")
+with tempfile.TemporaryDirectory() as directory:
+    for extension in (".csv", ".jsonl"):
+        path = os.path.join(directory, "issues" + extension)
+        measure(f"write {extension}", lambda: write_issues(path, issues()))
+        print(f"{'':<14} {os.path.getsize(path) / 2**20:7.1f} MiB file")
+        measure(f"read {extension}", lambda: read(path))
+
+
+def validate():
+    report = ValidationReport()
+    generated = issues()
+    while batch := list(islice(generated, IssueImporter.batch_size)):
+        report.add(check_issues(batch))
+    return report
+
+
+def validate_one_by_one():
+    for issue in issues():
+        check_values({name: getattr(issue, name) for name in ISSUE_RULES})
+
+
+measure("validate", validate)
+measure("one by one", validate_one_by_one)
+print(validate().format_timings())
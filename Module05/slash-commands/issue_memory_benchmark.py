@@ -0,0 +1,78 @@
+"""Compare the memory used by 1M issues held in different ways.
+Run with: uv run python issue_memory_benchmark.py [COUNT]"""
+
+import gc
+import itertools
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+from issue_tracker.issue import Issue, Priority, Status
+from issue_tracker.issue_store import IssueStore
+from issue_tracker.sample_issues import get_samples
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+
+@dataclass()
+class DictIssue:
+    """Issue as it was before it got __slots__."""
+
+    title: str
+    status: Status
+    priority: Priority
+    assigned_to: str
+    notes: str
+    id: int = None
+
+
+def fields():
+    # assignee names are read from a file or database, so they are separate
+    # string objects unless something interns them
+    for n, sample in zip(range(count), itertools.cycle(get_samples())):
+        yield (
+            f"{sample.title} #{n}",
+            sample.status,
+            sample.priority,
+            "".join(sample.assigned_to),
+            sample.notes,
+            n + 1,
+        )
+
+
+def as_dict_issues():
+    return [DictIssue(*f) for f in fields()]
+
+
+def as_issues():
+    return [Issue(*f) for f in fields()]
+
+
+def as_store():
+    return IssueStore(Issue(*f) for f in fields())
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size, elapsed
+
+
+print(f"{count} issues")
+for name, build in [
+    ("Issue with __dict__", as_dict_issues),
+    ("Issue with __slots__", as_issues),
+    ("IssueStore", as_store),
+]:
+    size, elapsed = measure(build)
+    print(
+        f"{name:22} {size / 2**20:8.1f} MiB {size / count:6.0f} B/issue"
+        f" {elapsed:6.1f} s"
+    )
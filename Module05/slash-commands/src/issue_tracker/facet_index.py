@@ -0,0 +1,75 @@
+"""Counts of issues by status, priority and assignee."""
+
+from collections import Counter
+from typing import Iterable
+
+from issue_tracker.issue import Issue
+
+FACETS = ("status", "priority", "assigned_to")
+
+
+def facet_values(issue: Issue) -> tuple:
+    return (issue.status, issue.priority, issue.assigned_to or "")
+
+
+class FacetIndex:
+    """I count the issues having each status, priority and assignee.
+
+    Counting all issues happens once; afterwards every created, changed or
+    deleted issue adjusts the counts of its own values only.  To know which
+    counts a changed issue had contributed to, I remember the values each
+    issue had when I last saw it."""
+
+    def __init__(self, issues: Iterable[Issue] = ()):
+        self._values: dict[int, tuple] = {
+            id(issue): facet_values(issue) for issue in issues
+        }
+        self._counts = {
+            facet: Counter(values[i] for values in self._values.values())
+            for i, facet in enumerate(FACETS)
+        }
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def counts(self, facet: str) -> dict:
+        return dict(self._counts[facet])
+
+    def count(self, facet: str, value) -> int:
+        return self._counts[facet][value]
+
+    def add(self, issue: Issue) -> list[tuple[str, object]]:
+        """Count a new issue.  Answer the (facet, value) pairs that changed."""
+        values = facet_values(issue)
+        self._values[id(issue)] = values
+        return self._adjust(values, 1)
+
+    def remove(self, issue: Issue) -> list[tuple[str, object]]:
+        """Stop counting a deleted issue."""
+        return self._adjust(self._values.pop(id(issue)), -1)
+
+    def update(self, issue: Issue) -> list[tuple[str, object]]:
+        """Move a changed issue to the counts of its new values."""
+        old = self._values[id(issue)]
+        new = facet_values(issue)
+        if new == old:
+            return []
+        self._values[id(issue)] = new
+        changed = []
+        for facet, old_value, new_value in zip(FACETS, old, new):
+            if old_value != new_value:
+                counts = self._counts[facet]
+                counts[new_value] += 1
+                counts[old_value] -= 1
+                if counts[old_value] == 0:
+                    del counts[old_value]
+                changed += [(facet, old_value), (facet, new_value)]
+        return changed
+
+    def _adjust(self, values: tuple, delta: int) -> list[tuple[str, object]]:
+        for facet, value in zip(FACETS, values):
+            counts = self._counts[facet]
+            counts[value] += delta
+            if counts[value] == 0:
+                del counts[value]
+        return list(zip(FACETS, values))
@@ -0,0 +1,145 @@
+from bisect import bisect_left
+
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import QTreeWidget, QTreeWidgetItem
+
+from issue_tracker.facet_index import FACETS, FacetIndex
+from issue_tracker.issue import Priority, Status
+from issue_tracker.issue_table_model import IssueTableModel
+
+FACET_COLUMNS = {
+    "status": IssueTableModel.STATUS_COLUMN,
+    "priority": IssueTableModel.PRIORITY_COLUMN,
+    "assigned_to": IssueTableModel.ASSIGNED_TO_COLUMN,
+}
+
+
+class FacetPanel(QTreeWidget):
+    """Shows how many issues of an `IssueTableModel` have each status,
+    priority and assignee.  The counts follow the model's change signals and
+    only the items whose count changed are updated."""
+
+    # a count was clicked: the issue model column and the value counted
+    value_activated = Signal(int, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._model = None
+        self._index = FacetIndex()
+        self._items: dict[tuple[str, object], QTreeWidgetItem] = {}
+
+        self.setColumnCount(2)
+        self.setHeaderLabels([self.tr("Facet"), self.tr("Issues")])
+        self.setRootIsDecorated(True)
+        self._facet_items = {}
+        for facet, title in zip(
+            FACETS, [self.tr("Status"), self.tr("Priority"), self.tr("Assigned to")]
+        ):
+            item = QTreeWidgetItem(self, [title])
+            item.setExpanded(True)
+            self._facet_items[facet] = item
+        self.itemClicked.connect(self._item_clicked)
+
+    def facet_index(self) -> FacetIndex:
+        return self._index
+
+    def set_model(self, model: IssueTableModel) -> None:
+        if self._model is not None:
+            self._model.issues_edited.disconnect(self._issues_edited)
+            self._model.issues_inserted.disconnect(self._issues_inserted)
+            self._model.issues_removed.disconnect(self._issues_removed)
+            self._model.rowsInserted.disconnect(self._rows_inserted)
+            self._model.rowsAboutToBeRemoved.disconnect(self._rows_about_to_be_removed)
+            self._model.modelReset.disconnect(self._rebuild)
+        self._model = model
+        model.issues_edited.connect(self._issues_edited)
+        model.issues_inserted.connect(self._issues_inserted)
+        model.issues_removed.connect(self._issues_removed)
+        model.rowsInserted.connect(self._rows_inserted)
+        model.rowsAboutToBeRemoved.connect(self._rows_about_to_be_removed)
+        model.modelReset.connect(self._rebuild)
+        self._rebuild()
+
+    def _rebuild(self):
+        self._index = FacetIndex(self._model.issues())
+        for facet_item in self._facet_items.values():
+            facet_item.takeChildren()
+        self._items.clear()
+        # statuses and priorities are always listed, assignees when counted
+        for facet, values in [("status", Status), ("priority", Priority)]:
+            for value in values:
+                self._update_item(facet, value)
+        for name in self._index.counts("assigned_to"):
+            self._update_item("assigned_to", name)
+        self.resizeColumnToContents(0)
+
+    def _issues_edited(self, rows, fields):
+        if fields is not None and fields.isdisjoint(FACETS):
+            return
+        self._update_items(
+            pair for row in rows for pair in self._index.update(self._model.issue(row))
+        )
+
+    def _issues_inserted(self, rows):
+        self._update_items(
+            pair for row in rows for pair in self._index.add(self._model.issue(row))
+        )
+
+    def _issues_removed(self, rows, issues):
+        self._update_items(
+            pair for issue in issues for pair in self._index.remove(issue)
+        )
+
+    def _rows_inserted(self, parent, first, last):
+        self._issues_inserted(range(first, last + 1))
+
+    def _rows_about_to_be_removed(self, parent, first, last):
+        self._issues_removed(
+            range(first, last + 1), self._model.issues()[first : last + 1]
+        )
+
+    def _update_items(self, changed):
+        # every item is updated once, however many issues changed it
+        for facet, value in set(changed):
+            self._update_item(facet, value)
+
+    def _update_item(self, facet, value):
+        count = self._index.count(facet, value)
+        item = self._items.get((facet, value))
+        if item is None:
+            if count == 0 and facet == "assigned_to":
+                return
+            item = self._new_item(facet, value)
+        elif count == 0 and facet == "assigned_to":
+            self._facet_items[facet].removeChild(item)
+            del self._items[(facet, value)]
+            return
+        item.setText(1, str(count))
+
+    def _new_item(self, facet, value):
+        parent = self._facet_items[facet]
+        if facet == "assigned_to":
+            text = value or self.tr("(nobody)")
+            names = [
+                parent.child(i).data(0, Qt.ItemDataRole.UserRole)
+                for i in range(parent.childCount())
+            ]
+            position = bisect_left(names, value)
+        else:
+            text = value.name
+            position = parent.childCount()
+        item = QTreeWidgetItem([text])
+        item.setData(0, Qt.ItemDataRole.UserRole, value)
+        item.setTextAlignment(1, Qt.AlignmentFlag.AlignRight)
+        parent.insertChild(position, item)
+        self._items[(facet, value)] = item
+        return item
+
+    def _item_clicked(self, item, column):
+        parent = item.parent()
+        if parent is None:
+            return
+        facet = next(f for f, i in self._facet_items.items() if i is parent)
+        self.value_activated.emit(
+            FACET_COLUMNS[facet], item.data(0, Qt.ItemDataRole.UserRole)
+        )
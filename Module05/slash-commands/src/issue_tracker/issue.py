@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
+from typing import Any, Optional
 
 
 class Status(Enum):
@@ -15,13 +16,28 @@ class Priority(Enum):
     URGENT = 4
 
 
-@dataclass()
+@dataclass(slots=True)
 class Issue:
     title: str
     status: Status
     priority: Priority
     assigned_to: str
     notes: str
+    id: Optional[int] = None
+
+
+@dataclass(frozen=True, slots=True)
+class Change:
+    """`author` set the `field` of the issue `issue_id` to `value` at `time`
+    (seconds since the epoch).  Changes are numbered by `id` in the order
+    they were made."""
+
+    id: int
+    issue_id: int
+    time: float
+    author: str
+    field: str
+    value: Any
 
 
 if __name__ == "__main__":
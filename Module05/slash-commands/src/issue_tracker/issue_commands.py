@@ -0,0 +1,175 @@
+"""Undoable changes to the issues of an `IssueTableModel`.
+
+The commands are meant for a `QUndoStack`.  An edit only remembers the
+fields it changed, old and new value, so a long history costs little more
+than the changed values themselves.  Several commands can be undone as one
+step with `QUndoStack.beginMacro()`/`endMacro()`.
+
+The bulk commands (`EditIssuesCommand`, `RemoveIssuesCommand`) change many
+issues as one step and one model transaction, however scattered the rows.
+
+Commands refer to issues by row.  The stack undoes and redoes them strictly
+in order, so when a command runs the rows are the same as when it was
+pushed, as long as every change to the model goes through the stack.
+"""
+
+from typing import Any
+
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtGui import QUndoCommand
+
+from issue_tracker.issue import Issue
+from issue_tracker.issue_table_model import IssueTableModel
+
+ISSUE_FIELDS = ("title", "status", "priority", "assigned_to", "notes")
+
+
+def _tr(text: str) -> str:
+    return QCoreApplication.translate("IssueCommands", text)
+
+
+class EditIssueCommand(QUndoCommand):
+    """Set some fields of the issue at `row`.  Consecutive edits of the same
+    fields of the same issue merge into one command."""
+
+    ID = 1
+
+    def __init__(
+        self, model: IssueTableModel, row: int, values: dict[str, Any], parent=None
+    ):
+        super().__init__(parent)
+        self._model = model
+        self._row = row
+        issue = model.issue(row)
+        # field -> (old value, new value), unchanged fields are not kept
+        self._changes = {
+            field: (getattr(issue, field), value)
+            for field, value in values.items()
+            if getattr(issue, field) != value
+        }
+        self.setText(_tr("Edit “{0}”").format(issue.title))
+
+    def is_empty(self) -> bool:
+        return not self._changes
+
+    def redo(self):
+        self._apply(1)
+
+    def undo(self):
+        self._apply(0)
+
+    def _apply(self, which: int) -> None:
+        issue = self._model.issue(self._row)
+        for field, values in self._changes.items():
+            setattr(issue, field, values[which])
+        self._model.issue_changed(self._row, self._changes)
+
+    def id(self):
+        return self.ID
+
+    def mergeWith(self, other) -> bool:
+        if (
+            other._model is not self._model
+            or other._row != self._row
+            or other._changes.keys() != self._changes.keys()
+        ):
+            return False
+        self._changes = {
+            field: (old, other._changes[field][1])
+            for field, (old, _) in self._changes.items()
+            if old != other._changes[field][1]
+        }
+        # an edit that was taken back entirely can be dropped
+        self.setObsolete(not self._changes)
+        return True
+
+
+class AddIssueCommand(QUndoCommand):
+    def __init__(self, model: IssueTableModel, issue: Issue, parent=None):
+        super().__init__(parent)
+        self._model = model
+        self._issue = issue
+        self._row = model.rowCount()
+        self.setText(_tr("Add “{0}”").format(issue.title))
+
+    def row(self) -> int:
+        return self._row
+
+    def redo(self):
+        self._model.insert_issue(self._row, self._issue)
+
+    def undo(self):
+        self._model.remove_issue(self._row)
+
+
+class RemoveIssueCommand(QUndoCommand):
+    def __init__(self, model: IssueTableModel, row: int, parent=None):
+        super().__init__(parent)
+        self._model = model
+        self._row = row
+        self._issue = model.issue(row)
+        self.setText(_tr("Delete “{0}”").format(self._issue.title))
+
+    def redo(self):
+        self._model.remove_issue(self._row)
+
+    def undo(self):
+        self._model.insert_issue(self._row, self._issue)
+
+
+class EditIssuesCommand(QUndoCommand):
+    """Set the same fields of all the issues at `rows` (ascending).  Only the
+    issues that change are kept, with their old values."""
+
+    def __init__(
+        self,
+        model: IssueTableModel,
+        rows: list[int],
+        values: dict[str, Any],
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._model = model
+        self._fields = tuple(values)
+        self._values = tuple(values.values())
+        self._rows = []
+        self._old_values = []
+        for row in rows:
+            issue = model.issue(row)
+            old = tuple(getattr(issue, field) for field in self._fields)
+            if old != self._values:
+                self._rows.append(row)
+                self._old_values.append(old)
+        self.setText(_tr("Edit {0} issues").format(len(self._rows)))
+
+    def is_empty(self) -> bool:
+        return not self._rows
+
+    def redo(self):
+        for row in self._rows:
+            issue = self._model.issue(row)
+            for field, value in zip(self._fields, self._values):
+                setattr(issue, field, value)
+        self._model.issues_changed(self._rows, self._fields)
+
+    def undo(self):
+        for row, values in zip(self._rows, self._old_values):
+            issue = self._model.issue(row)
+            for field, value in zip(self._fields, values):
+                setattr(issue, field, value)
+        self._model.issues_changed(self._rows, self._fields)
+
+
+class RemoveIssuesCommand(QUndoCommand):
+    def __init__(self, model: IssueTableModel, rows: list[int], parent=None):
+        super().__init__(parent)
+        self._model = model
+        self._rows = rows
+        self._issues = [model.issue(row) for row in rows]
+        self.setText(_tr("Delete {0} issues").format(len(rows)))
+
+    def redo(self):
+        self._model.remove_issues(self._rows)
+
+    def undo(self):
+        self._model.insert_issues(self._rows, self._issues)
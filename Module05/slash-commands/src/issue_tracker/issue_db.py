@@ -0,0 +1,375 @@
+"""SQLite persistence layer for the issue tracker (Peewee ORM)."""
+
+from typing import Iterable, Iterator, Optional
+
+from peewee import (
+    BareField,
+    CharField,
+    FloatField,
+    IntegerField,
+    Model,
+    SqliteDatabase,
+    TextField,
+    __exception_wrapper__,
+    fn,
+)
+from playhouse.sqlite_ext import AutoIncrementField
+
+from issue_tracker.issue import Change, Issue, Priority, Status
+
+_db = SqliteDatabase(None)  # initialized later via IssueDB
+_COLUMNS = ("title", "status", "priority", "assigned_to", "notes")
+
+
+class IssueRecord(Model):
+    """Peewee model — defines the issues table schema.  Status and priority
+    are stored as their enum values; the columns the table is filtered on
+    are indexed.  Ids are never reused (AUTOINCREMENT), so an id names one
+    issue for good, even after it is deleted."""
+
+    id = AutoIncrementField()
+    title = CharField()
+    status = IntegerField(index=True)
+    priority = IntegerField(index=True)
+    assigned_to = CharField(null=True, index=True)
+    notes = TextField(default="")
+
+    class Meta:
+        database = _db
+        table_name = "issues"
+
+
+class ChangeRecord(Model):
+    """The change history, appended to only.  A value is stored as in the
+    issues table; the index on (issue_id, id) finds the changes of an issue
+    in order however long the history."""
+
+    issue_id = IntegerField()
+    time = FloatField()
+    author = CharField()
+    field = CharField()
+    value = BareField(null=True)
+
+    class Meta:
+        database = _db
+        table_name = "changes"
+        indexes = ((("issue_id", "id"), False),)
+
+
+class IssueDB:
+    """Public persistence API. Translates between Issue and IssueRecord."""
+
+    # rows handed to SQLite at a time by save_all()
+    batch_size = 10_000
+
+    def __init__(self, db_path: str = "issues.db"):
+        self.path = db_path
+        _db.init(
+            db_path,
+            pragmas={"journal_mode": "wal", "synchronous": "normal"},
+        )
+        _db.connect()
+        _upgrade_issues_table()
+        # CREATE TABLE IF NOT EXISTS
+        _db.create_tables([IssueRecord, ChangeRecord], safe=True)
+
+    def close(self) -> None:
+        if not _db.is_closed():
+            _db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def save(self, issue: Issue) -> None:
+        """INSERT a new issue; assigns generated id back to issue.id."""
+        if issue.id is not None:
+            raise ValueError("Issue already has an id; use update() instead.")
+        record = IssueRecord.create(**_fields(issue))
+        issue.id = record.id
+
+    def save_all(self, issues: Iterable[Issue]) -> int:
+        """INSERT many new issues in one transaction, `batch_size` rows at a
+        time, and assign their ids.  Answer the number of issues saved.
+
+        The rows go through a single prepared statement (executemany) because
+        having Peewee generate the SQL for every row costs far more than
+        SQLite takes to insert it.  The transaction takes the write lock
+        right away, so no other connection saves issues between choosing
+        the ids and inserting them.  If the transaction fails, the issues
+        get their ids taken away again."""
+        sql = (
+            f"INSERT INTO {IssueRecord._meta.table_name} "
+            "(id, title, status, priority, assigned_to, notes) "
+            "VALUES (?, ?, ?, ?, ?, ?)"
+        )
+        saved = []
+        try:
+            with _db.atomic("IMMEDIATE"):
+                cursor = _db.cursor()
+                next_id = _next_id()
+                batch = []
+                for issue in issues:
+                    if issue.id is not None:
+                        raise ValueError(
+                            "Issue already has an id; use update() instead."
+                        )
+                    issue.id = next_id + len(saved)
+                    saved.append(issue)
+                    batch.append(_row(issue))
+                    if len(batch) == self.batch_size:
+                        _executemany(cursor, sql, batch)
+                        batch = []
+                if batch:
+                    _executemany(cursor, sql, batch)
+        except BaseException:
+            for issue in saved:
+                issue.id = None
+            raise
+        return len(saved)
+
+    def update(self, issue: Issue) -> None:
+        """UPDATE an existing issue. Raises ValueError if issue.id is None."""
+        if issue.id is None:
+            raise ValueError("Cannot update an issue that has no id (not yet saved).")
+        IssueRecord.update(**_fields(issue)).where(IssueRecord.id == issue.id).execute()
+
+    def update_all(
+        self, issues: Iterable[Issue], fields: Optional[Iterable[str]] = None
+    ) -> int:
+        """UPDATE many existing issues in one transaction, only the columns
+        named in `fields` if given.  Answer the number of issues updated."""
+        columns = [c for c in _COLUMNS if fields is None or c in fields]
+        sql = (
+            f"UPDATE {IssueRecord._meta.table_name} SET "
+            + ", ".join(f"{column} = ?" for column in columns)
+            + " WHERE id = ?"
+        )
+        return self._execute_many(
+            sql, issues, lambda i: (*map(_fields(i).__getitem__, columns), i.id)
+        )
+
+    def delete_all(self, issues: Iterable[Issue], forget_ids: bool = True) -> int:
+        """DELETE many issues in one transaction and reset their ids to None,
+        unless they are to keep them for `restore_all`.  Answer the number of
+        issues deleted."""
+        issues = list(issues)
+        count = self._execute_many(
+            f"DELETE FROM {IssueRecord._meta.table_name} WHERE id = ?",
+            issues,
+            lambda i: (i.id,),
+        )
+        if forget_ids:
+            for issue in issues:
+                issue.id = None
+        return count
+
+    def restore_all(self, issues: Iterable[Issue]) -> int:
+        """INSERT deleted issues again under the ids they had, e.g. when the
+        delete is undone, in one transaction.  Ids are never reused, so no
+        other issue has them.  Answer the number of issues restored."""
+        return self._execute_many(
+            f"INSERT INTO {IssueRecord._meta.table_name} "
+            "(id, title, status, priority, assigned_to, notes) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            issues,
+            _row,
+        )
+
+    def _execute_many(self, sql: str, issues: Iterable[Issue], parameters) -> int:
+        count = 0
+        with _db.atomic("IMMEDIATE"):
+            cursor = _db.cursor()
+            batch = []
+            for issue in issues:
+                if issue.id is None:
+                    raise ValueError("Issue has no id (not yet saved).")
+                batch.append(parameters(issue))
+                count += 1
+                if len(batch) == self.batch_size:
+                    _executemany(cursor, sql, batch)
+                    batch = []
+            if batch:
+                _executemany(cursor, sql, batch)
+        return count
+
+    def delete(self, issue: Issue) -> None:
+        """DELETE an issue by id; resets issue.id to None afterward."""
+        if issue.id is None:
+            raise ValueError("Cannot delete an issue that has no id (not yet saved).")
+        IssueRecord.delete().where(IssueRecord.id == issue.id).execute()
+        issue.id = None
+
+    def count(self) -> int:
+        return IssueRecord.select().count()
+
+    def stamp(self) -> tuple[int, int]:
+        """Answer the number of issues and the highest id.  Data derived from
+        the issues (like a search index) can be kept with the stamp; a
+        different stamp means issues were added or deleted since.  Changes
+        to existing issues do not change the stamp."""
+        count, max_id = IssueRecord.select(
+            fn.COUNT(IssueRecord.id), fn.MAX(IssueRecord.id)
+        ).scalar(as_tuple=True)
+        return count, max_id or 0
+
+    def iter_all(self) -> Iterator[Issue]:
+        """Yield all issues in id order.  Rows are read as plain tuples while
+        iterating, without model instances and without keeping them in a
+        result cache, so memory use does not grow with the table."""
+        query = IssueRecord.select(
+            IssueRecord.id,
+            IssueRecord.title,
+            IssueRecord.status,
+            IssueRecord.priority,
+            IssueRecord.assigned_to,
+            IssueRecord.notes,
+        ).order_by(IssueRecord.id)
+        statuses = {s.value: s for s in Status}
+        priorities = {p.value: p for p in Priority}
+        for (
+            id_,
+            title,
+            status,
+            priority,
+            assigned_to,
+            notes,
+        ) in query.tuples().iterator():
+            yield Issue(
+                title,
+                statuses[status],
+                priorities[priority],
+                assigned_to,
+                notes,
+                id_,
+            )
+
+    def get_all(self) -> list[Issue]:
+        """Return all issues in the order they were created."""
+        return list(self.iter_all())
+
+    def append_changes(self, changes: Iterable[Change]) -> int:
+        """INSERT `changes` into the history in one transaction.  Answer the
+        number of changes saved."""
+        sql = (
+            f"INSERT INTO {ChangeRecord._meta.table_name} "
+            "(id, issue_id, time, author, field, value) VALUES (?, ?, ?, ?, ?, ?)"
+        )
+        count = 0
+        with _db.atomic("IMMEDIATE"):
+            cursor = _db.cursor()
+            batch = []
+            for change in changes:
+                value = change.value
+                if isinstance(value, (Status, Priority)):
+                    value = value.value
+                batch.append(
+                    (
+                        change.id,
+                        change.issue_id,
+                        change.time,
+                        change.author,
+                        change.field,
+                        value,
+                    )
+                )
+                count += 1
+                if len(batch) == self.batch_size:
+                    _executemany(cursor, sql, batch)
+                    batch = []
+            if batch:
+                _executemany(cursor, sql, batch)
+        return count
+
+    def history(self, issue_id: int) -> list[Change]:
+        """Return the changes of the issue `issue_id`, oldest first."""
+        query = (
+            ChangeRecord.select(
+                ChangeRecord.id,
+                ChangeRecord.issue_id,
+                ChangeRecord.time,
+                ChangeRecord.author,
+                ChangeRecord.field,
+                ChangeRecord.value,
+            )
+            .where(ChangeRecord.issue_id == issue_id)
+            .order_by(ChangeRecord.id)
+        )
+        return [
+            Change(id_, issue_id_, time, author, field, _value(field, value))
+            for id_, issue_id_, time, author, field, value in query.tuples()
+        ]
+
+    def last_change_id(self) -> int:
+        return ChangeRecord.select(fn.MAX(ChangeRecord.id)).scalar() or 0
+
+
+def _executemany(cursor, sql: str, batch: list[tuple]) -> None:
+    # raising Peewee's errors, like the queries, not sqlite3's
+    with __exception_wrapper__:
+        cursor.executemany(sql, batch)
+
+
+def _next_id() -> int:
+    """Answer the id SQLite would give the next issue: above every id the
+    table has ever had."""
+    row = _db.execute_sql(
+        "SELECT seq FROM sqlite_sequence WHERE name = ?",
+        (IssueRecord._meta.table_name,),
+    ).fetchone()
+    max_id = IssueRecord.select(fn.MAX(IssueRecord.id)).scalar() or 0
+    return max(row[0] if row else 0, max_id) + 1
+
+
+def _upgrade_issues_table() -> None:
+    """Recreate an issues table made before ids were AUTOINCREMENT, keeping
+    its rows and their ids."""
+    table = IssueRecord._meta.table_name
+    row = _db.execute_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone()
+    if row is None or "AUTOINCREMENT" in row[0].upper():
+        return
+    with _db.atomic("IMMEDIATE"):
+        _db.execute_sql(f"ALTER TABLE {table} RENAME TO {table}_old")
+        for index in _db.get_indexes(f"{table}_old"):
+            _db.execute_sql(f"DROP INDEX {index.name}")
+        _db.create_tables([IssueRecord])
+        _db.execute_sql(
+            f"INSERT INTO {table} (id, title, status, priority, assigned_to, notes) "
+            f"SELECT id, title, status, priority, assigned_to, notes FROM {table}_old"
+        )
+        _db.execute_sql(f"DROP TABLE {table}_old")
+
+
+def _row(issue: Issue) -> tuple:
+    return (
+        issue.id,
+        issue.title,
+        issue.status.value,
+        issue.priority.value,
+        issue.assigned_to,
+        issue.notes,
+    )
+
+
+def _value(field: str, value):
+    match field:
+        case "status":
+            return Status(value)
+        case "priority":
+            return Priority(value)
+    return value
+
+
+def _fields(issue: Issue) -> dict:
+    return {
+        "title": issue.title,
+        "status": issue.status.value,
+        "priority": issue.priority.value,
+        "assigned_to": issue.assigned_to,
+        "notes": issue.notes,
+    }
@@ -1,3 +1,5 @@
+from typing import Any
+
 from PySide6.QtCore import Signal
 from PySide6.QtWidgets import (
     QComboBox,
@@ -14,8 +16,114 @@ from PySide6.QtWidgets import (
 
 from issue_tracker.issue import Issue, Priority, Status
 
+FIELDS = ("title", "status", "priority", "assigned_to", "notes")
+
+
+class IssueForm:
+    """The fields of one issue in the widgets of a form, keeping track of
+    which fields were changed since the issue was shown, so that showing
+    and saving only touch those.  The notes are only read from their
+    (possibly large) document when they were edited.  A blank assignee is
+    None, as in `Issue`."""
+
+    def __init__(
+        self,
+        title_edit: QLineEdit,
+        status_combo: QComboBox,
+        priority_combo: QComboBox,
+        assigned_to_edit: QLineEdit,
+        notes_plain_text: QPlainTextEdit,
+    ):
+        self.title_edit = title_edit
+        self.status_combo = status_combo
+        self.priority_combo = priority_combo
+        self.assigned_to_edit = assigned_to_edit
+        self.notes_plain_text = notes_plain_text
+        # the field values shown by show_issue()
+        self._shown: dict[str, Any] = {}
+        self._notes_changed = False
+        self.notes_plain_text.textChanged.connect(self._notes_edited)
+
+    def _notes_edited(self):
+        self._notes_changed = True
+
+    def show_issue(self, issue: Issue):
+        """Show `issue`, discarding any changes.  Widgets that already show
+        the right value are left alone, so the notes document is only
+        rebuilt when the notes differ."""
+        shown = {field: getattr(issue, field) for field in FIELDS}
+        for field, value in shown.items():
+            if field == "notes":
+                if self._notes_changed or self._shown.get("notes") != value:
+                    self.notes_plain_text.setPlainText(value)
+            elif self._field_value(field) != value:
+                self._set_field_value(field, value)
+        self._shown = shown
+        self._notes_changed = False
+
+    def clear(self):
+        self.title_edit.clear()
+        self.status_combo.setCurrentIndex(-1)
+        self.priority_combo.setCurrentIndex(-1)
+        self.assigned_to_edit.clear()
+        self.notes_plain_text.clear()
+        self._shown = {}
+
+    def _field_value(self, field: str):
+        match field:
+            case "title":
+                return self.title_edit.text()
+            case "status":
+                return self.status_combo.currentData()
+            case "priority":
+                return self.priority_combo.currentData()
+            case "assigned_to":
+                return self.assigned_to_edit.text() or None
+            case "notes":
+                return self.notes_plain_text.toPlainText()
+
+    def _set_field_value(self, field: str, value) -> None:
+        match field:
+            case "title":
+                self.title_edit.setText(value)
+            case "status":
+                self.status_combo.setCurrentIndex(self.status_combo.findData(value))
+            case "priority":
+                self.priority_combo.setCurrentIndex(self.priority_combo.findData(value))
+            case "assigned_to":
+                self.assigned_to_edit.setText(value or "")
+
+    def values(self) -> dict:
+        """Answer the issue fields as entered."""
+        return {field: self._field_value(field) for field in FIELDS}
+
+    def changed_values(self) -> dict:
+        """Answer the fields whose values differ from those shown, all of
+        them if no issue is shown, e.g. for an `EditIssueCommand`."""
+        changed = {}
+        for field in FIELDS:
+            if field == "notes" and "notes" in self._shown and not self._notes_changed:
+                continue
+            value = self._field_value(field)
+            if field not in self._shown or self._shown[field] != value:
+                changed[field] = value
+        return changed
+
+    def update_issue(self, issue: Issue) -> set[str]:
+        """Write the changed fields to `issue` and answer their names, e.g.
+        for `IssueTableModel.issue_changed`.  No names means there was
+        nothing to save and `issue` is untouched."""
+        changed = self.changed_values()
+        for field, value in changed.items():
+            setattr(issue, field, value)
+        self._shown.update(changed)
+        self._notes_changed = False
+        return set(changed)
+
 
 class IssueEditor(QWidget):
+    """A form for one issue, see `IssueForm`."""
+
     save_clicked = Signal()
     cancel_clicked = Signal()
 
@@ -25,6 +133,28 @@ class IssueEditor(QWidget):
         self._build_ui()
         self._populate_combo_boxes()
         self._connect_widgets()
+        self._form = IssueForm(
+            self.title_edit,
+            self.status_combo,
+            self.priority_combo,
+            self.assigned_to_edit,
+            self.notes_plain_text,
+        )
+
+    def show_issue(self, issue: Issue):
+        self._form.show_issue(issue)
+
+    def clear(self):
+        self._form.clear()
+
+    def values(self) -> dict:
+        return self._form.values()
+
+    def changed_values(self) -> dict:
+        return self._form.changed_values()
+
+    def update_issue(self, issue: Issue) -> set[str]:
+        return self._form.update_issue(issue)
 
     def _build_ui(self):
         self.title_edit = QLineEdit(self)
@@ -67,26 +197,3 @@ class IssueEditor(QWidget):
     def _connect_widgets(self):
         self.save_button.clicked.connect(self.save_clicked)
         self.cancel_button.clicked.connect(self.cancel_clicked)
-
-    def show_issue(self, issue: Issue):
-        self.title_edit.setText(issue.title)
-        self.status_combo.setCurrentIndex(self.status_combo.findData(issue.status))
-        self.priority_combo.setCurrentIndex(
-            self.priority_combo.findData(issue.priority)
-        )
-        self.assigned_to_edit.setText(issue.assigned_to)
-        self.notes_plain_text.setPlainText(issue.notes)
-
-    def clear(self):
-        self.title_edit.clear()
-        self.status_combo.setCurrentIndex(-1)
-        self.priority_combo.setCurrentIndex(-1)
-        self.assigned_to_edit.clear()
-        self.notes_plain_text.clear()
-
-    def update_issue(self, issue: Issue):
-        issue.title = self.title_edit.text()
-        issue.status = self.status_combo.currentData()
-        issue.priority = self.priority_combo.currentData()
-        issue.assigned_to = self.assigned_to_edit.text()
-        issue.notes = self.notes_plain_text.toPlainText()
@@ -0,0 +1,177 @@
+"""Who changed which field of an issue to what, and when.
+
+`IssueHistory` appends every change to the `changes` table of an `IssueDB`,
+which is never updated or deleted from, so the history of an issue can be
+looked up years later.  The changes are written on a worker thread with its
+own connection, a batch per edit, so even a bulk edit of many issues costs
+the editor no more than making a note of the changes.  Until they are
+written the changes are kept in memory, and `history()` answers them too.
+A batch that cannot be written is reported by `failed`, kept, and written
+again with the next one.
+
+Besides the fields, the history has an entry when an issue was created,
+deleted or restored (its delete undone), with the value None.
+"""
+
+import getpass
+import logging
+import time
+from collections import deque
+from typing import Iterable, Optional
+
+from peewee import DatabaseError
+from PySide6.QtCore import QObject, Qt, QThread, Signal, Slot
+
+from issue_tracker.issue import Change, Issue
+from issue_tracker.issue_commands import ISSUE_FIELDS
+from issue_tracker.issue_db import IssueDB
+from issue_tracker.issue_transfer import wait_for
+
+# what can happen to an issue as a whole, recorded like a field
+EVENTS = ("created", "deleted", "restored")
+
+_log = logging.getLogger(__name__)
+
+
+class _HistoryWriter(QObject):
+    written = Signal(int)  # the id of the last change written
+    failed = Signal(str)  # error message
+    finished = Signal()
+
+    def __init__(self, database: IssueDB, parent=None):
+        super().__init__(parent)
+        self._database = database
+        # changes that could not be written yet
+        self._pending: list[Change] = []
+
+    @Slot(list)
+    def write(self, changes: list[Change]) -> None:
+        changes = self._pending + changes
+        try:
+            self._database.append_changes(changes)
+        except DatabaseError as e:
+            self._pending = changes
+            self.failed.emit(str(e))
+        else:
+            self._pending = []
+            self.written.emit(changes[-1].id)
+
+    @Slot()
+    def close(self) -> None:
+        # the connection of this thread only
+        self._database.close()
+        self.finished.emit()
+
+
+class IssueHistory(QObject):
+    # changes could not be written, the error message
+    failed = Signal(str)
+
+    _write = Signal(list)
+    _close = Signal()
+
+    def __init__(self, database: IssueDB, author: Optional[str] = None, parent=None):
+        """Record the changes made by `author`, the user logged in if not
+        given, in `database`."""
+        super().__init__(parent)
+        self.author = author or getpass.getuser()
+        self._database = database
+        self._next_id = database.last_change_id() + 1
+        self._unwritten: deque[Change] = deque()
+        self._writer = _HistoryWriter(database)
+        self._thread = QThread()
+        self._writer.moveToThread(self._thread)
+        self._write.connect(self._writer.write)
+        self._close.connect(self._writer.close)
+        self._writer.written.connect(self._written)
+        self._writer.failed.connect(self._write_failed)
+        self._writer.finished.connect(
+            self._thread.quit, Qt.ConnectionType.DirectConnection
+        )
+        self._thread.finished.connect(self._writer.deleteLater)
+        self._thread.start()
+
+    def record(self, issues: Iterable[Issue], fields: Optional[Iterable[str]]) -> None:
+        """The `fields` (None for all) of the saved `issues` have just been
+        changed."""
+        fields = [f for f in ISSUE_FIELDS if fields is None or f in fields]
+        self._append(
+            (issue.id, field, getattr(issue, field))
+            for issue in issues
+            for field in fields
+        )
+
+    def record_event(self, issues: Iterable[Issue], event: str) -> None:
+        """The saved `issues` have just been "created", "deleted" or
+        "restored" (see `EVENTS`)."""
+        self._append((issue.id, event, None) for issue in issues)
+
+    def _append(self, entries) -> None:
+        # (issue id, field, value) triples
+        now = time.time()
+        changes = []
+        for issue_id, field, value in entries:
+            changes.append(
+                Change(self._next_id, issue_id, now, self.author, field, value)
+            )
+            self._next_id += 1
+        if changes:
+            self._unwritten.extend(changes)
+            self._write.emit(changes)
+
+    def history(self, issue_id: int) -> list[Change]:
+        """Answer the changes of the issue `issue_id`, oldest first."""
+        changes = self._database.history(issue_id)
+        # changes written since the last `written` are read from the database
+        last_id = changes[-1].id if changes else 0
+        changes.extend(
+            c for c in self._unwritten if c.issue_id == issue_id and c.id > last_id
+        )
+        return changes
+
+    def close(self) -> None:
+        """Write the remaining changes and stop the writer."""
+        if self._thread is None:
+            return
+        self._close.emit()
+        wait_for(self._thread)
+        self._thread = None
+
+    def _written(self, last_id: int) -> None:
+        while self._unwritten and self._unwritten[0].id <= last_id:
+            self._unwritten.popleft()
+
+    def _write_failed(self, message: str) -> None:
+        _log.error("could not write the issue history: %s", message)
+        self.failed.emit(message)
+
+
+def describe(changes: list[Change]) -> list[str]:
+    """Answer a line per change, saying what the field was changed from."""
+    lines = []
+    values = {}
+    for change in changes:
+        when = time.strftime("%Y-%m-%d %H:%M", time.localtime(change.time))
+        if change.field in EVENTS:
+            lines.append(f"{when} {change.author} {change.field} the issue")
+            continue
+        value = _text(change.value)
+        old = values.get(change.field)
+        if old is None:
+            lines.append(f"{when} {change.author} set {change.field} to {value}")
+        else:
+            lines.append(
+                f"{when} {change.author} changed {change.field} from {old} to {value}"
+            )
+        values[change.field] = value
+    return lines
+
+
+def _text(value) -> str:
+    if value is None:
+        return "nothing"
+    name = getattr(value, "name", None)
+    if name is not None:
+        return name
+    text = repr(value)
+    return text if len(text) <= 40 else text[:39] + "…"
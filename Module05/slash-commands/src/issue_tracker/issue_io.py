@@ -0,0 +1,174 @@
+"""Reading and writing issues as CSV or JSON Lines files.
+
+Both formats are streamed: `read_issues` parses one record at a time and
+`write_issues` writes each issue as soon as it gets it, so a file of
+millions of issues never has to fit in memory.  The format follows from the
+file name (".csv", ".jsonl").
+
+A CSV file starts with a header row naming the columns, in any order:
+title, status and priority are required, assigned_to and notes optional.
+A JSON Lines file has one object with the same keys per line.  Statuses
+and priorities are stored by name (e.g. "IN_PROGRESS"); unknown ones, like
+any other malformed record, raise an `IssueFormatError` naming the line.
+Issue ids belong to a database and are not written.
+"""
+
+import csv
+import json
+import os
+from typing import Callable, Iterable, Iterator, Optional
+
+from issue_tracker.issue import Issue, Priority, Status
+
+COLUMNS = ("title", "status", "priority", "assigned_to", "notes")
+REQUIRED_COLUMNS = ("title", "status", "priority")
+FORMATS = {".csv": "csv", ".jsonl": "jsonl"}
+
+
+class IssueFormatError(ValueError):
+    def __init__(self, path: str, line: int, message: str):
+        super().__init__(f"{path}, line {line}: {message}")
+        self.path = path
+        self.line = line
+
+
+def file_format(path: str) -> str:
+    """Answer "csv" or "jsonl" for `path`, raise ValueError if it is neither."""
+    extension = os.path.splitext(path)[1].casefold()
+    if extension not in FORMATS:
+        raise ValueError(
+            f"Unknown issue file format {extension!r}, use one of {', '.join(FORMATS)}"
+        )
+    return FORMATS[extension]
+
+
+def read_issues(
+    path: str, progress: Optional[Callable[[int], None]] = None
+) -> Iterator[Issue]:
+    """Yield the issues stored in the file at `path` one at a time.
+    `progress` is called with the number of bytes read so far."""
+    read = _read_csv if file_format(path) == "csv" else _read_jsonl
+    with open(path, "rb") as file:
+        yield from read(path, _lines(file, progress))
+
+
+def write_issues(
+    path: str,
+    issues: Iterable[Issue],
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """Write `issues` to the file at `path`.  `progress` is called with the
+    number of issues written so far.  Answer that number."""
+    write = _write_csv if file_format(path) == "csv" else _write_jsonl
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        return write(file, issues, progress or (lambda count: None))
+
+
+def _lines(file, progress) -> Iterator[str]:
+    """Decode the lines of the binary `file`, keeping track of the bytes."""
+    position = 0
+    first = True
+    for line in file:
+        position += len(line)
+        if progress is not None:
+            progress(position)
+        if first:
+            first = False
+            line = line.removeprefix(b"\xef\xbb\xbf")  # a byte order mark
+        yield line.decode("utf-8")
+
+
+def _read_csv(path: str, lines: Iterator[str]) -> Iterator[Issue]:
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if header is None:
+        return
+    header = [name.strip().casefold() for name in header]
+    missing = [name for name in REQUIRED_COLUMNS if name not in header]
+    if missing:
+        raise IssueFormatError(path, 1, f"missing column {', '.join(missing)}")
+    positions = [header.index(name) if name in header else None for name in COLUMNS]
+    for record in reader:
+        if not record:
+            continue
+        values = {
+            name: record[position] if position < len(record) else ""
+            for name, position in zip(COLUMNS, positions)
+            if position is not None
+        }
+        yield _issue(path, reader.line_num, values)
+
+
+def _read_jsonl(path: str, lines: Iterator[str]) -> Iterator[Issue]:
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            values = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise IssueFormatError(path, number, f"invalid JSON: {e.msg}") from e
+        if not isinstance(values, dict):
+            raise IssueFormatError(path, number, "not a JSON object")
+        missing = [name for name in REQUIRED_COLUMNS if name not in values]
+        if missing:
+            raise IssueFormatError(path, number, f"missing {', '.join(missing)}")
+        yield _issue(path, number, values)
+
+
+def _issue(path: str, line: int, values: dict) -> Issue:
+    def text(name):
+        value = values.get(name)
+        if value is not None and not isinstance(value, str):
+            raise IssueFormatError(path, line, f"{name} is not text: {value!r}")
+        return value or ""
+
+    return Issue(
+        text("title"),
+        _member(path, line, Status, values["status"]),
+        _member(path, line, Priority, values["priority"]),
+        text("assigned_to") or None,
+        text("notes"),
+    )
+
+
+def _member(path: str, line: int, enum, name):
+    try:
+        return enum[name.strip().upper()]
+    except (KeyError, AttributeError):
+        raise IssueFormatError(
+            path, line, f"unknown {enum.__name__.lower()} {name!r}"
+        ) from None
+
+
+def _write_csv(file, issues: Iterable[Issue], progress) -> int:
+    writer = csv.writer(file)
+    writer.writerow(COLUMNS)
+    count = 0
+    for count, issue in enumerate(issues, 1):
+        writer.writerow(
+            (
+                issue.title,
+                issue.status.name,
+                issue.priority.name,
+                issue.assigned_to or "",
+                issue.notes,
+            )
+        )
+        progress(count)
+    return count
+
+
+def _write_jsonl(file, issues: Iterable[Issue], progress) -> int:
+    count = 0
+    for count, issue in enumerate(issues, 1):
+        record = {
+            "title": issue.title,
+            "status": issue.status.name,
+            "priority": issue.priority.name,
+            "assigned_to": issue.assigned_to,
+            "notes": issue.notes,
+        }
+        file.write(json.dumps(record, ensure_ascii=False))
+        file.write("\n")
+        progress(count)
+    return count
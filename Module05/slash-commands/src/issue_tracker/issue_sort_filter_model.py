@@ -0,0 +1,521 @@
+"""Sorting and filtering of issues that stays fast for large backlogs.
+
+For every column the sort key of each issue is computed once and kept in a
+list (the enum value for status and priority, the case folded text
+otherwise).  Sorting by several columns is a series of stable sorts on those
+lists, and the resulting order of all issues is kept for every sort order
+used so far, so switching back to a sort order or changing a filter does not
+sort again.
+
+When an issue changes only its row is moved: it is found and re-inserted
+with a binary search on the cached keys and the views are told about the
+move with beginMoveRows.  Nothing is re-sorted.  When many issues change at
+once they are re-sorted in a single layout change instead, and issues
+removed together are taken out of every cached order without sorting.
+
+An issue filter can come with a rank (a search does), which then sorts
+before all columns: its keys are cached like those of a column.
+"""
+
+from bisect import bisect_left
+from functools import partial
+from operator import attrgetter
+from typing import Callable, Iterable, Optional
+
+from PySide6.QtCore import QAbstractProxyModel, QModelIndex, Qt
+
+from issue_tracker.issue import Issue
+from issue_tracker.issue_table_model import IssueTableModel, rows_after_removal
+
+SortColumns = tuple[tuple[int, Qt.SortOrder], ...]
+
+_COLUMN_VALUES = (
+    attrgetter("title"),
+    attrgetter("status"),
+    attrgetter("priority"),
+    attrgetter("assigned_to"),
+)
+_VALUE_KEYS = (
+    str.casefold,
+    attrgetter("value"),
+    attrgetter("value"),
+    lambda name: (name or "").casefold(),
+)
+# the pseudo column of the issue rank
+_RANK = -1
+
+
+class _RowKey:
+    """Compares two rows the way the sort order puts them, ties are broken by
+    the row number so that every row has exactly one place."""
+
+    __slots__ = ("values", "row", "descending")
+
+    def __init__(self, values, row, descending):
+        self.values = values
+        self.row = row
+        self.descending = descending
+
+    def __lt__(self, other):
+        for a, b, descending in zip(self.values, other.values, self.descending):
+            if a != b:
+                return a > b if descending else a < b
+        return self.row < other.row
+
+
+class IssueSortFilterModel(QAbstractProxyModel):
+    """A proxy for an `IssueTableModel` that sorts by up to
+    `max_sort_columns` columns and shows only the issues accepted by the
+    filters.  Clicking a column header makes it the first sort column, the
+    columns clicked before break ties."""
+
+    max_sort_columns = 3
+    # inserting or changing more source rows than this at once sorts again
+    max_incremental_rows = 1000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._keys: dict[int, list] = {}
+        self._sort_columns: SortColumns = ()
+        self._sorted_rows: dict[SortColumns, list[int]] = {}
+        self._filters: dict[int, set] = {}
+        self._issue_filter: Optional[Callable[[Issue], bool]] = None
+        self._issue_rank: Optional[Callable[[Issue], float]] = None
+        self._rows: list[int] = []  # the visible source rows, in order
+        # during a source layout change: the persistent indexes with their
+        # source rows and issues, and the new number of every source row if
+        # only rows were removed
+        self._layout_change = None
+        self._new_source_rows: Optional[list[Optional[int]]] = None
+
+    def setSourceModel(self, model: IssueTableModel) -> None:
+        old = self.sourceModel()
+        if old is not None:
+            old.issues_edited.disconnect(self._source_issues_edited)
+            old.issues_removed.disconnect(self._source_issues_removed)
+            old.rowsInserted.disconnect(self._source_rows_inserted)
+            old.rowsRemoved.disconnect(self._source_rows_removed)
+            old.modelAboutToBeReset.disconnect(self.beginResetModel)
+            old.modelReset.disconnect(self._source_reset)
+            old.layoutAboutToBeChanged.disconnect(
+                self._source_layout_about_to_be_changed
+            )
+            old.layoutChanged.disconnect(self._source_layout_changed)
+        self.beginResetModel()
+        super().setSourceModel(model)
+        model.issues_edited.connect(self._source_issues_edited)
+        model.issues_removed.connect(self._source_issues_removed)
+        model.rowsInserted.connect(self._source_rows_inserted)
+        model.rowsRemoved.connect(self._source_rows_removed)
+        model.modelAboutToBeReset.connect(self.beginResetModel)
+        model.modelReset.connect(self._source_reset)
+        model.layoutAboutToBeChanged.connect(self._source_layout_about_to_be_changed)
+        model.layoutChanged.connect(self._source_layout_changed)
+        self._clear_caches()
+        self.endResetModel()
+
+    # QAbstractProxyModel
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        source = self.sourceModel()
+        return 0 if parent.isValid() or source is None else source.columnCount()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid():
+            return QModelIndex()
+        return self.sourceModel().index(
+            self._rows[proxy_index.row()], proxy_index.column()
+        )
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        position = self._find(self._rows, source_index.row())
+        if position is None:
+            return QModelIndex()
+        return self.index(position, source_index.column())
+
+    def source_rows(self, first: int, last: int) -> list[int]:
+        """Answer the source rows shown in rows `first` to `last`."""
+        return self._rows[first : last + 1]
+
+    def proxy_rows(self, source_rows: list[Optional[int]]) -> list[Optional[int]]:
+        """Answer the rows `source_rows` are shown in, None for hidden ones.
+        Many rows are cheaper to look up in one mapping than one by one."""
+        if len(source_rows) > self.max_incremental_rows:
+            find = dict(zip(self._rows, range(len(self._rows)))).get
+        else:
+            find = partial(self._find, self._rows)
+        return [None if row is None else find(row) for row in source_rows]
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        if column < 0:
+            self.set_sort_columns(())
+            return
+        others = [(c, o) for c, o in self._sort_columns if c != column]
+        self.set_sort_columns(((column, order), *others)[: self.max_sort_columns])
+
+    # sorting and filtering
+
+    def sort_columns(self) -> SortColumns:
+        return self._sort_columns
+
+    def set_sort_columns(self, columns: Iterable[tuple[int, Qt.SortOrder]]) -> None:
+        """Sort by `columns`, pairs of column and order, most significant
+        first.  No columns means the order of the source model."""
+        columns = tuple(columns)
+        if columns != self._sort_columns:
+            self._change_layout(lambda: setattr(self, "_sort_columns", columns))
+
+    def set_filter(self, column: int, values: Optional[Iterable]) -> None:
+        """Show only the issues whose value in `column` (a `Status`,
+        `Priority` or assignee name) is one of `values`; None shows all."""
+
+        def change():
+            if values is None:
+                self._filters.pop(column, None)
+            else:
+                self._filters[column] = {_VALUE_KEYS[column](v) for v in values}
+
+        self._change_layout(change)
+
+    def set_issue_filter(
+        self,
+        accepts: Optional[Callable[[Issue], bool]],
+        rank: Optional[Callable[[Issue], float]] = None,
+    ) -> None:
+        """Show only the issues `accepts` answers true for, in addition to the
+        column filters; None shows all.  With `rank`, the issues are shown in
+        the order of the numbers it answers, lowest first, and the sort
+        columns only break ties."""
+
+        def change():
+            self._issue_filter = accepts
+            if rank is not None or self._issue_rank is not None:
+                self._issue_rank = rank
+                self._keys.pop(_RANK, None)
+                self._sorted_rows = {
+                    columns: rows
+                    for columns, rows in self._sorted_rows.items()
+                    if (_RANK, Qt.SortOrder.AscendingOrder) not in columns
+                }
+
+        self._change_layout(change)
+
+    def filter(self, column: int) -> Optional[set]:
+        """Answer the sort keys accepted in `column`, None if not filtered."""
+        return self._filters.get(column)
+
+    def _change_layout(self, change) -> None:
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        source_rows = [self._rows[index.row()] for index in persistent]
+        change()
+        self._rows = self._visible_rows()
+        self._change_persistent_rows(persistent, source_rows)
+        self.layoutChanged.emit()
+
+    def _change_persistent_rows(
+        self, persistent: list, source_rows: list[Optional[int]]
+    ) -> None:
+        """Point the `persistent` indexes to where their `source_rows` are
+        shown now."""
+        self.changePersistentIndexList(
+            persistent,
+            [
+                QModelIndex()
+                if position is None
+                else self.createIndex(position, index.column())
+                for position, index in zip(self.proxy_rows(source_rows), persistent)
+            ],
+        )
+
+    def _ordering(self) -> SortColumns:
+        """The sort columns, after the rank if there is one."""
+        if self._issue_rank is None:
+            return self._sort_columns
+        return ((_RANK, Qt.SortOrder.AscendingOrder), *self._sort_columns)
+
+    def _issue_key(self, column: int) -> Callable[[Issue], object]:
+        if column == _RANK:
+            return self._issue_rank
+        value, key = _COLUMN_VALUES[column], _VALUE_KEYS[column]
+        return lambda issue: key(value(issue))
+
+    def _column_keys(self, column: int) -> list:
+        keys = self._keys.get(column)
+        if keys is None:
+            issue_key = self._issue_key(column)
+            keys = [issue_key(issue) for issue in self.sourceModel().issues()]
+            self._keys[column] = keys
+        return keys
+
+    def _all_sorted_rows(self) -> list[int]:
+        ordering = self._ordering()
+        rows = self._sorted_rows.get(ordering)
+        if rows is None:
+            rows = list(range(self.sourceModel().rowCount()))
+            # stable sorts, least significant column first
+            for column, order in reversed(ordering):
+                rows.sort(
+                    key=self._column_keys(column).__getitem__,
+                    reverse=order == Qt.SortOrder.DescendingOrder,
+                )
+            self._sorted_rows[ordering] = rows
+        return rows
+
+    def _visible_rows(self) -> list[int]:
+        rows = self._all_sorted_rows()
+        if not self._filters and self._issue_filter is None:
+            return list(rows)
+        for column, accepted in self._filters.items():
+            keys = self._column_keys(column)
+            rows = [row for row in rows if keys[row] in accepted]
+        if self._issue_filter is not None:
+            issues, accepts = self.sourceModel().issues(), self._issue_filter
+            rows = [row for row in rows if accepts(issues[row])]
+        return rows
+
+    def _accepts(self, row: int) -> bool:
+        if self._issue_filter is not None and not self._issue_filter(
+            self.sourceModel().issue(row)
+        ):
+            return False
+        return all(
+            self._column_keys(column)[row] in accepted
+            for column, accepted in self._filters.items()
+        )
+
+    def _row_key(self, row: int) -> _RowKey:
+        ordering = self._ordering()
+        return _RowKey(
+            [self._column_keys(column)[row] for column, _ in ordering],
+            row,
+            [order == Qt.SortOrder.DescendingOrder for _, order in ordering],
+        )
+
+    def _find(self, rows: list[int], row: int) -> Optional[int]:
+        """Answer the position of source `row` in `rows`, None if absent."""
+        position = bisect_left(rows, self._row_key(row), key=self._row_key)
+        if position < len(rows) and rows[position] == row:
+            return position
+        return None
+
+    def _destination(self, rows: list[int], position: int) -> int:
+        """Answer where the row at `position` of `rows` belongs now that its
+        keys have changed, counted in `rows` before the row is taken out."""
+        key = self._row_key(rows[position])
+        if position > 0 and key < self._row_key(rows[position - 1]):
+            return bisect_left(rows, key, 0, position, key=self._row_key)
+        if position + 1 < len(rows) and self._row_key(rows[position + 1]) < key:
+            return bisect_left(rows, key, position + 1, len(rows), key=self._row_key)
+        return position
+
+    @staticmethod
+    def _move(rows: list[int], position: int, destination: int) -> None:
+        row = rows.pop(position)
+        rows.insert(destination - 1 if destination > position else destination, row)
+
+    def _clear_caches(self) -> None:
+        self._keys.clear()
+        self._sorted_rows.clear()
+        self._rows = [] if self.sourceModel() is None else self._visible_rows()
+
+    # source model changes
+
+    def _source_issues_edited(self, rows, fields):
+        if len(rows) <= self.max_incremental_rows:
+            for row in rows:
+                self._source_row_changed(row)
+            return
+
+        def change():
+            issues = self.sourceModel().issues()
+            for column, keys in self._keys.items():
+                issue_key = self._issue_key(column)
+                for row in rows:
+                    keys[row] = issue_key(issues[row])
+            self._sorted_rows.clear()
+
+        self._change_layout(change)
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self._rows) - 1, self.columnCount() - 1),
+            )
+
+    def _source_row_changed(self, row: int) -> None:
+        # find the row with its old keys first
+        all_rows = self._all_sorted_rows()
+        all_position = self._find(all_rows, row)
+        position = self._find(self._rows, row)
+
+        issue = self.sourceModel().issue(row)
+        for column, keys in self._keys.items():
+            keys[row] = self._issue_key(column)(issue)
+        # the other cached orders would need the same repair, drop them
+        self._sorted_rows = {self._ordering(): all_rows}
+        self._move(all_rows, all_position, self._destination(all_rows, all_position))
+
+        accepted = self._accepts(row)
+        if position is not None and accepted:
+            destination = self._destination(self._rows, position)
+            if destination not in (position, position + 1):
+                self.beginMoveRows(
+                    QModelIndex(), position, position, QModelIndex(), destination
+                )
+                self._move(self._rows, position, destination)
+                self.endMoveRows()
+            position = self._find(self._rows, row)
+            self.dataChanged.emit(
+                self.index(position, 0), self.index(position, self.columnCount() - 1)
+            )
+        elif position is not None:
+            self.beginRemoveRows(QModelIndex(), position, position)
+            del self._rows[position]
+            self.endRemoveRows()
+        elif accepted:
+            self._insert_visible(row)
+
+    def _insert_visible(self, row: int) -> None:
+        position = bisect_left(self._rows, self._row_key(row), key=self._row_key)
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._rows.insert(position, row)
+        self.endInsertRows()
+
+    def _source_rows_inserted(self, parent, first, last):
+        count = last - first + 1
+        issues = self.sourceModel().issues()
+        appended = last == len(issues) - 1
+        if count > self.max_incremental_rows and not appended:
+            self._rebuild()
+            return
+        for column, keys in self._keys.items():
+            issue_key = self._issue_key(column)
+            keys[first:first] = [issue_key(issue) for issue in issues[first : last + 1]]
+        all_rows = self._all_sorted_rows()
+        if not appended:
+            # rows after the inserted ones moved down, renumber them first
+            all_rows[:] = _rows_after_insertion(all_rows, first, count)
+            self._rows = _rows_after_insertion(self._rows, first, count)
+        self._sorted_rows = {self._ordering(): all_rows}
+        if appended and self._append_after_all(all_rows, first, last):
+            return
+        if count > self.max_incremental_rows:
+            # appended: no row is renumbered, sort them all in once
+            self._change_layout(self._sorted_rows.clear)
+            return
+        for row in range(first, last + 1):
+            all_rows.insert(
+                bisect_left(all_rows, self._row_key(row), key=self._row_key), row
+            )
+            if self._accepts(row):
+                self._insert_visible(row)
+
+    def _append_after_all(self, all_rows: list[int], first: int, last: int) -> bool:
+        """Show the source rows `first` to `last`, just appended, in one
+        insert at the end if they sort after all the others (as they always
+        do unsorted).  Answer whether they did."""
+        new_rows = sorted(range(first, last + 1), key=self._row_key)
+        if all_rows and self._row_key(new_rows[0]) < self._row_key(all_rows[-1]):
+            return False
+        all_rows.extend(new_rows)
+        shown = [row for row in new_rows if self._accepts(row)]
+        if shown:
+            position = len(self._rows)
+            self.beginInsertRows(QModelIndex(), position, position + len(shown) - 1)
+            self._rows.extend(shown)
+            self.endInsertRows()
+        return True
+
+    def _source_rows_removed(self, parent, first, last):
+        if first != last:
+            self._rebuild()
+            return
+        # the keys are cached, so the removed row can still be found
+        all_rows = self._all_sorted_rows()
+        del all_rows[self._find(all_rows, first)]
+        position = self._find(self._rows, first)
+        for keys in self._keys.values():
+            del keys[first]
+        all_rows[:] = _rows_after_removal(all_rows, first)
+        self._sorted_rows = {self._ordering(): all_rows}
+        if position is None:
+            self._rows = _rows_after_removal(self._rows, first)
+            return
+        self.beginRemoveRows(QModelIndex(), position, position)
+        del self._rows[position]
+        self._rows = _rows_after_removal(self._rows, first)
+        self.endRemoveRows()
+
+    def _source_reset(self):
+        self._clear_caches()
+        self.endResetModel()
+
+    def _source_layout_about_to_be_changed(self, parents=(), hint=None):
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        source_rows = [self._rows[index.row()] for index in persistent]
+        issues = self.sourceModel().issues()
+        self._layout_change = (
+            persistent,
+            source_rows,
+            [issues[row] for row in source_rows],
+        )
+        self._new_source_rows = None
+
+    def _source_issues_removed(self, rows, issues):
+        # sent between the source's layout signals
+        self._new_source_rows = rows_after_removal(
+            self.sourceModel().rowCount() + len(rows), rows
+        )
+
+    def _source_layout_changed(self, parents=(), hint=None):
+        persistent, source_rows, issues = self._layout_change
+        new_rows = self._new_source_rows
+        self._layout_change = self._new_source_rows = None
+        if new_rows is None:
+            # rows may have moved anywhere, find the issues again
+            self._clear_caches()
+            positions = {
+                id(issue): row for row, issue in enumerate(self.sourceModel().issues())
+            }
+            source_rows = [positions.get(id(issue)) for issue in issues]
+        else:
+            # rows were only removed, the cached orders are still sorted
+            for keys in self._keys.values():
+                keys[:] = [key for key, row in zip(keys, new_rows) if row is not None]
+            for rows in self._sorted_rows.values():
+                rows[:] = _renumbered(rows, new_rows)
+            self._rows = _renumbered(self._rows, new_rows)
+            source_rows = [new_rows[row] for row in source_rows]
+        self._change_persistent_rows(persistent, source_rows)
+        self.layoutChanged.emit()
+
+    def _rebuild(self):
+        self.beginResetModel()
+        self._clear_caches()
+        self.endResetModel()
+
+
+def _rows_after_insertion(rows: list[int], first: int, count: int) -> list[int]:
+    return [row + count if row >= first else row for row in rows]
+
+
+def _rows_after_removal(rows: list[int], removed: int) -> list[int]:
+    return [row - 1 if row > removed else row for row in rows]
+
+
+def _renumbered(rows: list[int], new_rows: list[Optional[int]]) -> list[int]:
+    return [new_rows[row] for row in rows if new_rows[row] is not None]
@@ -0,0 +1,213 @@
+"""A compact, column oriented store for large numbers of issues.
+
+Each `Issue` object costs its own instance plus references to its fields.
+`IssueStore` keeps one column per field instead: statuses and priorities
+as one byte codes in arrays, assignees as indexes into a table of names
+(each name stored once) and ids in an array.  Only titles and notes remain
+Python strings.
+
+`store[row]` answers a separate `Issue` with the values at that row, so the
+store behaves like any list of issues (`reverse()`, swapping rows,
+slices).  `store.row(row)` answers an `IssueRow` instead, a small view that
+reads and writes the store in place and can be used wherever an `Issue` is
+expected.  A view refers to a position, so it follows whatever issue is at
+that row after insertions or deletions before it.
+"""
+
+from array import array
+from collections.abc import MutableSequence
+from typing import Iterable, Optional
+
+from issue_tracker.issue import Issue, Priority, Status
+
+_STATUSES = {s.value: s for s in Status}
+_PRIORITIES = {p.value: p for p in Priority}
+
+
+class IssueStore(MutableSequence):
+    def __init__(self, issues: Iterable[Issue] = ()):
+        self._titles: list[str] = []
+        self._notes: list[str] = []
+        self._statuses = array("B")
+        self._priorities = array("B")
+        self._assignees = array("I")  # index into _names
+        self._ids = array("q")  # 0 for issues without id
+        self._names: list[Optional[str]] = [None]
+        self._name_codes: dict[Optional[str], int] = {None: 0}
+        self.extend(issues)
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self.issue(r) for r in range(*row.indices(len(self)))]
+        return self.issue(row)
+
+    def __setitem__(self, row, issue) -> None:
+        if isinstance(row, slice):
+            issues = [_separate(i) for i in issue]
+            self._titles[row] = [i.title for i in issues]
+            self._notes[row] = [i.notes for i in issues]
+            self._statuses[row] = array("B", [i.status.value for i in issues])
+            self._priorities[row] = array("B", [i.priority.value for i in issues])
+            self._assignees[row] = array(
+                "I", [self._name_code(i.assigned_to) for i in issues]
+            )
+            self._ids[row] = array("q", [i.id or 0 for i in issues])
+            return
+        issue = _separate(issue)
+        self._titles[row] = issue.title
+        self._notes[row] = issue.notes
+        self._statuses[row] = issue.status.value
+        self._priorities[row] = issue.priority.value
+        self._assignees[row] = self._name_code(issue.assigned_to)
+        self._ids[row] = issue.id or 0
+
+    def __delitem__(self, row) -> None:
+        for column in self._columns():
+            del column[row]
+
+    def insert(self, row: int, issue: Issue) -> None:
+        issue = _separate(issue)
+        self._titles.insert(row, issue.title)
+        self._notes.insert(row, issue.notes)
+        self._statuses.insert(row, issue.status.value)
+        self._priorities.insert(row, issue.priority.value)
+        self._assignees.insert(row, self._name_code(issue.assigned_to))
+        self._ids.insert(row, issue.id or 0)
+
+    def append(self, issue: Issue) -> None:
+        issue = _separate(issue)
+        self._titles.append(issue.title)
+        self._notes.append(issue.notes)
+        self._statuses.append(issue.status.value)
+        self._priorities.append(issue.priority.value)
+        self._assignees.append(self._name_code(issue.assigned_to))
+        self._ids.append(issue.id or 0)
+
+    def reverse(self) -> None:
+        for column in self._columns():
+            column.reverse()
+
+    def row(self, row: int) -> "IssueRow":
+        """Answer a view of the issue at `row` that reads and writes the
+        store."""
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("issue row out of range")
+        return IssueRow(self, row)
+
+    def issue(self, row: int) -> Issue:
+        """Answer a separate `Issue` with the values at `row`."""
+        if not -len(self) <= row < len(self):
+            raise IndexError("issue row out of range")
+        return Issue(
+            self._titles[row],
+            _STATUSES[self._statuses[row]],
+            _PRIORITIES[self._priorities[row]],
+            self._names[self._assignees[row]],
+            self._notes[row],
+            self._ids[row] or None,
+        )
+
+    def assignees(self) -> list[str]:
+        """Answer the assignee names used so far."""
+        return self._names[1:]
+
+    def _columns(self):
+        return (
+            self._titles,
+            self._notes,
+            self._statuses,
+            self._priorities,
+            self._assignees,
+            self._ids,
+        )
+
+    def _name_code(self, name: Optional[str]) -> int:
+        code = self._name_codes.get(name)
+        if code is None:
+            code = self._name_codes[name] = len(self._names)
+            self._names.append(name)
+        return code
+
+
+def _separate(issue) -> Issue:
+    """Answer `issue`, or the values of a view as a separate `Issue`."""
+    return issue.to_issue() if isinstance(issue, IssueRow) else issue
+
+
+class IssueRow:
+    """The issue at one row of an `IssueStore`, with the attributes of an
+    `Issue`."""
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: IssueStore, row: int):
+        self._store = store
+        self._row = row
+
+    @property
+    def title(self) -> str:
+        return self._store._titles[self._row]
+
+    @title.setter
+    def title(self, value: str) -> None:
+        self._store._titles[self._row] = value
+
+    @property
+    def notes(self) -> str:
+        return self._store._notes[self._row]
+
+    @notes.setter
+    def notes(self, value: str) -> None:
+        self._store._notes[self._row] = value
+
+    @property
+    def status(self) -> Status:
+        return _STATUSES[self._store._statuses[self._row]]
+
+    @status.setter
+    def status(self, value: Status) -> None:
+        self._store._statuses[self._row] = value.value
+
+    @property
+    def priority(self) -> Priority:
+        return _PRIORITIES[self._store._priorities[self._row]]
+
+    @priority.setter
+    def priority(self, value: Priority) -> None:
+        self._store._priorities[self._row] = value.value
+
+    @property
+    def assigned_to(self) -> Optional[str]:
+        return self._store._names[self._store._assignees[self._row]]
+
+    @assigned_to.setter
+    def assigned_to(self, value: Optional[str]) -> None:
+        self._store._assignees[self._row] = self._store._name_code(value)
+
+    @property
+    def id(self) -> Optional[int]:
+        return self._store._ids[self._row] or None
+
+    @id.setter
+    def id(self, value: Optional[int]) -> None:
+        self._store._ids[self._row] = value or 0
+
+    def to_issue(self) -> Issue:
+        return self._store.issue(self._row)
+
+    def __eq__(self, other):
+        if isinstance(other, (Issue, IssueRow)):
+            return self.to_issue() == (
+                other if isinstance(other, Issue) else other.to_issue()
+            )
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"IssueRow({self._row}, {self.to_issue()!r})"
@@ -0,0 +1,187 @@
+from itertools import islice
+from typing import Iterable, Optional
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
+
+from issue_tracker.issue import Issue
+
+
+class IssueTableModel(QAbstractTableModel):
+    """A table model with one row per issue.
+
+    The views only ask for the rows they show, and every change is reported
+    for just the rows it touches (`issue_changed`, `append_issue`,
+    `remove_issue`), so edits cost the same with ten issues or a million.
+
+    Changes to many scattered rows at once (`issues_changed`,
+    `insert_issues`, `remove_issues`) are one transaction: the views get a
+    single update, and `issues_edited`, `issues_inserted` or `issues_removed`
+    tell the other listeners exactly which rows were touched."""
+
+    # the rows (ascending) whose issues were edited, and the names of the
+    # changed fields, None if unknown.  Emitted before dataChanged.
+    issues_edited = Signal(object, object)
+    # the rows (ascending) of issues inserted by `insert_issues`
+    issues_inserted = Signal(object)
+    # the rows (ascending, numbered before the removal) and the issues
+    # removed by `remove_issues`
+    issues_removed = Signal(object, object)
+
+    COLUMN_TITLES = ["Title", "Status", "Priority", "Assigned to"]
+    TITLE_COLUMN, STATUS_COLUMN, PRIORITY_COLUMN, ASSIGNED_TO_COLUMN = range(4)
+
+    def __init__(self, issues: list[Issue] | None = None, parent=None):
+        super().__init__(parent)
+        self._issues = issues if issues is not None else []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._issues)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMN_TITLES)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        issue = self._issues[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display_text(issue, index.column())
+        if role == Qt.ItemDataRole.UserRole:
+            return issue
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        # the vertical header asks for every row it shows, answer like
+        # QAbstractItemModel would without a call into it
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.tr(self.COLUMN_TITLES[section])
+        return section + 1
+
+    def _display_text(self, issue: Issue, column: int) -> str:
+        match column:
+            case self.TITLE_COLUMN:
+                return issue.title
+            case self.STATUS_COLUMN:
+                return issue.status.name
+            case self.PRIORITY_COLUMN:
+                return issue.priority.name
+            case self.ASSIGNED_TO_COLUMN:
+                return issue.assigned_to or ""
+        return ""
+
+    def issues(self) -> list[Issue]:
+        return self._issues
+
+    def issue(self, row: int) -> Issue:
+        return self._issues[row]
+
+    def set_issues(self, issues: list[Issue]) -> None:
+        self.beginResetModel()
+        self._issues = issues
+        self.endResetModel()
+
+    def issue_changed(self, row: int, fields: Optional[Iterable[str]] = None) -> None:
+        """The issue in `row` was edited, have the views repaint that row."""
+        self.issues_changed([row], fields)
+
+    def issues_changed(
+        self, rows: list[int], fields: Optional[Iterable[str]] = None
+    ) -> None:
+        """The issues in `rows` (ascending) were edited, `fields` names the
+        changed fields if known."""
+        if not rows:
+            return
+        self.issues_edited.emit(rows, None if fields is None else set(fields))
+        self.dataChanged.emit(
+            self.index(rows[0], 0), self.index(rows[-1], self.columnCount() - 1)
+        )
+
+    def append_issue(self, issue: Issue) -> int:
+        row = len(self._issues)
+        self.insert_issue(row, issue)
+        return row
+
+    def append_issues(self, issues: list[Issue]) -> None:
+        if not issues:
+            return
+        first = len(self._issues)
+        self.beginInsertRows(QModelIndex(), first, first + len(issues) - 1)
+        self._issues.extend(issues)
+        self.endInsertRows()
+
+    def insert_issue(self, row: int, issue: Issue) -> None:
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._issues.insert(row, issue)
+        self.endInsertRows()
+
+    def remove_issue(self, row: int) -> Issue:
+        self.beginRemoveRows(QModelIndex(), row, row)
+        issue = self._issues.pop(row)
+        self.endRemoveRows()
+        return issue
+
+    def insert_issues(self, rows: list[int], issues: list[Issue]) -> None:
+        """Insert `issues` so that they end up in `rows` (ascending), all in
+        one layout change."""
+        if len(rows) == 1:
+            self.insert_issue(rows[0], issues[0])
+            return
+        self.layoutAboutToBeChanged.emit()
+        old_issues = iter(self._issues[:])
+        merged = []
+        for row, issue in zip(rows, issues):
+            merged.extend(islice(old_issues, row - len(merged)))
+            merged.append(issue)
+        merged.extend(old_issues)
+        self._issues[:] = merged
+        inserted = set(rows)
+        self._change_persistent_rows(
+            [row for row in range(len(merged)) if row not in inserted]
+        )
+        self.issues_inserted.emit(rows)
+        self.layoutChanged.emit()
+
+    def remove_issues(self, rows: list[int]) -> list[Issue]:
+        """Remove the issues in `rows` (ascending), all in one layout change.
+        Answer the removed issues."""
+        if len(rows) == 1:
+            return [self.remove_issue(rows[0])]
+        self.layoutAboutToBeChanged.emit()
+        removed = [self._issues[row] for row in rows]
+        new_rows = rows_after_removal(len(self._issues), rows)
+        self._issues[:] = [
+            issue
+            for issue, new_row in zip(self._issues, new_rows)
+            if new_row is not None
+        ]
+        self._change_persistent_rows(new_rows)
+        self.issues_removed.emit(rows, removed)
+        self.layoutChanged.emit()
+        return removed
+
+    def _change_persistent_rows(self, new_rows: list[Optional[int]]) -> None:
+        persistent = self.persistentIndexList()
+        self.changePersistentIndexList(
+            persistent,
+            [
+                QModelIndex()
+                if new_rows[index.row()] is None
+                else self.index(new_rows[index.row()], index.column())
+                for index in persistent
+            ],
+        )
+
+
+def rows_after_removal(row_count: int, removed: list[int]) -> list[Optional[int]]:
+    """Answer the new number of every row when the rows `removed` (ascending)
+    are taken out of `row_count` rows, None for the removed ones."""
+    new_rows: list[Optional[int]] = []
+    start = 0
+    for shift, row in enumerate(removed):
+        new_rows.extend(range(start - shift, row - shift))
+        new_rows.append(None)
+        start = row + 1
+    new_rows.extend(range(start - len(removed), row_count - len(removed)))
+    return new_rows
@@ -0,0 +1,281 @@
+"""Loading issues, importing and exporting issue files on a worker thread.
+
+`IssueLoader`, `IssueImporter` and `IssueExporter` are worker objects in the style of
+`threads.counter.Counter`: move one to a `QThread`, connect its signals and
+invoke `run` through a queued connection (or `start_worker`).  They report
+progress in percent, stop early when the thread is asked to interrupt
+(`QThread.requestInterruption`) and always end with `finished` or `failed`.
+
+The loader hands over the issues of a database page by page, the first
+page small so that it can be shown right away.  It reads no further ahead
+of the receiver than `rows_ahead` issues, so the receiver sets the pace and
+its backlog stays bounded.  Given the path of a saved search index, it then
+loads that index, or builds one if it is missing or out of date, and hands
+it over too.
+The importer hands over the issues in batches of `batch_size`, so at most
+one batch is in memory besides what the receiver keeps.  Every batch is
+checked against the `validators.ISSUE_RULES` first: the invalid issues are
+left out, and `validated` reports them once the import ends.  With a
+database each batch is saved before it is handed over.  The exporter writes to a
+temporary file that only replaces the target when the export is complete.
+"""
+
+import os
+from abc import abstractmethod
+from typing import Callable, Iterable, Optional
+
+from peewee import DatabaseError
+from PySide6.QtCore import (
+    QCoreApplication,
+    QEventLoop,
+    QObject,
+    QSemaphore,
+    Qt,
+    QThread,
+    Signal,
+    Slot,
+)
+
+from issue_tracker.issue import Issue
+from issue_tracker.issue_db import IssueDB
+from issue_tracker.issue_io import read_issues, write_issues
+from issue_tracker.search_index import SearchIndex
+from issue_tracker.validators import ValidationReport, check_issues
+
+
+class _Interrupted(Exception):
+    pass
+
+
+class _Worker(QObject):
+    progress = Signal(int)  # percent
+    finished = Signal(int)  # number of issues transferred
+    failed = Signal(str)  # error message
+
+    def __init__(self, path: str, database: Optional[IssueDB] = None, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.count = 0
+        self._database = database
+        self._percent = -1
+
+    @Slot()
+    def run(self):
+        try:
+            self._transfer()
+        except _Interrupted:
+            self.finished.emit(self.count)
+        except (OSError, ValueError, DatabaseError) as e:
+            self.failed.emit(str(e))
+        else:
+            self.finished.emit(self.count)
+        finally:
+            if self._database is not None:
+                # the connection of this thread only
+                self._database.close()
+
+    # not enforced: Qt creates QObjects without checking for abstract methods
+    @abstractmethod
+    def _transfer(self):
+        """Transfer the issues, calling `_report` as it goes."""
+
+    def _report(self, done: int, total: int) -> None:
+        """Emit the progress when the percentage changes, and stop if the
+        thread is asked to."""
+        self._check_interrupted()
+        percent = 100 * done // total if total else 100
+        if percent != self._percent:
+            self._percent = percent
+            self.progress.emit(percent)
+
+    def _check_interrupted(self) -> None:
+        if QThread.currentThread().isInterruptionRequested():
+            raise _Interrupted
+
+
+class IssueLoader(_Worker):
+    first_page_size = 100
+    page_size = 5_000
+    rows_ahead = 10_000
+
+    issues_read = Signal(list)  # a page of issues
+    # the SearchIndex of the issues read, keyed by id, after the last page
+    search_index_read = Signal(object)
+
+    def __init__(
+        self,
+        database: IssueDB,
+        search_index_path: Optional[str] = None,
+        parent=None,
+    ):
+        super().__init__(database.path, database, parent)
+        self._unused = QSemaphore(self.rows_ahead)
+        self._search_index_path = search_index_path
+
+    def issues_used(self, count: int) -> None:
+        """The receiver is done with `count` issues it was handed, read as
+        many more.  Can be called from any thread."""
+        self._unused.release(count)
+
+    def _transfer(self):
+        stamp = self._database.stamp()
+        total, last_id = stamp
+        page_size = self.first_page_size
+        issues = self._database.iter_all()
+        while True:
+            self._wait_for_receiver(min(page_size, self.rows_ahead), total)
+            page = []
+            for issue in issues:
+                if issue.id > last_id:
+                    break  # added since the loading started, already shown
+                page.append(issue)
+                if len(page) == page_size:
+                    break
+            if page:
+                self._hand_over(page)
+                self._report(self.count, total)
+            if len(page) < page_size:
+                break
+            page_size = self.page_size
+        if self._search_index_path is not None:
+            self.search_index_read.emit(self._search_index(stamp))
+
+    def _search_index(self, stamp) -> SearchIndex:
+        """Answer the index saved for the issues identified by `stamp`, else
+        build one.  A loaded index file is removed (the window writes it
+        again on a clean exit), so an index that missed some changes is never
+        used twice."""
+        index = SearchIndex.load(self._search_index_path, stamp)
+        if index is not None:
+            os.remove(self._search_index_path)
+            return index
+        return SearchIndex.build(
+            (issue.id, issue) for issue in self._issues_to_index(stamp[1])
+        )
+
+    def _issues_to_index(self, last_id: int) -> Iterable[Issue]:
+        for count, issue in enumerate(self._database.iter_all()):
+            if issue.id > last_id:
+                return
+            if count % 1000 == 0:
+                self._check_interrupted()
+            yield issue
+
+    def _wait_for_receiver(self, count: int, total: int) -> None:
+        # until `count` more issues may be read, stopping if asked to
+        while not self._unused.tryAcquire(count, 50):
+            self._report(self.count, total)
+
+    def _hand_over(self, page: list[Issue]) -> None:
+        self.count += len(page)
+        self.issues_read.emit(page)
+
+
+class IssueImporter(_Worker):
+    batch_size = 10_000
+
+    issues_read = Signal(list)  # a batch of valid issues
+    # the ValidationReport on all records read, emitted before finished
+    validated = Signal(object)
+
+    def __init__(self, path: str, database: Optional[IssueDB] = None, parent=None):
+        super().__init__(path, database, parent)
+        self.report = ValidationReport()
+
+    def _transfer(self):
+        size = os.path.getsize(self.path)
+        batch: list[Issue] = []
+        try:
+            for issue in read_issues(
+                self.path, lambda position: self._report(position, size)
+            ):
+                batch.append(issue)
+                if len(batch) == self.batch_size:
+                    self._hand_over(batch)
+                    batch = []
+        finally:
+            # whatever was read completely is kept, also when interrupted
+            if batch:
+                self._hand_over(batch)
+            self.validated.emit(self.report)
+
+    def _hand_over(self, batch: list[Issue]) -> None:
+        report = check_issues(batch)
+        if report.failures:
+            invalid = report.failed_indexes()
+            batch = [issue for i, issue in enumerate(batch) if i not in invalid]
+        self.report.add(report)
+        if not batch:
+            return
+        if self._database is not None:
+            self._database.save_all(batch)
+        self.count += len(batch)
+        self.issues_read.emit(batch)
+
+
+class IssueExporter(_Worker):
+    def __init__(
+        self,
+        path: str,
+        issues: Iterable[Issue],
+        total: int,
+        database: Optional[IssueDB] = None,
+        parent=None,
+    ):
+        """Write `total` `issues` to `path`.  `issues` is iterated on the
+        worker thread: a copy of a list that may change meanwhile, or
+        `database.iter_all()`."""
+        super().__init__(path, database, parent)
+        self._issues = issues
+        self._total = total
+
+    def _transfer(self):
+        def report(count):
+            self.count = count
+            self._report(count, self._total)
+
+        root, extension = os.path.splitext(self.path)
+        temporary = f"{root}.part{extension}"
+        try:
+            self.count = write_issues(temporary, self._issues, report)
+            os.replace(temporary, self.path)
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+
+
+def start_worker(
+    worker: _Worker, finished: Optional[Callable[[], None]] = None
+) -> QThread:
+    """Run `worker` on a new thread that quits when the worker is done and
+    then calls `finished`.  Answer the thread; keep it and the worker until
+    the thread has finished.
+
+    Wait for the thread with an event loop rather than `QThread.wait()`:
+    the worker's signals are queued to the waiting thread, and only its
+    event loop delivers them; a thread blocked in wait() would miss the
+    last progress and `finished` until it returns to its event loop."""
+    thread = QThread()
+    worker.moveToThread(thread)
+    thread.started.connect(worker.run)
+    for signal in (worker.finished, worker.failed):
+        # directly: the thread lives where someone may be waiting for it
+        signal.connect(thread.quit, Qt.ConnectionType.DirectConnection)
+    thread.finished.connect(worker.deleteLater)
+    if finished is not None:
+        thread.finished.connect(finished)
+    thread.start()
+    return thread
+
+
+def wait_for(thread: Optional[QThread]) -> None:
+    """Wait until `thread` (None if there is none) has finished and what it
+    sent has been delivered (see `start_worker`)."""
+    if thread is None:
+        return
+    loop = QEventLoop()
+    thread.finished.connect(loop.quit)
+    if thread.isRunning():
+        loop.exec()
+    QCoreApplication.processEvents()
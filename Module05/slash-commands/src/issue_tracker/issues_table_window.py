@@ -1,140 +1,864 @@
+import logging
+import os
 import sys
+import time
+from typing import Optional
 
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QApplication, QMainWindow, QTableWidgetItem
+from event_loop_monitor import EventLoopMonitor, timed_slot
+from PySide6.QtCore import (
+    QItemSelection,
+    QItemSelectionModel,
+    Qt,
+    QTimer,
+)
+from PySide6.QtGui import QKeySequence, QUndoStack
+from PySide6.QtWidgets import (
+    QApplication,
+    QDockWidget,
+    QFileDialog,
+    QMainWindow,
+    QMessageBox,
+    QProgressBar,
+    QProgressDialog,
+)
 
+from issue_tracker.facet_panel import FacetPanel
 from issue_tracker.issue import Issue, Priority, Status
+from issue_tracker.issue_commands import (
+    AddIssueCommand,
+    EditIssueCommand,
+    EditIssuesCommand,
+    RemoveIssueCommand,
+    RemoveIssuesCommand,
+)
+from issue_tracker.issue_db import IssueDB
+from issue_tracker.issue_editor import IssueForm
+from issue_tracker.issue_history import IssueHistory, describe
+from issue_tracker.issue_io import file_format
+from issue_tracker.issue_sort_filter_model import IssueSortFilterModel
+from issue_tracker.issue_table_model import IssueTableModel
+from issue_tracker.issue_transfer import (
+    IssueExporter,
+    IssueImporter,
+    IssueLoader,
+    start_worker,
+    wait_for,
+)
 from issue_tracker.sample_issues import get_samples
+from issue_tracker.search_index import SearchIndex
+from issue_tracker.validators import check_values
 from ui.main_window import Ui_MainWindow
 
 
 class IssuesTableWindow(QMainWindow, Ui_MainWindow):
-    def __init__(self, parent=None):
+    # column widths are computed from this many rows instead of all of them
+    resize_contents_precision = 100
+    # search once typing pauses for this long
+    search_delay_ms = 150
+    # the number of edits that can be undone
+    undo_limit = 1000
+    # selections of more rows than this are put aside while many issues
+    # change at once and selected again afterwards, that is much cheaper than
+    # Qt moving every selected cell through the change
+    large_selection_rows = 1000
+    # issues loaded from the database are added to the table at most once
+    # per frame, as many as take about that long
+    load_frame_ms = 16
+    # the most recent changes shown in an issue's history
+    history_lines = 30
+
+    def __init__(
+        self,
+        database: Optional[IssueDB] = None,
+        parent=None,
+        *,
+        issues: Optional[list[Issue]] = None,
+    ):
+        """Show the issues stored in `database`, or without a database
+        `issues` (by default some sample issues) that are not saved anywhere.
+        The issues of a database are loaded on a worker thread and shown as
+        they come in."""
         super().__init__(parent)
+        if database is not None and issues is not None:
+            raise ValueError("the issues of a database are loaded from it")
 
-        self._issues = get_samples()
+        self._database = database
+        if database is not None:
+            self._issues = []
+        else:
+            self._issues = get_samples() if issues is None else issues
+        self._history = None if database is None else IssueHistory(database)
 
         self.setupUi(self)
+        self._setup_file_menu()
+        self._setup_undo()
         self._setup_combo_boxes()
+        self._setup_form()
         self._setup_issues_table()
+        self._setup_facet_panel()
+        self._setup_search()
+        self._setup_loading()
         self._connect_widgets()
 
+    def _setup_file_menu(self):
+        self._transfer_thread = None
+        self._transfer_worker = None
+        self._import_report = None
+        file_menu = self.menubar.addMenu(self.tr("&File"))
+        self._import_action = file_menu.addAction(self.tr("&Import Issues..."))
+        self._import_action.triggered.connect(self._import_issues)
+        self._export_action = file_menu.addAction(self.tr("&Export Issues..."))
+        self._export_action.triggered.connect(self._export_issues)
+
+    def _setup_undo(self):
+        self._undo_stack = QUndoStack(self)
+        self._undo_stack.setUndoLimit(self.undo_limit)
+        undo_action = self._undo_stack.createUndoAction(self, self.tr("&Undo"))
+        undo_action.setShortcuts(QKeySequence.StandardKey.Undo)
+        redo_action = self._undo_stack.createRedoAction(self, self.tr("&Redo"))
+        redo_action.setShortcuts(QKeySequence.StandardKey.Redo)
+        edit_menu = self.menubar.addMenu(self.tr("&Edit"))
+        edit_menu.addAction(undo_action)
+        edit_menu.addAction(redo_action)
+        edit_menu.addSeparator()
+        self._history_action = edit_menu.addAction(self.tr("Issue &History..."))
+        self._history_action.setEnabled(self._history is not None)
+        self._history_action.triggered.connect(self._show_history)
+        if self._history is not None:
+            self._history.failed.connect(self._history_failed)
+        # the issues deleted keep their ids, so that an undone delete
+        # restores them under the same id, with their history
+        self._deleted_ids: set[int] = set()
+
+    def undo_stack(self) -> QUndoStack:
+        return self._undo_stack
+
+    def history(self) -> Optional[IssueHistory]:
+        """The changes to the issues, None without a database."""
+        return self._history
+
+    @timed_slot
+    def _show_history(self):
+        issue = self._get_selected_issue()
+        if issue is None or issue.id is None:
+            return
+        lines = describe(self._history.history(issue.id))
+        QMessageBox.information(
+            self,
+            self.tr("History of “{0}”").format(issue.title),
+            "\n".join(lines[-self.history_lines :]) or self.tr("No changes"),
+        )
+
+    def _history_failed(self, message):
+        self.statusbar.showMessage(
+            self.tr("Could not record the changes: {0}").format(message)
+        )
+
     def _setup_combo_boxes(self):
         for p in Priority:
             self.priority_combo.addItem(p.name, p)
         for s in Status:
             self.status_combo.addItem(s.name, s)
+        self.status_filter_combo.addItem(self.tr("All"), None)
+        for s in Status:
+            self.status_filter_combo.addItem(s.name, s)
+        self.priority_filter_combo.addItem(self.tr("All"), None)
+        for p in Priority:
+            self.priority_filter_combo.addItem(p.name, p)
+        self._update_assignee_filter_items()
+
+    def _setup_form(self):
+        # saving an issue only edits the fields changed since it was shown
+        self._form = IssueForm(
+            self.title_edit,
+            self.status_combo,
+            self.priority_combo,
+            self.assigned_to_edit,
+            self.notes_plain_text,
+        )
+
+    def _update_assignee_filter_items(self):
+        current = self.assignee_filter_combo.currentData()
+        self.assignee_filter_combo.blockSignals(True)
+        self.assignee_filter_combo.clear()
+        self.assignee_filter_combo.addItem(self.tr("All"), None)
+        for name in sorted({issue.assigned_to or "" for issue in self._issues}):
+            self.assignee_filter_combo.addItem(name, name)
+        self.assignee_filter_combo.setCurrentIndex(
+            max(0, self.assignee_filter_combo.findData(current))
+        )
+        self.assignee_filter_combo.blockSignals(False)
 
     def _setup_issues_table(self):
-        self._update_issues_table()
+        self._model = IssueTableModel(self._issues, self)
+        self._put_aside_selection = None
+        # connected before the sorted model so that the search results and
+        # ids are up to date when it decides where (and whether) to show rows
+        self._model.issues_edited.connect(self._issues_changed)
+        self._model.layoutAboutToBeChanged.connect(
+            lambda: self._put_selection_aside(self._get_selected_rows())
+        )
+        self._model.rowsInserted.connect(
+            lambda parent, first, last: self._issues_added(
+                self._issues[first : last + 1]
+            )
+        )
+        self._model.issues_inserted.connect(
+            lambda rows: self._issues_added([self._issues[row] for row in rows])
+        )
+        self._model.rowsAboutToBeRemoved.connect(
+            lambda parent, first, last: self._issues_removed(
+                self._issues[first : last + 1]
+            )
+        )
+        self._model.issues_removed.connect(
+            lambda rows, issues: self._issues_removed(issues)
+        )
+        self._sorted_model = IssueSortFilterModel(self)
+        self._sorted_model.setSourceModel(self._model)
+        # and these after it, when it shows the changed rows
+        self._model.dataChanged.connect(self._restore_selection)
+        self._model.layoutChanged.connect(self._restore_selection)
+        self._sorted_model.rowsInserted.connect(self._sorted_rows_inserted)
+        self._sorted_model.dataChanged.connect(
+            lambda top_left, bottom_right: self._fit_columns_to_rows(
+                top_left.row(), bottom_right.row()
+            )
+        )
+        self.issues_table.setModel(self._sorted_model)
+        header = self.issues_table.horizontalHeader()
+        header.setResizeContentsPrecision(self.resize_contents_precision)
+        header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.issues_table.setSortingEnabled(True)
+        self.issues_table.resizeColumnsToContents()
+
+    def _setup_facet_panel(self):
+        self._facet_panel = FacetPanel()
+        self._facet_panel.set_model(self._model)
+        self._facet_panel.value_activated.connect(self._facet_value_activated)
+        dock = QDockWidget(self.tr("Counts"), self)
+        dock.setObjectName("facet_dock")
+        dock.setWidget(self._facet_panel)
+        self.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea, dock)
+
+    @timed_slot
+    def _facet_value_activated(self, column, value):
+        combo = {
+            IssueTableModel.STATUS_COLUMN: self.status_filter_combo,
+            IssueTableModel.PRIORITY_COLUMN: self.priority_filter_combo,
+            IssueTableModel.ASSIGNED_TO_COLUMN: self.assignee_filter_combo,
+        }[column]
+        combo.setCurrentIndex(combo.findData(value))
+
+    def _setup_search(self):
+        """Index the sample issues.  The index of a database is loaded or
+        built by the loader thread; until it arrives the search box is off
+        and the keys of the issues changed meanwhile are kept, to re-index
+        them then."""
+        # the rank of each matching issue's key while searching
+        self._search_ranks = None
+        self._search_index = None
+        self._search_index_changes = set()
+        if self._database is None:
+            self._search_index = SearchIndex.build(
+                (self._search_key(issue), issue) for issue in self._issues
+            )
+        else:
+            self.search_edit.setEnabled(False)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.search_delay_ms)
+        self._search_timer.timeout.connect(self._search)
+
+    def _setup_loading(self):
+        self._load_thread = None
+        self._load_worker = None
+        self._loaded_issues = []
+        self._load_rows_per_frame = IssueLoader.first_page_size
+        self._appending_loaded_issues = False
+        self._load_timer = QTimer(self)
+        self._load_timer.setSingleShot(True)
+        self._load_timer.setInterval(self.load_frame_ms)
+        self._load_timer.timeout.connect(self._append_loaded_issues)
+        self._load_progress = QProgressBar()
+        self._load_progress.setMaximumWidth(200)
+        self._load_progress.setFormat(self.tr("Loading issues %p%"))
+        self._load_progress.hide()
+        self.statusbar.addPermanentWidget(self._load_progress)
+        if self._database is not None:
+            self._start_loading()
+
+    def _start_loading(self):
+        worker = IssueLoader(self._database, self._search_index_path())
+        worker.issues_read.connect(self._issues_loaded)
+        worker.search_index_read.connect(self._search_index_read)
+        worker.progress.connect(self._load_progress.setValue)
+        worker.failed.connect(self._loading_failed)
+        self._load_progress.setValue(0)
+        self._load_progress.show()
+        self._import_action.setEnabled(False)
+        self._export_action.setEnabled(False)
+        self._load_worker = worker
+        self._load_thread = start_worker(worker, self._loading_done)
+
+    @timed_slot
+    def _issues_loaded(self, issues):
+        """Add the loaded `issues` now if none were added this frame, else
+        in the frames to come."""
+        self._loaded_issues.extend(issues)
+        if not self._load_timer.isActive():
+            self._append_loaded_issues()
+
+    @timed_slot
+    def _append_loaded_issues(self):
+        """Add as many of the loaded issues as the table takes in about a
+        frame, and have the rest added in the next one."""
+        if not self._loaded_issues:
+            if self._load_thread is None:
+                self._loading_finished()
+            return
+        issues = self._loaded_issues[: self._load_rows_per_frame]
+        del self._loaded_issues[: len(issues)]
+        start = time.perf_counter()
+        self._appending_loaded_issues = True
+        try:
+            self._model.append_issues(issues)
+        finally:
+            self._appending_loaded_issues = False
+        if self._load_worker is not None:
+            self._load_worker.issues_used(len(issues))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        # at most twice as many next time, the time per issue varies
+        self._load_rows_per_frame = max(
+            IssueLoader.first_page_size,
+            min(
+                2 * len(issues),
+                int(len(issues) * self.load_frame_ms / max(elapsed_ms, 0.1)),
+            ),
+        )
+        self._load_timer.start()
+
+    def _loading_failed(self, message):
+        QMessageBox.warning(self, self.tr("Loading Issues Failed"), message)
+
+    def _loading_done(self):
+        # the issues read so far are still added
+        self._load_thread.wait()
+        self._load_thread = None
+        self._load_worker = None
+        if not self._load_timer.isActive():
+            self._append_loaded_issues()
+
+    def _loading_finished(self):
+        self._load_progress.hide()
+        self._import_action.setEnabled(True)
+        self._export_action.setEnabled(True)
+
+    def wait_for_loading(self):
+        """Wait until all issues of the database are shown."""
+        wait_for(self._load_thread)
+        while self._loaded_issues:
+            self._append_loaded_issues()
+        self._load_timer.stop()
+        self._append_loaded_issues()
+
+    @timed_slot
+    def _search_index_read(self, index):
+        changed = self._search_index_changes
+        issues = {
+            key: issue
+            for issue in self._issues
+            if (key := self._search_key(issue)) in changed
+        }
+        for key in changed:
+            if key in issues:
+                index.update(key, issues[key])
+            elif key in index:
+                index.remove(key)
+        self._search_index = index
+        self._search_index_changes = set()
+        self.search_edit.setEnabled(True)
+
+    def _search_index_path(self):
+        return self._database.path + ".search"
+
+    def _search_key(self, issue):
+        # issues without a database have no id
+        return id(issue) if self._database is None else issue.id
+
+    @timed_slot
+    def _search(self):
+        """Show only the matching issues, the best match first."""
+        text = self.search_edit.text()
+        if not text.strip():
+            self._search_ranks = None
+            self._sorted_model.set_issue_filter(None)
+            self.statusbar.clearMessage()
+            return
+        start = time.perf_counter()
+        self._rank_search_matches()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._sorted_model.set_issue_filter(
+            lambda issue: self._search_key(issue) in self._search_ranks,
+            # issues kept visible while searching come after the matches
+            lambda issue: self._search_ranks.get(
+                self._search_key(issue), len(self._search_ranks)
+            ),
+        )
+        self.statusbar.showMessage(
+            self.tr("{0} matches ({1:.1f} ms)").format(
+                len(self._search_ranks), elapsed_ms
+            )
+        )
+
+    def _rank_search_matches(self):
+        self._search_ranks = {
+            key: rank
+            for rank, key in enumerate(
+                self._search_index.search(self.search_edit.text())
+            )
+        }
+
+    def _index_issues(self, issues):
+        """Add or re-index `issues`, or note them for the index to come."""
+        if self._search_index is None:
+            self._search_index_changes.update(map(self._search_key, issues))
+            return
+        for issue in issues:
+            self._search_index.update(self._search_key(issue), issue)
+
+    def _unindex_issues(self, issues):
+        if self._search_index is None:
+            self._search_index_changes.update(map(self._search_key, issues))
+            return
+        for issue in issues:
+            self._search_index.remove(self._search_key(issue))
+
+    @timed_slot
+    def _import_issues(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self,
+            self.tr("Import Issues"),
+            "",
+            self.tr("Issue files (*.csv *.jsonl)"),
+        )
+        if path:
+            self.import_issues(path)
+
+    def import_issues(self, path):
+        """Append the issues stored in the file at `path`.  The file is read
+        on a worker thread and the issues are added batch by batch."""
+        worker = IssueImporter(path, self._database)
+        worker.issues_read.connect(self._model.append_issues)
+        worker.validated.connect(self._import_validated)
+        worker.finished.connect(self._import_finished)
+        self._start_transfer(
+            worker, self.tr("Importing {0}...").format(os.path.basename(path))
+        )
+
+    def _import_validated(self, report):
+        self._import_report = report
+
+    @timed_slot
+    def _import_finished(self, count):
+        failures = self._import_report.failures
+        self._import_report = None
+        if not failures:
+            self.statusbar.showMessage(self.tr("Imported {0} issues").format(count))
+            return
+        skipped = len({failure.index for failure in failures})
+        self.statusbar.showMessage(
+            self.tr("Imported {0} issues, skipped {1} invalid").format(count, skipped)
+        )
+        QMessageBox.warning(
+            self,
+            self.tr("Invalid Issues Skipped"),
+            "\n".join(str(failure) for failure in failures[:10]),
+        )
+
+    @timed_slot
+    def _export_issues(self):
+        path, selected_filter = QFileDialog.getSaveFileName(
+            self,
+            self.tr("Export Issues"),
+            "issues.csv",
+            self.tr("CSV files (*.csv);;JSON Lines files (*.jsonl)"),
+        )
+        if not path:
+            return
+        try:
+            file_format(path)
+        except ValueError:
+            path += ".jsonl" if "jsonl" in selected_filter else ".csv"
+        self.export_issues(path)
+
+    def export_issues(self, path):
+        """Write all issues to the file at `path` on a worker thread."""
+        if self._database is None:
+            issues, total = list(self._issues), len(self._issues)
+        else:
+            # streamed from the database, which holds the same issues
+            issues, total = self._database.iter_all(), self._database.count()
+        worker = IssueExporter(path, issues, total, self._database)
+        worker.finished.connect(self._export_finished)
+        self._start_transfer(
+            worker, self.tr("Exporting {0}...").format(os.path.basename(path))
+        )
+
+    @timed_slot
+    def _export_finished(self, count):
+        self.statusbar.showMessage(self.tr("Exported {0} issues").format(count))
+
+    def _start_transfer(self, worker, label):
+        """Run the import or export `worker` with a progress dialog.  The
+        signals are connected to methods of objects living in this thread,
+        so they are delivered here and not on the worker's thread."""
+        self._transfer_progress = QProgressDialog(
+            label, self.tr("Cancel"), 0, 100, self
+        )
+        self._transfer_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self._transfer_progress.setMinimumDuration(500)
+        worker.progress.connect(self._transfer_progress.setValue)
+        worker.failed.connect(self._transfer_failed)
+        self._import_action.setEnabled(False)
+        self._export_action.setEnabled(False)
+        # keep the worker, or it is gone before its thread gets to it
+        self._transfer_worker = worker
+        self._transfer_thread = start_worker(worker, self._transfer_done)
+        self._transfer_progress.canceled.connect(
+            self._transfer_thread.requestInterruption
+        )
+
+    def _transfer_failed(self, message):
+        QMessageBox.warning(self, self.tr("Issue Transfer Failed"), message)
+
+    def _transfer_done(self):
+        # the thread has finished running, let it end before dropping it
+        self._transfer_thread.wait()
+        self._transfer_thread = None
+        self._transfer_worker = None
+        self._transfer_progress.reset()
+        self._transfer_progress.deleteLater()
+        self._import_action.setEnabled(True)
+        self._export_action.setEnabled(True)
+
+    def wait_for_transfer(self):
+        """Wait until the import or export in progress, if any, is done and
+        its results have been delivered."""
+        wait_for(self._transfer_thread)
+
+    def closeEvent(self, event):
+        for thread in (self._load_thread, self._transfer_thread):
+            if thread is not None:
+                thread.requestInterruption()
+                wait_for(thread)
+        self._loaded_issues.clear()
+        if self._history is not None:
+            self._history.close()
+        if self._database is not None and self._search_index is not None:
+            self._search_index.save(self._search_index_path(), self._database.stamp())
+        super().closeEvent(event)
 
     def _connect_widgets(self):
         self.save_button.clicked.connect(self._save_button_clicked)
         self.cancel_button.clicked.connect(self._cancel_button_clicked)
-        self.issues_table.itemSelectionChanged.connect(
+        self.issues_table.selectionModel().selectionChanged.connect(
             self._issues_table_item_selection_changed
         )
         self.new_issue_button.clicked.connect(self._new_issue_button_clicked)
         self.delete_issue_button.clicked.connect(self._delete_issue_button_clicked)
+        self.search_edit.textChanged.connect(self._search_timer.start)
+        for column, combo in [
+            (IssueTableModel.STATUS_COLUMN, self.status_filter_combo),
+            (IssueTableModel.PRIORITY_COLUMN, self.priority_filter_combo),
+            (IssueTableModel.ASSIGNED_TO_COLUMN, self.assignee_filter_combo),
+        ]:
+            combo.currentIndexChanged.connect(
+                lambda _, column=column, combo=combo: self._filter_changed(
+                    column, combo.currentData()
+                )
+            )
 
-    def _update_ui(self):
-        """Make all objects changes visible in the UI.
+    def _filter_changed(self, column, value):
+        self._sorted_model.set_filter(column, None if value is None else [value])
 
-        Currently only the issues table needs to be updated..."""
-        self._update_issues_table()
+    @timed_slot
+    def _sorted_rows_inserted(self, parent, first, last):
+        # the first issues loaded set the column widths, measuring all the
+        # others would slow down loading
+        if (
+            not self._appending_loaded_issues
+            or self._sorted_model.rowCount() == last - first + 1
+        ):
+            self._fit_columns_to_rows(first, last)
 
-    def _update_issues_table(self):
-        self.issues_table.setRowCount(len(self._issues))
-        for row, issue in enumerate(self._issues):
-            for column, widget_item in enumerate(
-                self._issue_to_table_widget_items(issue)
-            ):
-                self.issues_table.setItem(row, column, widget_item)
-        self.issues_table.resizeColumnsToContents()
+    def _fit_columns_to_rows(self, first, last):
+        """Widen the columns that are too narrow for the rows `first` to
+        `last` of the table.  Only changed rows are measured, the widths of
+        all the others are already known, and at most
+        `resize_contents_precision` of them."""
+        last = min(last, first + self.resize_contents_precision - 1)
+        for column in range(self._sorted_model.columnCount()):
+            width = max(
+                self.issues_table.sizeHintForIndex(
+                    self._sorted_model.index(row, column)
+                ).width()
+                for row in range(first, last + 1)
+            )
+            if width > self.issues_table.columnWidth(column):
+                self.issues_table.setColumnWidth(column, width)
+
+    @timed_slot
+    def _issues_changed(self, rows, fields):
+        """Keep the database, the search index and the form in step with the
+        issues model, whether the change is new, undone or redone."""
+        selected = self._get_selected_rows()
+        self._put_selection_aside(selected)
+        issues = [self._issues[row] for row in rows]
+        if self._database is not None:
+            self._database.update_all(issues, fields)
+            self._history.record(issues, fields)
+        if fields is None or not fields.isdisjoint(("title", "notes")):
+            self._index_issues(issues)
+            if self._search_ranks is not None:
+                self._rank_search_matches()
+        # a selection put aside is shown again once it is restored
+        if self._put_aside_selection is None and not set(rows).isdisjoint(selected):
+            self._show_selected_issues(selected)
+        self._issues_added_or_changed(issues)
+
+    def _issues_added(self, issues):
+        loaded = self._appending_loaded_issues
+        if self._database is not None and not loaded:
+            self._save_added_issues(issues)
+        # loaded issues are in the index of the database already
+        if not loaded:
+            self._index_issues(issues)
+            if self._search_ranks is not None:
+                # keep new issues visible while searching
+                for issue in issues:
+                    self._search_ranks.setdefault(
+                        self._search_key(issue), len(self._search_ranks)
+                    )
+        self._issues_added_or_changed(issues)
+
+    def _save_added_issues(self, issues):
+        # new issues are saved, imported ones have been by the importer
+        restored = [issue for issue in issues if issue.id in self._deleted_ids]
+        self._database.save_all(issue for issue in issues if issue.id is None)
+        self._database.restore_all(restored)
+        restored_ids = {issue.id for issue in restored}
+        self._deleted_ids -= restored_ids
+        # the fields as created are those of the issue unless changed since
+        self._history.record_event(
+            (issue for issue in issues if issue.id not in restored_ids), "created"
+        )
+        self._history.record_event(restored, "restored")
+
+    def _issues_removed(self, issues):
+        self._unindex_issues(issues)
+        if self._database is not None:
+            self._history.record_event(issues, "deleted")
+            self._database.delete_all(issues, forget_ids=False)
+            self._deleted_ids.update(issue.id for issue in issues)
 
-    def _issue_to_table_widget_items(self, issue):
-        title_item = QTableWidgetItem(issue.title)
-        title_item.setData(Qt.ItemDataRole.UserRole, issue)
-        return [
-            title_item,
-            QTableWidgetItem(issue.status.name),
-            QTableWidgetItem(issue.priority.name),
-            QTableWidgetItem(issue.assigned_to),
-        ]
+    def _issues_added_or_changed(self, issues):
+        names = {issue.assigned_to or "" for issue in issues}
+        if any(self.assignee_filter_combo.findData(name) < 0 for name in names):
+            self._update_assignee_filter_items()
 
+    @timed_slot
     def _save_button_clicked(self):
-        selected = self._get_selected_issue()
-        if selected is None:
+        rows = self._get_selected_rows()
+        if not rows:
             return
-        self._update_issue_from_form(selected)
+        values = self._form_values() if len(rows) == 1 else self._bulk_form_values()
+        failures = check_values(values)
+        if failures:
+            self.statusbar.showMessage(failures[0].message.capitalize())
+            return
+        if len(rows) == 1:
+            command = EditIssueCommand(self._model, rows[0], values)
+        else:
+            command = EditIssuesCommand(self._model, rows, values)
+        if not command.is_empty():
+            self._undo_stack.push(command)
 
+    @timed_slot
     def _cancel_button_clicked(self):
         self._issues_table_item_selection_changed()
 
+    @timed_slot
     def _new_issue_button_clicked(self):
-        self._issues.append(Issue("New Issue", Status.NEW, Priority.MEDIUM, None, ""))
-        self._update_ui()
-        self.issues_table.selectRow(len(self._issues) - 1)
+        command = AddIssueCommand(
+            self._model, Issue("New Issue", Status.NEW, Priority.MEDIUM, None, "")
+        )
+        self._undo_stack.push(command)
+        index = self._sorted_model.mapFromSource(self._model.index(command.row(), 0))
+        if index.isValid():
+            self.issues_table.selectRow(index.row())
+            self.issues_table.scrollTo(index)
 
+    @timed_slot
     def _delete_issue_button_clicked(self):
-        selected = self._get_selected_issue()
-        if selected is None:
-            return
-        self._issues.remove(selected)
-        self._update_ui()
+        rows = self._get_selected_rows()
+        if len(rows) == 1:
+            self._undo_stack.push(RemoveIssueCommand(self._model, rows[0]))
+        elif rows:
+            self._undo_stack.push(RemoveIssuesCommand(self._model, rows))
         self.issues_table.clearSelection()
 
+    def _put_selection_aside(self, rows):
+        if len(rows) <= self.large_selection_rows:
+            return
+        self._put_aside_selection = [self._issues[row] for row in rows]
+        selection_model = self.issues_table.selectionModel()
+        selection_model.blockSignals(True)
+        selection_model.clear()
+        selection_model.blockSignals(False)
+
+    def _restore_selection(self):
+        """Select the issues put aside again, wherever they are shown now."""
+        if self._put_aside_selection is None:
+            return
+        issues, self._put_aside_selection = self._put_aside_selection, None
+        source_rows = {id(issue): row for row, issue in enumerate(self._issues)}
+        positions = self._sorted_model.proxy_rows(
+            [source_rows.get(id(issue)) for issue in issues]
+        )
+        selection = QItemSelection()
+        last_column = self._sorted_model.columnCount() - 1
+        for first, last in _runs(sorted(p for p in positions if p is not None)):
+            selection.select(
+                self._sorted_model.index(first, 0),
+                self._sorted_model.index(last, last_column),
+            )
+        selection_model = self.issues_table.selectionModel()
+        selection_model.blockSignals(True)
+        selection_model.select(
+            selection, QItemSelectionModel.SelectionFlag.ClearAndSelect
+        )
+        selection_model.blockSignals(False)
+        self.issues_table.viewport().update()
+        self._issues_table_item_selection_changed()
+
+    @timed_slot
     def _issues_table_item_selection_changed(self):
-        selected = self._get_selected_issue()
-        if selected is None:
+        self._show_selected_issues(self._get_selected_rows())
+
+    def _show_selected_issues(self, rows):
+        # with several issues selected only the fields they can share are
+        # edited, the title and notes stay with each issue
+        self.title_edit.setEnabled(len(rows) < 2)
+        self.notes_plain_text.setEnabled(len(rows) < 2)
+        if not rows:
             self._clear_form()
+        elif len(rows) == 1:
+            self.show_issue(self._model.issue(rows[0]))
         else:
-            self._show_issue(selected)
+            self._show_issues([self._model.issue(row) for row in rows])
 
     def _clear_form(self):
-        self.title_edit.clear()
-        self.status_combo.setCurrentIndex(-1)
-        self.priority_combo.setCurrentIndex(-1)
-        self.notes_plain_text.clear()
-        self.assigned_to_edit.clear()
+        self._form.clear()
 
     def show_issue(self, issue):
-        self.title_edit.setText(issue.title)
-        self.status_combo.setCurrentIndex(self.status_combo.findData(issue.status))
-        self.priority_combo.setCurrentIndex(
-            self.priority_combo.findData(issue.priority)
-        )
-        self.notes_plain_text.setPlainText(issue.notes)
-        self.assigned_to_edit.setText(issue.assigned_to)
-
-    def _update_issue_from_form(self, issue):
-        issue.title = self.title_edit.text()
-        issue.status = self.status_combo.currentData()
-        issue.priority = self.priority_combo.currentData()
-        issue.notes = self.notes_plain_text.toPlainText()
-        issue.assigned_to = self.assigned_to_edit.text()
-        self._update_ui()
+        self._form.show_issue(issue)
+
+    def _show_issues(self, issues):
+        """Show the status, priority and assignee the issues have in common,
+        the fields they differ in are left blank."""
+        self._clear_form()
+        status = _common_value(issue.status for issue in issues)
+        priority = _common_value(issue.priority for issue in issues)
+        assigned_to = _common_value(issue.assigned_to for issue in issues)
+        if status is not None:
+            self.status_combo.setCurrentIndex(self.status_combo.findData(status))
+        if priority is not None:
+            self.priority_combo.setCurrentIndex(self.priority_combo.findData(priority))
+        self.assigned_to_edit.setText(assigned_to or "")
+        self.assigned_to_edit.setModified(False)
+
+    def _form_values(self):
+        """The fields of the selected issue that were changed in the form."""
+        return self._form.changed_values()
+
+    def _bulk_form_values(self):
+        """The fields to set on all selected issues: those the user filled in."""
+        values = {}
+        if self.status_combo.currentIndex() >= 0:
+            values["status"] = self.status_combo.currentData()
+        if self.priority_combo.currentIndex() >= 0:
+            values["priority"] = self.priority_combo.currentData()
+        if self.assigned_to_edit.isModified():
+            values["assigned_to"] = self.assigned_to_edit.text() or None
+        return values
+
+    def _get_selected_rows(self):
+        """Return the numbers of the selected issues' rows in the (unsorted)
+        issues model, ascending.  The selection is read range by range, so
+        selecting thousands of rows costs little."""
+        rows = set()
+        for selection_range in self.issues_table.selectionModel().selection():
+            rows.update(
+                self._sorted_model.source_rows(
+                    selection_range.top(), selection_range.bottom()
+                )
+            )
+        return sorted(rows)
+
+    def _get_selected_row(self):
+        """The user may or may not have selected a single row in the table.  If not, return None, otherwise return
+        the number of the issue's row in the (unsorted) issues model."""
+        rows = self._get_selected_rows()
+        return rows[0] if len(rows) == 1 else None
 
     def _get_selected_issue(self):
         """The user may or may not have selected a row in the table.  If not, return None, otherwise return the Issue
-        object corresponding to the selected row.  This issue is stored in UserRole data in column 0 of the selected row."""
-        selected_indices = self.issues_table.selectionModel().selectedRows()
-        assert len(selected_indices) < 2
+        object corresponding to the selected row."""
+        row = self._get_selected_row()
+        return None if row is None else self._model.issue(row)
 
-        return (
-            self.issues_table.item(selected_indices[0].row(), 0).data(
-                Qt.ItemDataRole.UserRole
-            )
-            if len(selected_indices) > 0
-            else None
-        )
+
+def _runs(rows):
+    """Answer the (first, last) pairs of the consecutive numbers in `rows`."""
+    runs = []
+    for row in rows:
+        if runs and runs[-1][1] == row - 1:
+            runs[-1][1] = row
+        else:
+            runs.append([row, row])
+    return runs
+
+
+def _common_value(values):
+    """Answer the value if all `values` are the same, otherwise None."""
+    values = set(values)
+    return values.pop() if len(values) == 1 else None
 
 
 def main():
+    """Usage: issue-tracker [DATABASE]
+
+    With ISSUE_TRACKER_MONITOR_MS set, the event loop blocking and slots
+    taking longer than that many milliseconds are logged, and the times of
+    the slots are printed at exit."""
     app = QApplication(sys.argv)
-    window = IssuesTableWindow()
+    arguments = app.arguments()[1:]
+    monitor = None
+    if os.environ.get("ISSUE_TRACKER_MONITOR_MS"):
+        logging.basicConfig()
+        monitor = EventLoopMonitor(float(os.environ["ISSUE_TRACKER_MONITOR_MS"]))
+        monitor.start()
+    database = IssueDB(arguments[0]) if arguments else None
+    window = IssuesTableWindow(database)
     window.show()
-    sys.exit(app.exec())
+    result = app.exec()
+    if monitor is not None:
+        monitor.stop()
+        print(monitor.report())
+    if database is not None:
+        database.close()
+    sys.exit(result)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,173 @@
+"""Full-text search over issue titles and notes.
+
+`SearchIndex` is an inverted index: for every word it knows the issues
+containing it and how often (words in the title count `title_weight`
+times).  The words are also kept sorted, so all words starting with a
+prefix are found with two binary searches and typing "crash" finds
+"crashes".  A search answers the issues containing every query word (or a
+word starting with it), best matches first.
+
+Changing an issue only touches the words that were added to or removed from
+it.  The index can be saved to a JSON file and loaded again together with
+a stamp identifying the issues it was built from.
+"""
+
+import json
+import math
+import re
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Hashable, Iterable, Optional
+
+from issue_tracker.issue import Issue
+
+_WORD = re.compile(r"\w+")
+_FORMAT_VERSION = 2
+
+
+def tokenize(text: str) -> list[str]:
+    return _WORD.findall(text.casefold())
+
+
+class SearchIndex:
+    title_weight = 3
+
+    def __init__(self):
+        self._postings: dict[str, dict[int, int]] = {}  # word -> key -> weight
+        self._words: list[str] = []  # the keys of _postings, sorted
+        self._documents: dict[int, dict[str, int]] = {}  # key -> word -> weight
+
+    @classmethod
+    def build(cls, issues: Iterable[tuple[int, Issue]]) -> "SearchIndex":
+        """Answer an index of the (key, issue) pairs of `issues`."""
+        index = cls()
+        for key, issue in issues:
+            index._documents[key] = index._document(issue)
+        index._index_documents()
+        return index
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._documents
+
+    def add(self, key: int, issue: Issue) -> None:
+        document = self._document(issue)
+        self._documents[key] = document
+        for word, weight in document.items():
+            self._add_posting(word, key, weight)
+
+    def remove(self, key: int) -> None:
+        for word in self._documents.pop(key):
+            self._remove_posting(word, key)
+
+    def update(self, key: int, issue: Issue) -> None:
+        """Re-index a changed issue, only the words whose weight changed are
+        touched."""
+        old = self._documents.get(key)
+        if old is None:
+            self.add(key, issue)
+            return
+        new = self._document(issue)
+        self._documents[key] = new
+        for word in old.keys() - new.keys():
+            self._remove_posting(word, key)
+        for word, weight in new.items():
+            if old.get(word) != weight:
+                self._add_posting(word, key, weight)
+
+    def search(self, text: str, limit: Optional[int] = None) -> list[int]:
+        """Answer the keys of the issues matching every word of `text`, the
+        best match first.  A word matches all words starting with it; rare
+        words count more than common ones."""
+        scores: Optional[dict[int, float]] = None
+        for term in set(tokenize(text)):
+            term_scores: dict[int, float] = {}
+            for word in self.words_with_prefix(term):
+                postings = self._postings[word]
+                idf = math.log(1 + len(self._documents) / len(postings))
+                for key, weight in postings.items():
+                    term_scores[key] = term_scores.get(key, 0.0) + weight * idf
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {
+                    key: score + term_scores[key]
+                    for key, score in scores.items()
+                    if key in term_scores
+                }
+            if not scores:
+                return []
+        if scores is None:
+            return []
+        ranked = sorted(scores, key=scores.__getitem__, reverse=True)
+        return ranked if limit is None else ranked[:limit]
+
+    def words_with_prefix(self, prefix: str) -> list[str]:
+        start = bisect_left(self._words, prefix)
+        end = bisect_left(self._words, prefix + "\U0010ffff", start)
+        return self._words[start:end]
+
+    def save(self, path: str, stamp: Hashable = None) -> None:
+        """Save the words of each issue as JSON; the rest is rebuilt from them
+        on loading.  The keys must be ints and `stamp` JSON data."""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "version": _FORMAT_VERSION,
+                    "stamp": stamp,
+                    "documents": self._documents,
+                },
+                file,
+                separators=(",", ":"),
+            )
+
+    @classmethod
+    def load(cls, path: str, stamp: Hashable = None) -> Optional["SearchIndex"]:
+        """Answer the index saved at `path`, or None if there is none, it
+        cannot be read or it was saved with a different stamp (the issues
+        have changed since)."""
+        index = cls()
+        try:
+            with open(path, encoding="utf-8") as file:
+                saved = json.load(file)
+            # a tuple stamp is saved as a list
+            if saved["version"] != _FORMAT_VERSION or saved["stamp"] != json.loads(
+                json.dumps(stamp)
+            ):
+                return None
+            index._documents = {
+                int(key): document for key, document in saved["documents"].items()
+            }
+            index._index_documents()
+        except Exception:
+            # a truncated or foreign file is only a cache miss
+            return None
+        return index
+
+    def _index_documents(self) -> None:
+        for key, document in self._documents.items():
+            for word, weight in document.items():
+                self._postings.setdefault(word, {})[key] = weight
+        self._words = sorted(self._postings)
+
+    def _document(self, issue: Issue) -> dict[str, int]:
+        document = Counter(tokenize(issue.notes))
+        for word in tokenize(issue.title):
+            document[word] += self.title_weight
+        return dict(document)
+
+    def _add_posting(self, word: str, key: int, weight: int) -> None:
+        postings = self._postings.get(word)
+        if postings is None:
+            postings = self._postings[word] = {}
+            insort(self._words, word)
+        postings[key] = weight
+
+    def _remove_posting(self, word: str, key: int) -> None:
+        postings = self._postings[word]
+        del postings[key]
+        if not postings:
+            del self._postings[word]
+            del self._words[bisect_left(self._words, word)]
@@ -1,15 +1,226 @@
+"""Validation rules for issue fields.
+
+A `Rule` is written once, as a check of a whole column of values, and
+serves everywhere an issue field is checked: a `RuleValidator` applies it
+to a line edit at every keystroke, `check_values` to the values entered in
+a form (e.g. before a bulk edit), and `check_issues` to thousands of issues
+at once (e.g. during an import).  `check_issues` runs every rule over the
+column of its field in one go, and its report tells which issues failed
+which rule and how long every rule took.
+
+`ISSUE_RULES` lists the rules for every `Issue` field, in order: a value
+is only checked by the rules after the ones it passed, so later rules can
+rely on the earlier ones (e.g. that the value is text).
+"""
+
+import time
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Optional, Sequence
+
 from PySide6.QtGui import QValidator
 
+from issue_tracker.issue import Issue, Priority, Status
+
+# the length of the title column in the database
+MAX_TITLE_LENGTH = 255
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    message: str
+    # answers the positions of the values that fail the rule
+    failures: Callable[[Sequence], list[int]]
+    # makes a failing value pass if it can
+    fixup: Optional[Callable[[Any], Any]] = None
+
+    def accepts(self, value) -> bool:
+        return not self.failures([value])
+
+
+def _failing(passes) -> list[int]:
+    return [position for position, ok in enumerate(passes) if not ok]
+
+
+def is_a(kind: type) -> Rule:
+    return Rule(
+        f"is {kind.__name__}",
+        f"must be a {kind.__name__}",
+        lambda values: _failing(type(value) is kind for value in values),
+    )
+
+
+def optional(rule: Rule) -> Rule:
+    """Answer `rule` letting None pass."""
+
+    def failures(values):
+        present = [
+            position for position, value in enumerate(values) if value is not None
+        ]
+        if len(present) == len(values):
+            return rule.failures(values)
+        failed = rule.failures([values[position] for position in present])
+        return [present[position] for position in failed]
+
+    return Rule(rule.name, rule.message, failures, rule.fixup)
+
+
+def at_most(length: int) -> Rule:
+    return Rule(
+        f"at most {length}",
+        f"must be at most {length} characters",
+        lambda values: [
+            position for position, n in enumerate(map(len, values)) if n > length
+        ],
+    )
+
+
+IS_TEXT = is_a(str)
+NOT_BLANK = Rule(
+    "not blank",
+    "must not be blank",
+    lambda values: [
+        position for position, text in enumerate(map(str.strip, values)) if not text
+    ],
+)
+TRIMMED = Rule(
+    "trimmed",
+    "must not start or end with spaces",
+    lambda values: [
+        position
+        for position, (text, stripped) in enumerate(
+            zip(values, map(str.strip, values), strict=True)
+        )
+        if text != stripped
+    ],
+    str.strip,
+)
+
+ISSUE_RULES: dict[str, tuple[Rule, ...]] = {
+    "title": (IS_TEXT, NOT_BLANK, TRIMMED, at_most(MAX_TITLE_LENGTH)),
+    "status": (is_a(Status),),
+    "priority": (is_a(Priority),),
+    # blank means not assigned
+    "assigned_to": (optional(IS_TEXT), optional(TRIMMED)),
+    "notes": (IS_TEXT,),
+}
+
+
+@dataclass(frozen=True)
+class Failure:
+    index: int  # of the issue or record checked
+    field: str
+    rule: Rule
+    value: Any
+
+    @property
+    def message(self) -> str:
+        return f"{self.field.replace('_', ' ')} {self.rule.message}"
+
+    def __str__(self):
+        return f"record {self.index + 1}: {self.message}"
+
+
+@dataclass
+class ValidationReport:
+    count: int = 0  # records checked
+    failures: list[Failure] = field(default_factory=list)
+    # seconds per "field: rule", and per "field" for reading the values
+    timings: dict[str, float] = field(default_factory=dict)
+
+    def failed_indexes(self) -> set[int]:
+        return {failure.index for failure in self.failures}
+
+    def add(self, other: "ValidationReport") -> None:
+        """Add the report on the records following these."""
+        self.failures.extend(
+            Failure(
+                failure.index + self.count, failure.field, failure.rule, failure.value
+            )
+            for failure in other.failures
+        )
+        self.count += other.count
+        for name, seconds in other.timings.items():
+            self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+    def format_timings(self) -> str:
+        """Answer the timings as lines, slowest first."""
+        return "\n".join(
+            f"{name:<30}{seconds * 1000:10.1f} ms"
+            for name, seconds in sorted(
+                self.timings.items(), key=lambda item: item[1], reverse=True
+            )
+        )
+
+
+def check_issues(
+    issues: Sequence[Issue], rules: dict[str, Iterable[Rule]] = ISSUE_RULES
+) -> ValidationReport:
+    """Check all `issues` against the `rules` of every field, a column at a
+    time."""
+    report = ValidationReport(len(issues))
+    for field_name, field_rules in rules.items():
+        start = time.perf_counter()
+        values = list(map(attrgetter(field_name), issues))
+        report.timings[field_name] = time.perf_counter() - start
+        _check_column(report, field_name, field_rules, list(range(len(values))), values)
+    report.failures.sort(key=attrgetter("index"))
+    return report
+
+
+def check_values(
+    values: dict[str, Any], rules: dict[str, Iterable[Rule]] = ISSUE_RULES
+) -> list[Failure]:
+    """Check the `values` of some fields, e.g. as entered in a form."""
+    report = ValidationReport(1)
+    for field_name, value in values.items():
+        _check_column(report, field_name, rules.get(field_name, ()), [0], [value])
+    return report.failures
+
+
+def _check_column(report, field_name, rules, indexes, values) -> None:
+    for rule in rules:
+        start = time.perf_counter()
+        failed = rule.failures(values)
+        name = f"{field_name}: {rule.name}"
+        report.timings[name] = time.perf_counter() - start
+        if failed:
+            report.failures.extend(
+                Failure(indexes[position], field_name, rule, values[position])
+                for position in failed
+            )
+            # the later rules only check the values that passed
+            failed = set(failed)
+            indexes = [
+                i for position, i in enumerate(indexes) if position not in failed
+            ]
+            values = [v for position, v in enumerate(values) if position not in failed]
+
+
+class RuleValidator(QValidator):
+    """Validate text as it is typed: acceptable if it passes all `rules`,
+    intermediate (the user may still be typing) otherwise."""
+
+    def __init__(self, rules: Iterable[Rule], parent=None):
+        super().__init__(parent)
+        self._rules = tuple(rules)
 
-class NonBlankValidator(QValidator):
     def validate(self, text, pos):
-        stripped = text.strip()
         state = (
             QValidator.State.Acceptable
-            if stripped and text == stripped
+            if not check_values({"text": text}, {"text": self._rules})
             else QValidator.State.Intermediate
         )
         return state, text, pos
 
     def fixup(self, text):
-        return text.strip()
+        for rule in self._rules:
+            if rule.fixup is not None and not rule.accepts(text):
+                text = rule.fixup(text)
+        return text
+
+
+class NonBlankValidator(RuleValidator):
+    def __init__(self, parent=None):
+        super().__init__((NOT_BLANK, TRIMMED), parent)
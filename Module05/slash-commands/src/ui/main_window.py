@@ -3,7 +3,7 @@
 ################################################################################
 ## Form generated from reading UI file 'main_window.ui'
 ##
-## Created by: Qt User Interface Compiler version 6.11.0
+## Created by: Qt User Interface Compiler version 6.12.0
 ##
 ## WARNING! All changes made in this file will be lost when recompiling UI file!
 ################################################################################
@@ -18,8 +18,8 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
 from PySide6.QtWidgets import (QAbstractItemView, QApplication, QComboBox, QFormLayout,
     QHBoxLayout, QHeaderView, QLabel, QLineEdit,
     QMainWindow, QMenuBar, QPlainTextEdit, QPushButton,
-    QSizePolicy, QSpacerItem, QStatusBar, QTableWidget,
-    QTableWidgetItem, QVBoxLayout, QWidget)
+    QSizePolicy, QSpacerItem, QStatusBar, QTableView,
+    QVBoxLayout, QWidget)
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
@@ -30,21 +30,56 @@ class Ui_MainWindow(object):
         self.centralwidget.setObjectName(u"centralwidget")
         self.verticalLayout_2 = QVBoxLayout(self.centralwidget)
         self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.filter_layout = QHBoxLayout()
+        self.filter_layout.setObjectName(u"filter_layout")
+        self.search_edit = QLineEdit(self.centralwidget)
+        self.search_edit.setObjectName(u"search_edit")
+        self.search_edit.setClearButtonEnabled(True)
+
+        self.filter_layout.addWidget(self.search_edit)
+
+        self.status_filter_label = QLabel(self.centralwidget)
+        self.status_filter_label.setObjectName(u"status_filter_label")
+
+        self.filter_layout.addWidget(self.status_filter_label)
+
+        self.status_filter_combo = QComboBox(self.centralwidget)
+        self.status_filter_combo.setObjectName(u"status_filter_combo")
+
+        self.filter_layout.addWidget(self.status_filter_combo)
+
+        self.priority_filter_label = QLabel(self.centralwidget)
+        self.priority_filter_label.setObjectName(u"priority_filter_label")
+
+        self.filter_layout.addWidget(self.priority_filter_label)
+
+        self.priority_filter_combo = QComboBox(self.centralwidget)
+        self.priority_filter_combo.setObjectName(u"priority_filter_combo")
+
+        self.filter_layout.addWidget(self.priority_filter_combo)
+
+        self.assignee_filter_label = QLabel(self.centralwidget)
+        self.assignee_filter_label.setObjectName(u"assignee_filter_label")
+
+        self.filter_layout.addWidget(self.assignee_filter_label)
+
+        self.assignee_filter_combo = QComboBox(self.centralwidget)
+        self.assignee_filter_combo.setObjectName(u"assignee_filter_combo")
+
+        self.filter_layout.addWidget(self.assignee_filter_combo)
+
+        self.filter_spacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.filter_layout.addItem(self.filter_spacer)
+
+
+        self.verticalLayout_2.addLayout(self.filter_layout)
+
         self.horizontalLayout_2 = QHBoxLayout()
         self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
-        self.issues_table = QTableWidget(self.centralwidget)
-        if (self.issues_table.columnCount() < 4):
-            self.issues_table.setColumnCount(4)
-        __qtablewidgetitem = QTableWidgetItem()
-        self.issues_table.setHorizontalHeaderItem(0, __qtablewidgetitem)
-        __qtablewidgetitem1 = QTableWidgetItem()
-        self.issues_table.setHorizontalHeaderItem(1, __qtablewidgetitem1)
-        __qtablewidgetitem2 = QTableWidgetItem()
-        self.issues_table.setHorizontalHeaderItem(2, __qtablewidgetitem2)
-        __qtablewidgetitem3 = QTableWidgetItem()
-        self.issues_table.setHorizontalHeaderItem(3, __qtablewidgetitem3)
+        self.issues_table = QTableView(self.centralwidget)
         self.issues_table.setObjectName(u"issues_table")
-        self.issues_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.issues_table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.issues_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
 
         self.horizontalLayout_2.addWidget(self.issues_table)
@@ -157,6 +192,9 @@ class Ui_MainWindow(object):
         self.statusbar.setObjectName(u"statusbar")
         MainWindow.setStatusBar(self.statusbar)
 #if QT_CONFIG(shortcut)
+        self.status_filter_label.setBuddy(self.status_filter_combo)
+        self.priority_filter_label.setBuddy(self.priority_filter_combo)
+        self.assignee_filter_label.setBuddy(self.assignee_filter_combo)
         self.label.setBuddy(self.title_edit)
         self.label_2.setBuddy(self.status_combo)
         self.label_3.setBuddy(self.priority_combo)
@@ -178,14 +216,10 @@ class Ui_MainWindow(object):
 
     def retranslateUi(self, MainWindow):
         MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"MainWindow", None))
-        ___qtablewidgetitem = self.issues_table.horizontalHeaderItem(0)
-        ___qtablewidgetitem.setText(QCoreApplication.translate("MainWindow", u"Title", None))
-        ___qtablewidgetitem1 = self.issues_table.horizontalHeaderItem(1)
-        ___qtablewidgetitem1.setText(QCoreApplication.translate("MainWindow", u"Status", None))
-        ___qtablewidgetitem2 = self.issues_table.horizontalHeaderItem(2)
-        ___qtablewidgetitem2.setText(QCoreApplication.translate("MainWindow", u"Priority", None))
-        ___qtablewidgetitem3 = self.issues_table.horizontalHeaderItem(3)
-        ___qtablewidgetitem3.setText(QCoreApplication.translate("MainWindow", u"Assigned to", None))
+        self.search_edit.setPlaceholderText(QCoreApplication.translate("MainWindow", u"Search titles and notes", None))
+        self.status_filter_label.setText(QCoreApplication.translate("MainWindow", u"Status:", None))
+        self.priority_filter_label.setText(QCoreApplication.translate("MainWindow", u"Priority:", None))
+        self.assignee_filter_label.setText(QCoreApplication.translate("MainWindow", u"Assigned to:", None))
         self.new_issue_button.setText(QCoreApplication.translate("MainWindow", u"New", None))
         self.delete_issue_button.setText(QCoreApplication.translate("MainWindow", u"Delete", None))
         self.label.setText(QCoreApplication.translate("MainWindow", u"&Title", None))
@@ -0,0 +1,41 @@
+import pytest
+from event_loop_monitor import EventLoopMonitor
+
+from issue_tracker.issues_table_window import IssuesTableWindow
+
+
+@pytest.fixture
+def monitor():
+    monitor = EventLoopMonitor(threshold_ms=50, heartbeat_ms=10)
+    monitor.start()
+    yield monitor
+    monitor.stop()
+
+
+def test_window_slots_are_timed(qtbot, monitor):
+    window = IssuesTableWindow()
+    qtbot.addWidget(window)
+    window.issues_table.selectRow(0)
+
+    window.save_button.click()
+
+    times = monitor.slot_times["IssuesTableWindow._save_button_clicked"]
+    assert times.calls == 1
+    assert "IssuesTableWindow._issues_table_item_selection_changed" in (
+        monitor.slot_times
+    )
+
+
+def test_window_slot_called_by_another_is_not_timed_twice(qtbot, monitor):
+    window = IssuesTableWindow()
+    qtbot.addWidget(window)
+    window.issues_table.selectRow(0)
+    monitor.slot_times.clear()
+
+    window.cancel_button.click()
+
+    assert monitor.slot_times["IssuesTableWindow._cancel_button_clicked"].calls == 1
+    assert (
+        "IssuesTableWindow._issues_table_item_selection_changed"
+        not in monitor.slot_times
+    )
@@ -0,0 +1,55 @@
+from issue_tracker.facet_index import FacetIndex
+from issue_tracker.facet_panel import FacetPanel
+from issue_tracker.issue import Issue, Priority, Status
+from issue_tracker.issue_table_model import IssueTableModel
+from issue_tracker.sample_issues import get_samples
+
+
+def scanned_counts(issues, attribute):
+    counts = {}
+    for issue in issues:
+        value = getattr(issue, attribute) or ""
+        counts[value] = counts.get(value, 0) + 1
+    return counts
+
+
+def test_counts_follow_edits():
+    issues = get_samples()
+    index = FacetIndex(issues)
+    issue = issues[0]
+
+    issue.status = Status.CLOSED
+    issue.assigned_to = "Zoe"
+    changed = index.update(issue)
+    new_issue = Issue("New", Status.NEW, Priority.LOW, None, "")
+    issues.append(new_issue)
+    index.add(new_issue)
+    index.remove(issues.pop(1))
+
+    assert ("status", Status.CLOSED) in changed
+    assert ("assigned_to", "Zoe") in changed
+    for facet in ["status", "priority", "assigned_to"]:
+        assert index.counts(facet) == scanned_counts(issues, facet)
+
+
+def test_panel_follows_model(qtbot):
+    model = IssueTableModel(get_samples())
+    panel = FacetPanel()
+    qtbot.addWidget(panel)
+    panel.set_model(model)
+
+    model.append_issue(Issue("New", Status.NEW, Priority.LOW, "Zoe", ""))
+    model.issue(0).assigned_to = "Yann"
+    model.issue_changed(0)
+    model.remove_issue(1)
+
+    index = panel.facet_index()
+    for facet in ["status", "priority", "assigned_to"]:
+        assert index.counts(facet) == scanned_counts(model.issues(), facet)
+    assignees = panel.topLevelItem(2)
+    shown = {
+        assignees.child(i).text(0): int(assignees.child(i).text(1))
+        for i in range(assignees.childCount())
+    }
+    assert shown == scanned_counts(model.issues(), "assigned_to")
+    assert list(shown) == sorted(shown)
@@ -0,0 +1,122 @@
+from PySide6.QtGui import QUndoStack
+
+from issue_tracker.issue import Issue, Priority, Status
+from issue_tracker.issue_commands import (
+    AddIssueCommand,
+    EditIssueCommand,
+    EditIssuesCommand,
+    RemoveIssueCommand,
+    RemoveIssuesCommand,
+)
+from issue_tracker.issue_sort_filter_model import IssueSortFilterModel
+from issue_tracker.issue_table_model import IssueTableModel
+from issue_tracker.issues_table_window import IssuesTableWindow
+from issue_tracker.sample_issues import get_samples
+
+
+def make_stack():
+    return QUndoStack(), IssueTableModel(get_samples())
+
+
+def test_edit_undo_redo(qtbot):
+    stack, model = make_stack()
+    command = EditIssueCommand(
+        model, 2, {"title": "Typo on the About page", "status": Status.CLOSED}
+    )
+
+    assert command._changes == {"status": (Status.NEW, Status.CLOSED)}
+    with qtbot.waitSignal(model.dataChanged):
+        stack.push(command)
+    assert model.issue(2).status == Status.CLOSED
+
+    stack.undo()
+    assert model.issue(2).status == Status.NEW
+    stack.redo()
+    assert model.issue(2).status == Status.CLOSED
+
+
+def test_consecutive_edits_merge():
+    stack, model = make_stack()
+    original = model.issue(0).title
+
+    stack.push(EditIssueCommand(model, 0, {"title": "a"}))
+    stack.push(EditIssueCommand(model, 0, {"title": "ab"}))
+    stack.push(EditIssueCommand(model, 0, {"priority": Priority.LOW}))
+
+    assert stack.count() == 2
+    stack.undo()
+    stack.undo()
+    assert model.issue(0).title == original
+    assert model.issue(0).priority == Priority.URGENT
+
+
+def test_edit_taken_back_is_dropped():
+    stack, model = make_stack()
+    original = model.issue(0).title
+
+    stack.push(EditIssueCommand(model, 0, {"title": "changed"}))
+    stack.push(EditIssueCommand(model, 0, {"title": original}))
+
+    assert stack.count() == 0
+
+
+def test_add_and_remove_restore_rows():
+    stack, model = make_stack()
+    sorted_model = IssueSortFilterModel()
+    sorted_model.setSourceModel(model)
+    sorted_model.sort(IssueTableModel.TITLE_COLUMN)
+    issues = list(model.issues())
+    titles = [sorted_model.index(r, 0).data() for r in range(12)]
+
+    stack.beginMacro("bulk")
+    stack.push(RemoveIssueCommand(model, 3))
+    stack.push(RemoveIssueCommand(model, 0))
+    stack.push(AddIssueCommand(model, Issue("New", Status.NEW, Priority.LOW, "", "")))
+    stack.endMacro()
+    assert model.rowCount() == 11
+
+    stack.undo()
+    assert model.issues() == issues
+    assert [sorted_model.index(r, 0).data() for r in range(12)] == titles
+    stack.redo()
+    assert model.issue(model.rowCount() - 1).title == "New"
+    assert issues[0] not in model.issues()
+
+
+def test_bulk_edit_and_delete_undo_in_one_step(qtbot):
+    stack, model = make_stack()
+    issues = list(model.issues())
+    rows = [1, 4, 5, 9]
+
+    command = EditIssuesCommand(model, rows, {"status": Status.CLOSED})
+    assert command._rows == [r for r in rows if issues[r].status != Status.CLOSED]
+    with qtbot.waitSignal(model.issues_edited) as blocker:
+        stack.push(command)
+    assert blocker.args == [command._rows, {"status"}]
+    assert all(model.issue(r).status == Status.CLOSED for r in rows)
+
+    stack.push(RemoveIssuesCommand(model, rows))
+    assert model.rowCount() == len(issues) - len(rows)
+
+    stack.undo()
+    assert model.issues() == issues
+    stack.undo()
+    assert [i.status for i in model.issues()] == [i.status for i in get_samples()]
+    stack.redo()
+    stack.redo()
+    assert model.issues() == [i for r, i in enumerate(issues) if r not in rows]
+
+
+def test_window_bulk_edits_the_issues_it_is_given(qtbot):
+    issues = [Issue(f"Issue {n}", Status.NEW, Priority.LOW, None, "") for n in range(5)]
+    window = IssuesTableWindow(issues=issues)
+    qtbot.addWidget(window)
+    window.issues_table.selectAll()
+
+    window.status_combo.setCurrentIndex(window.status_combo.findData(Status.CLOSED))
+    window.save_button.click()
+
+    assert window._model.issues() is issues
+    assert all(issue.status == Status.CLOSED for issue in issues)
+    window.undo_stack().undo()
+    assert all(issue.status == Status.NEW for issue in issues)
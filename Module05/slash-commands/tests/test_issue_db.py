@@ -0,0 +1,121 @@
+import sqlite3
+
+import pytest
+
+from issue_tracker.issue import Issue, Priority, Status
+from issue_tracker.issue_db import IssueDB, _db
+from issue_tracker.sample_issues import get_samples
+
+
+@pytest.fixture
+def db(tmp_path):
+    with IssueDB(str(tmp_path / "issues.db")) as db:
+        yield db
+
+
+def test_save_update_delete(db):
+    issue = Issue("Broken login", Status.NEW, Priority.HIGH, "Bob", "")
+    db.save(issue)
+    assert isinstance(issue.id, int)
+
+    issue.status = Status.CLOSED
+    issue.assigned_to = None
+    db.update(issue)
+    assert db.get_all() == [issue]
+
+    db.delete(issue)
+    assert issue.id is None
+    assert db.count() == 0
+
+
+def test_unsaved_issue_raises(db):
+    issue = Issue("Broken login", Status.NEW, Priority.HIGH, "Bob", "")
+    with pytest.raises(ValueError):
+        db.update(issue)
+    with pytest.raises(ValueError):
+        db.delete(issue)
+
+
+def test_save_all_in_batches(db):
+    db.batch_size = 5
+    db.save(Issue("First", Status.NEW, Priority.LOW, "Alice", ""))
+    issues = get_samples()
+
+    assert db.save_all(issues) == len(issues)
+
+    assert [i.id for i in issues] == list(range(2, len(issues) + 2))
+    assert db.get_all()[1:] == issues
+    assert db.count() == len(issues) + 1
+
+
+def test_indexes(db):
+    indexed = {index.columns[0] for index in _db.get_indexes("issues")}
+    assert {"status", "priority", "assigned_to"} <= indexed
+
+
+def test_update_and_delete_all(db):
+    issues = get_samples()
+    db.save_all(issues)
+    for issue in issues[:3]:
+        issue.status = Status.CLOSED
+        issue.title = "not saved"
+
+    assert db.update_all(issues[:3], ["status"]) == 3
+    saved = db.get_all()
+    assert [i.status for i in saved[:3]] == [Status.CLOSED] * 3
+    assert saved[0].title == get_samples()[0].title
+
+    assert db.delete_all(issues[1:]) == len(issues) - 1
+    assert all(issue.id is None for issue in issues[1:])
+    assert db.count() == 1
+    with pytest.raises(ValueError):
+        db.update_all(issues[1:2])
+
+
+def test_ids_are_not_reused(db):
+    issues = get_samples()
+    db.save_all(issues)
+    last_id = issues[-1].id
+    db.delete_all(issues[-2:])
+
+    issue = Issue("Next", Status.NEW, Priority.LOW, None, "")
+    db.save(issue)
+    more = get_samples()
+    db.save_all(more)
+
+    assert issue.id == last_id + 1
+    assert more[0].id == last_id + 2
+
+
+def test_failed_save_all_takes_the_ids_back(db):
+    issues = get_samples()
+    db.save(issues[2])
+
+    with pytest.raises(ValueError):
+        db.save_all(issues)
+
+    assert [i.id for i in issues[:2]] == [None, None]
+    assert db.count() == 1
+
+
+def test_old_issues_table_is_upgraded(tmp_path):
+    path = str(tmp_path / "old.db")
+    connection = sqlite3.connect(path)
+    connection.executescript(
+        "CREATE TABLE issues (id INTEGER NOT NULL PRIMARY KEY, title VARCHAR(255)"
+        " NOT NULL, status INTEGER NOT NULL, priority INTEGER NOT NULL,"
+        " assigned_to VARCHAR(255), notes TEXT NOT NULL);"
+        "CREATE INDEX issuerecord_status ON issues (status);"
+        "INSERT INTO issues VALUES (1, 'Old', 1, 1, NULL, ''), (5, 'Older', 1, 1,"
+        " 'Bob', '');"
+    )
+    connection.close()
+
+    with IssueDB(path) as db:
+        assert [i.title for i in db.get_all()] == ["Old", "Older"]
+        issue = Issue("New", Status.NEW, Priority.LOW, None, "")
+        db.save(issue)
+        db.delete(issue)
+        db.save(issue)
+        assert issue.id == 7
+        assert "status" in {index.columns[0] for index in _db.get_indexes("issues")}
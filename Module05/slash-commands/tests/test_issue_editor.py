@@ -68,3 +68,56 @@ def test_update_issue(qtbot):
     assert issue.priority == Priority.URGENT
     assert issue.assigned_to == "Carol"
     assert issue.notes == "New notes"
+
+
+def test_show_issue_leaves_unchanged_notes_alone(qtbot):
+    widget = IssueEditor()
+    qtbot.addWidget(widget)
+    notes = "Steps to reproduce.\n" * 1000
+    widget.show_issue(Issue("First", Status.NEW, Priority.LOW, None, notes))
+
+    with qtbot.assertNotEmitted(widget.notes_plain_text.textChanged):
+        widget.show_issue(Issue("Second", Status.CLOSED, Priority.LOW, "Bob", notes))
+
+    assert widget.title_edit.text() == "Second"
+    assert widget.status_combo.currentData() == Status.CLOSED
+    assert widget.assigned_to_edit.text() == "Bob"
+
+
+def test_show_issue_discards_changes(qtbot):
+    widget = IssueEditor()
+    qtbot.addWidget(widget)
+    issue = Issue("Broken login", Status.NEW, Priority.HIGH, None, "Old notes")
+    widget.show_issue(issue)
+    widget.title_edit.setText("Changed")
+    widget.notes_plain_text.setPlainText("Changed notes")
+
+    widget.show_issue(issue)
+
+    assert widget.values() == {
+        "title": "Broken login",
+        "status": Status.NEW,
+        "priority": Priority.HIGH,
+        "assigned_to": None,
+        "notes": "Old notes",
+    }
+    assert widget.changed_values() == {}
+
+
+def test_update_issue_writes_only_changed_fields(qtbot):
+    widget = IssueEditor()
+    qtbot.addWidget(widget)
+    issue = Issue("Broken login", Status.NEW, Priority.HIGH, None, "Old notes")
+    widget.show_issue(issue)
+    widget.priority_combo.setCurrentIndex(
+        widget.priority_combo.findData(Priority.URGENT)
+    )
+    widget.notes_plain_text.setPlainText("Old notes")
+
+    assert widget.update_issue(issue) == {"priority"}
+    assert issue.priority == Priority.URGENT
+    assert issue.assigned_to is None  # not written as ""
+
+    issue.title = "Changed elsewhere"
+    assert widget.update_issue(issue) == set()
+    assert issue.title == "Changed elsewhere"
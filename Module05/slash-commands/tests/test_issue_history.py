@@ -0,0 +1,161 @@
+import pytest
+
+from issue_tracker.issue import Change, Issue, Priority, Status
+from issue_tracker.issue_db import IssueDB, _db
+from issue_tracker.issue_history import IssueHistory, describe
+from issue_tracker.issues_table_window import IssuesTableWindow
+from issue_tracker.sample_issues import get_samples
+
+
+@pytest.fixture
+def db(tmp_path):
+    with IssueDB(str(tmp_path / "issues.db")) as db:
+        yield db
+
+
+def test_append_changes_and_history(db):
+    db.batch_size = 2
+    changes = [
+        Change(1, 7, 100.0, "alice", "status", Status.CLOSED),
+        Change(2, 8, 101.0, "bob", "title", "Other issue"),
+        Change(3, 7, 102.0, "bob", "assigned_to", None),
+        Change(4, 7, 103.0, "bob", "priority", Priority.URGENT),
+    ]
+
+    assert db.append_changes(changes) == 4
+
+    assert db.history(7) == [changes[0], changes[2], changes[3]]
+    assert db.history(9) == []
+    assert db.last_change_id() == 4
+
+
+def test_history_records_in_the_background(qtbot, db):
+    issue = Issue("Broken login", Status.NEW, Priority.HIGH, "Bob", "")
+    db.save(issue)
+    history = IssueHistory(db, "alice")
+    try:
+        issue.status = Status.CLOSED
+        history.record([issue], {"status"})
+        # answered whether written yet or not
+        assert [(c.field, c.value) for c in history.history(issue.id)] == [
+            ("status", Status.CLOSED)
+        ]
+        issue.title = "Broken logout"
+        history.record([issue], None)
+        qtbot.waitUntil(lambda: not history._unwritten)
+    finally:
+        history.close()
+
+    changes = db.history(issue.id)
+    assert [c.id for c in changes] == list(range(1, 7))
+    assert {c.author for c in changes} == {"alice"}
+    assert changes[1] == Change(
+        2, issue.id, changes[1].time, "alice", "title", "Broken logout"
+    )
+    assert db.last_change_id() == 6
+
+
+def test_describe():
+    changes = [
+        Change(1, 7, 0.0, "alice", "status", Status.CLOSED),
+        Change(2, 7, 0.0, "bob", "status", Status.NEW),
+        Change(3, 7, 0.0, "bob", "assigned_to", None),
+    ]
+
+    lines = describe(changes)
+
+    assert lines[0].endswith(" alice set status to CLOSED")
+    assert lines[1].endswith(" bob changed status from CLOSED to NEW")
+    assert lines[2].endswith(" bob set assigned_to to nothing")
+    event = Change(4, 7, 0.0, "carol", "deleted", None)
+    assert describe([event])[0].endswith(" carol deleted the issue")
+
+
+def test_window_records_edits(qtbot, db):
+    db.save_all(get_samples())
+    window = IssuesTableWindow(db)
+    qtbot.addWidget(window)
+    window.wait_for_loading()
+    window.issues_table.selectAll()
+    window.status_combo.setCurrentIndex(window.status_combo.findData(Status.CLOSED))
+
+    window.save_button.click()
+    window.undo_stack().undo()
+    window.close()
+
+    issue = window._model.issue(0)
+    assert [(c.field, c.value) for c in db.history(issue.id)] == [
+        ("status", Status.CLOSED),
+        ("status", issue.status),
+    ]
+
+
+def test_window_saves_only_changed_fields(qtbot, db):
+    window = IssuesTableWindow(db)
+    qtbot.addWidget(window)
+    window.wait_for_loading()
+    window.new_issue_button.click()
+    issue = window._get_selected_issue()
+
+    window.save_button.click()
+    assert window.undo_stack().count() == 1  # adding the issue only
+    window.assigned_to_edit.setText("Bob")
+    window.save_button.click()
+    window.assigned_to_edit.clear()
+    window.save_button.click()
+    window.close()
+
+    assert issue.assigned_to is None
+    assert [(c.field, c.value) for c in db.history(issue.id)] == [
+        ("created", None),
+        ("assigned_to", "Bob"),
+        ("assigned_to", None),
+    ]
+
+
+def test_deleted_issue_history_stays_with_it(qtbot, db):
+    window = IssuesTableWindow(db)
+    qtbot.addWidget(window)
+    window.wait_for_loading()
+    window.new_issue_button.click()
+    deleted = window._get_selected_issue()
+    window.title_edit.setText("Secret plan")
+    window.save_button.click()
+    deleted_id = deleted.id
+    window.delete_issue_button.click()
+
+    window.new_issue_button.click()
+    issue = window._get_selected_issue()
+    window.undo_stack().undo()  # adding the new issue
+    window.undo_stack().undo()  # deleting the first one
+    window.close()
+
+    assert issue.id != deleted_id
+    assert [c.field for c in db.history(issue.id)] == ["created", "deleted"]
+    assert deleted.id == deleted_id
+    assert db.get_all() == [deleted]
+    assert [(c.field, c.value) for c in db.history(deleted_id)] == [
+        ("created", None),
+        ("title", "Secret plan"),
+        ("deleted", None),
+        ("restored", None),
+    ]
+
+
+def test_failed_write_is_reported_and_written_again(qtbot, db):
+    issue = Issue("Broken login", Status.NEW, Priority.HIGH, "Bob", "")
+    db.save(issue)
+    history = IssueHistory(db, "alice")
+    _db.execute_sql("ALTER TABLE changes RENAME TO changes_aside")
+    try:
+        with qtbot.waitSignal(history.failed) as blocker:
+            history.record([issue], {"status"})
+        assert "no such table" in blocker.args[0]
+        _db.execute_sql("ALTER TABLE changes_aside RENAME TO changes")
+        assert [c.field for c in history.history(issue.id)] == ["status"]
+        history.record([issue], {"title"})
+        qtbot.waitUntil(lambda: not history._unwritten)
+    finally:
+        history.close()
+
+    assert [c.field for c in db.history(issue.id)] == ["status", "title"]
@@ -0,0 +1,171 @@
+from copy import copy
+
+import pytest
+from PySide6.QtCore import Qt
+
+from issue_tracker.issue import Issue, Priority, Status
+from issue_tracker.issue_io import IssueFormatError, read_issues, write_issues
+from issue_tracker.issue_db import IssueDB, _db
+from issue_tracker.issue_transfer import (
+    IssueExporter,
+    IssueImporter,
+    IssueLoader,
+    start_worker,
+)
+from issue_tracker.issues_table_window import IssuesTableWindow
+from issue_tracker.sample_issues import get_samples
+
+
+def tricky_issues():
+    return get_samples() + [
+        Issue('Quote " and, comma', Status.NEW, Priority.LOW, None, "two\nlines"),
+        Issue("Ünïcödé ✓", Status.CLOSED, Priority.URGENT, "Zoë", "\r\n"),
+    ]
+
+
+@pytest.mark.parametrize("name", ["issues.csv", "issues.jsonl"])
+def test_write_and_read_back(tmp_path, name):
+    path = str(tmp_path / name)
+    issues = tricky_issues()
+
+    assert write_issues(path, issues) == len(issues)
+
+    assert list(read_issues(path)) == issues
+
+
+def test_csv_header_in_any_order(tmp_path):
+    path = tmp_path / "issues.csv"
+    path.write_bytes(
+        b"\xef\xbb\xbfPriority,Title,Status\r\nhigh,Broken login, in_progress \r\n"
+    )
+
+    assert list(read_issues(str(path))) == [
+        Issue("Broken login", Status.IN_PROGRESS, Priority.HIGH, None, "")
+    ]
+
+
+@pytest.mark.parametrize(
+    "name, text, message",
+    [
+        ("a.csv", "title,status\nx,NEW\n", "line 1: missing column priority"),
+        ("a.csv", "title,status,priority\nx,NEW,LOW\ny,OPEN,LOW\n", "line 3"),
+        (
+            "a.jsonl",
+            '{"title": "x", "status": "NEW", "priority": "LOW"}\n[]\n',
+            "line 2",
+        ),
+        ("a.jsonl", '{"title": "x", "status": "NEW", "priority": 3}\n', "line 1"),
+    ],
+)
+def test_invalid_records_name_the_line(tmp_path, name, text, message):
+    path = tmp_path / name
+    path.write_text(text)
+
+    with pytest.raises(IssueFormatError, match=message):
+        list(read_issues(str(path)))
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        write_issues(str(tmp_path / "issues.xml"), [])
+
+
+def test_import_on_worker_thread(qtbot, tmp_path):
+    path = str(tmp_path / "issues.jsonl")
+    issues = tricky_issues() * 5
+    write_issues(path, issues)
+    worker = IssueImporter(path)
+    worker.batch_size = 4
+    batches = []
+    worker.issues_read.connect(batches.append)
+
+    with qtbot.waitSignal(worker.finished) as blocker:
+        thread = start_worker(worker)
+    qtbot.waitUntil(thread.isFinished)
+
+    assert blocker.args == [len(issues)]
+    assert [issue for batch in batches for issue in batch] == issues
+    assert max(len(batch) for batch in batches) == 4
+
+
+def test_loader_reads_pages(qtbot, tmp_path):
+    with IssueDB(str(tmp_path / "issues.db")) as db:
+        issues = [copy(issue) for _ in range(10) for issue in tricky_issues()]
+        db.save_all(issues)
+        worker = IssueLoader(db)
+        worker.first_page_size = 10
+        worker.page_size = 50
+        pages = []
+        worker.issues_read.connect(pages.append)
+
+        with qtbot.waitSignal(worker.finished) as blocker:
+            thread = start_worker(worker)
+        qtbot.waitUntil(thread.isFinished)
+
+    assert blocker.args == [len(issues)]
+    assert [len(page) for page in pages] == [10, 50, 50, 30]
+    assert [issue for page in pages for issue in page] == issues
+
+
+def test_database_error_fails_the_import(qtbot, tmp_path):
+    path = str(tmp_path / "issues.jsonl")
+    write_issues(path, get_samples())
+    with IssueDB(str(tmp_path / "issues.db")) as db:
+        _db.execute_sql("DROP TABLE issues")
+        worker = IssueImporter(path, db)
+
+        with qtbot.waitSignal(worker.failed) as blocker:
+            thread = start_worker(worker)
+        qtbot.waitUntil(thread.isFinished)
+
+    assert "no such table" in blocker.args[0]
+
+
+def test_failed_insert_fails_the_import(qtbot, tmp_path):
+    path = str(tmp_path / "issues.jsonl")
+    write_issues(path, get_samples())
+    with IssueDB(str(tmp_path / "issues.db")) as db:
+        # fails the INSERT, not the query for the next id
+        _db.execute_sql(
+            "CREATE TRIGGER no_inserts BEFORE INSERT ON issues"
+            " BEGIN SELECT RAISE(ABORT, 'read only'); END"
+        )
+        worker = IssueImporter(path, db)
+
+        with qtbot.waitSignal(worker.failed) as blocker:
+            thread = start_worker(worker)
+        qtbot.waitUntil(thread.isFinished)
+
+    assert blocker.args == ["read only"]
+
+
+def test_interrupted_export_leaves_no_file(qtbot, tmp_path):
+    path = tmp_path / "issues.csv"
+    worker = IssueExporter(str(path), get_samples() * 100, 1200)
+    worker.progress.connect(
+        lambda percent: worker.thread().requestInterruption(),
+        Qt.ConnectionType.DirectConnection,
+    )
+
+    with qtbot.waitSignal(worker.finished) as blocker:
+        thread = start_worker(worker)
+    qtbot.waitUntil(thread.isFinished)
+
+    assert blocker.args[0] < 1200
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_window_export_and_import(qtbot, tmp_path):
+    window = IssuesTableWindow()
+    qtbot.addWidget(window)
+    issues = list(window._model.issues())
+    path = str(tmp_path / "issues.csv")
+
+    window.export_issues(path)
+    window.wait_for_transfer()
+    assert list(read_issues(path)) == issues
+
+    window.import_issues(path)
+    window.wait_for_transfer()
+    assert window._model.issues() == issues + issues
+    assert window.issues_table.model().rowCount() == 2 * len(issues)
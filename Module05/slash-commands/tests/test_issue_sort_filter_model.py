@@ -0,0 +1,238 @@
+import random
+
+from PySide6.QtCore import QPersistentModelIndex, Qt
+
+from issue_tracker.issue import Issue, Priority, Status
+from issue_tracker.issue_sort_filter_model import IssueSortFilterModel
+from issue_tracker.issue_table_model import IssueTableModel
+from issue_tracker.sample_issues import get_samples
+
+ASCENDING = Qt.SortOrder.AscendingOrder
+DESCENDING = Qt.SortOrder.DescendingOrder
+
+
+def make_models(issues=None):
+    source = IssueTableModel(get_samples() if issues is None else issues)
+    model = IssueSortFilterModel()
+    model.setSourceModel(source)
+    return source, model
+
+
+def shown_issues(model):
+    return [
+        model.data(model.index(row, 0), Qt.ItemDataRole.UserRole)
+        for row in range(model.rowCount())
+    ]
+
+
+def expected_order(issues, status=None):
+    # priority descending, then title ascending, ties in source order
+    return sorted(
+        (i for i in issues if status is None or i.status == status),
+        key=lambda i: (-i.priority.value, i.title.casefold()),
+    )
+
+
+def test_model(qtmodeltester):
+    source, model = make_models()
+    model.sort(IssueTableModel.STATUS_COLUMN, DESCENDING)
+    model.set_filter(IssueTableModel.ASSIGNED_TO_COLUMN, ["Alice", "Bob"])
+
+    qtmodeltester.check(model)
+
+
+def test_sort_by_several_columns():
+    source, model = make_models()
+
+    model.sort(IssueTableModel.TITLE_COLUMN)
+    model.sort(IssueTableModel.PRIORITY_COLUMN, DESCENDING)
+
+    assert model.sort_columns() == (
+        (IssueTableModel.PRIORITY_COLUMN, DESCENDING),
+        (IssueTableModel.TITLE_COLUMN, ASCENDING),
+    )
+    assert shown_issues(model) == expected_order(source.issues())
+
+
+def test_filter_keeps_sort_order():
+    source, model = make_models()
+    model.set_sort_columns(
+        [
+            (IssueTableModel.PRIORITY_COLUMN, DESCENDING),
+            (IssueTableModel.TITLE_COLUMN, ASCENDING),
+        ]
+    )
+
+    model.set_filter(IssueTableModel.STATUS_COLUMN, [Status.NEW])
+    assert shown_issues(model) == expected_order(source.issues(), Status.NEW)
+
+    model.set_filter(IssueTableModel.STATUS_COLUMN, None)
+    assert shown_issues(model) == expected_order(source.issues())
+
+
+def test_edit_moves_only_the_changed_row(qtbot):
+    source, model = make_models()
+    model.sort(IssueTableModel.TITLE_COLUMN)
+    issue = model.data(model.index(0, 0), Qt.ItemDataRole.UserRole)
+    issue.title = "zzz last"
+
+    with qtbot.assertNotEmitted(model.layoutChanged):
+        with qtbot.waitSignal(model.rowsMoved) as blocker:
+            source.issue_changed(source.issues().index(issue))
+
+    assert blocker.args[1:] == [0, 0, blocker.args[3], model.rowCount()]
+    assert shown_issues(model)[-1] is issue
+
+
+def test_edit_hides_and_shows_filtered_rows(qtbot):
+    source, model = make_models()
+    model.set_filter(IssueTableModel.STATUS_COLUMN, [Status.CLOSED])
+    count = model.rowCount()
+    issue = next(i for i in source.issues() if i.status == Status.NEW)
+
+    issue.status = Status.CLOSED
+    with qtbot.waitSignal(model.rowsInserted):
+        source.issue_changed(source.issues().index(issue))
+    assert model.rowCount() == count + 1
+
+    issue.status = Status.NEW
+    with qtbot.waitSignal(model.rowsRemoved):
+        source.issue_changed(source.issues().index(issue))
+    assert model.rowCount() == count
+
+
+def test_incremental_updates_match_full_sort():
+    rng = random.Random(1)
+    names = ["Alice", "bob", "Carol", None]
+    issues = [
+        Issue(
+            f"issue {rng.randrange(50)}",
+            rng.choice(list(Status)),
+            rng.choice(list(Priority)),
+            rng.choice(names),
+            "",
+        )
+        for _ in range(200)
+    ]
+    source, model = make_models(issues)
+    model.set_sort_columns(
+        [
+            (IssueTableModel.PRIORITY_COLUMN, DESCENDING),
+            (IssueTableModel.TITLE_COLUMN, ASCENDING),
+        ]
+    )
+    model.set_filter(IssueTableModel.STATUS_COLUMN, [Status.NEW, Status.CLOSED])
+
+    for _ in range(300):
+        action = rng.random()
+        if action < 0.6:
+            row = rng.randrange(source.rowCount())
+            issue = source.issue(row)
+            issue.title = f"issue {rng.randrange(50)}"
+            issue.status = rng.choice(list(Status))
+            issue.priority = rng.choice(list(Priority))
+            source.issue_changed(row)
+        elif action < 0.8:
+            source.insert_issue(
+                rng.randrange(source.rowCount() + 1),
+                Issue(
+                    f"issue {rng.randrange(50)}",
+                    rng.choice(list(Status)),
+                    rng.choice(list(Priority)),
+                    rng.choice(names),
+                    "",
+                ),
+            )
+        else:
+            source.remove_issue(rng.randrange(source.rowCount()))
+
+        assert shown_issues(model) == [
+            i
+            for i in expected_order(source.issues())
+            if i.status in (Status.NEW, Status.CLOSED)
+        ]
+
+
+def test_bulk_changes_match_full_sort(qtbot):
+    rng = random.Random(2)
+    issues = [
+        Issue(
+            f"issue {rng.randrange(50)}",
+            rng.choice(list(Status)),
+            rng.choice(list(Priority)),
+            None,
+            "",
+        )
+        for _ in range(200)
+    ]
+    source, model = make_models(issues)
+    model.max_incremental_rows = 5
+    model.set_sort_columns(
+        [
+            (IssueTableModel.PRIORITY_COLUMN, DESCENDING),
+            (IssueTableModel.TITLE_COLUMN, ASCENDING),
+        ]
+    )
+    model.set_filter(IssueTableModel.STATUS_COLUMN, [Status.NEW, Status.CLOSED])
+
+    def check():
+        assert shown_issues(model) == [
+            i
+            for i in expected_order(source.issues())
+            if i.status in (Status.NEW, Status.CLOSED)
+        ]
+
+    for _ in range(30):
+        rows = sorted(rng.sample(range(source.rowCount()), rng.randrange(2, 20)))
+        shown = model.index(rng.randrange(model.rowCount()), 1)
+        persistent = QPersistentModelIndex(shown)
+        issue = model.data(shown, Qt.ItemDataRole.UserRole)
+        removed = []
+        if rng.random() < 0.7:
+            priority = rng.choice(list(Priority))
+            for row in rows:
+                source.issue(row).priority = priority
+            source.issues_changed(rows, ["priority"])
+        else:
+            removed = source.remove_issues(rows)
+            check()
+            if rng.random() < 0.5:
+                source.insert_issues(rows, removed)
+        check()
+        if any(i is issue for i in removed):
+            assert not persistent.isValid()
+        else:
+            assert model.data(persistent, Qt.ItemDataRole.UserRole) is issue
+            assert persistent.column() == 1
+
+
+def test_appended_rows(qtbot):
+    source, model = make_models()
+    model.max_incremental_rows = 5
+    inserts = []
+    model.rowsInserted.connect(
+        lambda parent, first, last: inserts.append(last - first + 1)
+    )
+
+    # unsorted, appended rows are shown in one go at the end
+    issues = [Issue(f"new {n}", Status.NEW, Priority.LOW, None, "") for n in range(8)]
+    source.append_issues(issues)
+    assert inserts == [8]
+    assert shown_issues(model)[-8:] == issues
+
+    model.sort(IssueTableModel.TITLE_COLUMN)
+    model.sort(IssueTableModel.PRIORITY_COLUMN, DESCENDING)
+    model.set_filter(IssueTableModel.STATUS_COLUMN, [Status.NEW])
+    inserts.clear()
+    # sorted after all others: in one go, else one by one or, more than
+    # max_incremental_rows, sorted in at once
+    for count, title, priority in [
+        (8, "zzz", Priority.LOW),
+        (3, "more", Priority.HIGH),
+        (8, "more", Priority.URGENT),
+    ]:
+        source.append_issues(
+            [Issue(title, Status.NEW, priority, None, "") for _ in range(count)]
+        )
+        assert shown_issues(model) == expected_order(source.issues(), Status.NEW)
+    assert inserts == [8, 1, 1, 1]
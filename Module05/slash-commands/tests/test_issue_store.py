@@ -0,0 +1,89 @@
+import pytest
+
+from issue_tracker.issue import Issue, Priority, Status
+from issue_tracker.issue_store import IssueStore
+from issue_tracker.sample_issues import get_samples
+
+
+def test_issue_has_no_instance_dict():
+    issue = get_samples()[0]
+
+    assert not hasattr(issue, "__dict__")
+    with pytest.raises(AttributeError):
+        issue.colour = "red"
+
+
+def test_store_keeps_issues():
+    issues = get_samples()
+    issues[0].id = 7
+
+    store = IssueStore(issues)
+
+    assert len(store) == len(issues)
+    assert [store.issue(row) for row in range(len(store))] == issues
+    assert list(store) == issues
+    assert store[0].id == 7 and store[1].id is None
+    assert isinstance(store[0], Issue)
+    assert sorted(store.assignees()) == sorted({i.assigned_to for i in issues})
+
+
+def test_rows_are_writable_views():
+    store = IssueStore(get_samples())
+    row = store.row(-1)
+
+    row.title = "Changed"
+    row.status = Status.CLOSED
+    row.priority = Priority.URGENT
+    row.assigned_to = None
+    row.notes = ""
+
+    assert store[-1] == Issue("Changed", Status.CLOSED, Priority.URGENT, None, "")
+    store.insert(0, row)
+    # the view refers to a position, now that of the issue before
+    assert store[0] == store[-1]
+    assert row.title == get_samples()[-2].title
+
+
+def test_insert_and_delete():
+    issues = get_samples()
+    store = IssueStore(issues)
+    new = Issue("New", Status.NEW, Priority.LOW, "Zoe", "")
+
+    store.insert(1, new)
+    del store[3]
+    issues.insert(1, new)
+    del issues[3]
+
+    assert list(store) == issues
+    assert store.pop() == issues.pop()
+    with pytest.raises(IndexError):
+        store[len(store)]
+
+
+def test_rows_can_be_reversed_and_swapped():
+    issues = get_samples()[:3]
+    store = IssueStore(issues)
+
+    store.reverse()
+    assert list(store) == issues[::-1]
+
+    store[0], store[2] = store[2], store[0]
+    assert list(store) == issues
+
+    store.insert(0, store.row(2))
+    store.append(store.row(1))
+    assert list(store) == [issues[2], *issues, issues[0]]
+
+
+def test_slices_are_set_column_by_column():
+    issues = get_samples()[:4]
+    store = IssueStore(issues)
+
+    store[1:3] = [store.row(2), store.row(1)]
+    assert list(store) == [issues[0], issues[2], issues[1], issues[3]]
+
+    store[::2] = [issues[3], issues[1]]
+    store[1:] = []
+    assert list(store) == [issues[3]]
+    with pytest.raises(ValueError):
+        store[::2] = issues
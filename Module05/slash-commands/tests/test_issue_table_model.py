@@ -0,0 +1,69 @@
+from PySide6.QtCore import QPersistentModelIndex
+
+from issue_tracker.issue import Issue, Priority, Status
+from issue_tracker.issue_table_model import IssueTableModel
+from issue_tracker.sample_issues import get_samples
+
+
+def test_model(qtmodeltester):
+    model = IssueTableModel(get_samples())
+
+    qtmodeltester.check(model)
+
+
+def test_issue_changed_only_reports_the_row(qtbot):
+    model = IssueTableModel(get_samples())
+    model.issue(1).title = "Changed"
+
+    with qtbot.waitSignal(model.dataChanged) as blocker:
+        model.issue_changed(1)
+
+    top_left, bottom_right = blocker.args[:2]
+    assert (top_left.row(), top_left.column()) == (1, 0)
+    assert (bottom_right.row(), bottom_right.column()) == (1, 3)
+    assert model.data(model.index(1, 0)) == "Changed"
+
+
+def test_append_and_remove_issue(qtbot):
+    model = IssueTableModel(get_samples())
+    count = model.rowCount()
+    issue = Issue("New", Status.NEW, Priority.LOW, None, "")
+
+    with qtbot.waitSignal(model.rowsInserted) as blocker:
+        row = model.append_issue(issue)
+    assert blocker.args[1:] == [count, count]
+    assert model.data(model.index(row, 3)) == ""
+
+    with qtbot.waitSignal(model.rowsRemoved) as blocker:
+        assert model.remove_issue(row) is issue
+    assert blocker.args[1:] == [count, count]
+    assert model.rowCount() == count
+
+
+def test_remove_and_insert_issues_move_persistent_indexes(qtbot):
+    model = IssueTableModel(get_samples())
+    issues = list(model.issues())
+    kept = QPersistentModelIndex(model.index(5, 2))
+    lost = QPersistentModelIndex(model.index(3, 0))
+
+    with qtbot.waitSignal(model.issues_removed) as blocker:
+        removed = model.remove_issues([1, 3, 4])
+    assert blocker.args == [[1, 3, 4], removed]
+    assert removed == [issues[1], issues[3], issues[4]]
+    assert model.issues() == [i for i in issues if i not in removed]
+    assert (kept.row(), kept.column()) == (2, 2)
+    assert not lost.isValid()
+
+    with qtbot.waitSignal(model.issues_inserted):
+        model.insert_issues([1, 3, 4], removed)
+    assert model.issues() == issues
+    assert kept.row() == 5
+
+
+def test_issues_changed_reports_rows_and_fields(qtbot):
+    model = IssueTableModel(get_samples())
+
+    with qtbot.waitSignal(model.issues_edited) as blocker:
+        model.issues_changed([2, 7], ["status"])
+
+    assert blocker.args == [[2, 7], {"status"}]
@@ -0,0 +1,159 @@
+import os
+
+import pytest
+from PySide6.QtCore import Qt
+
+from issue_tracker.issue import Issue, Priority, Status
+from issue_tracker.issue_db import IssueDB
+from issue_tracker.issue_transfer import IssueLoader
+from issue_tracker.issues_table_window import IssuesTableWindow
+from issue_tracker.sample_issues import get_samples
+from issue_tracker.search_index import SearchIndex
+
+
+def build_index(issues):
+    return SearchIndex.build(enumerate(issues))
+
+
+def test_search_ranks_title_matches_first():
+    issues = get_samples()
+    index = build_index(issues)
+
+    keys = index.search("page")
+
+    titles = [issues[key].title for key in keys]
+    assert set(titles[:2]) == {
+        "Login page crashes on empty password",
+        "Typo on the About page",
+    }
+    assert "Dashboard loads slowly with large datasets" in titles[2:]  # notes
+
+
+def test_search_matches_prefixes_of_every_word():
+    issues = get_samples()
+    index = build_index(issues)
+
+    assert [issues[key].title for key in index.search("crash pass")] == [
+        "Login page crashes on empty password"
+    ]
+    assert index.search("crash nonsense") == []
+    assert index.search("  ") == []
+
+
+def test_update_matches_rebuilt_index():
+    issues = get_samples()
+    index = build_index(issues)
+
+    issues[0].title = "Password reset email bounces"
+    issues[0].notes = ""
+    index.update(0, issues[0])
+    index.remove(2)
+    issues[2] = Issue("Typo in password hint", Status.NEW, Priority.LOW, "", "")
+    index.add(2, issues[2])
+
+    rebuilt = build_index(issues)
+    for query in ["pass", "email", "crash", "typo", "about"]:
+        assert sorted(index.search(query)) == sorted(rebuilt.search(query))
+    assert index.words_with_prefix("crash") == []
+
+
+def test_save_and_load(tmp_path):
+    path = str(tmp_path / "issues.search")
+    index = build_index(get_samples())
+    index.save(path, stamp=(12, 12))
+
+    assert SearchIndex.load(path, stamp=(13, 13)) is None
+    loaded = SearchIndex.load(path, stamp=(12, 12))
+    assert loaded.search("dark mode") == index.search("dark mode")
+    assert SearchIndex.load(str(tmp_path / "missing"), stamp=(12, 12)) is None
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "",
+        '{"version": 2, "stamp": [12, 12], "documents": {"1": {"cr',
+        '{"version": 2, "stamp": [12, 12], "documents": {"one": {}}}',
+        '{"version": 2, "stamp": [12, 12], "documents": [1, 2]}',
+        "[1, 2, 3]",
+        "\x80\x05K\x01.",
+    ],
+)
+def test_unreadable_file_is_not_loaded(tmp_path, content):
+    path = tmp_path / "issues.search"
+    path.write_text(content, encoding="utf-8")
+
+    assert SearchIndex.load(str(path), stamp=(12, 12)) is None
+
+
+def test_window_search_filters_table(qtbot):
+    window = IssuesTableWindow()
+    qtbot.addWidget(window)
+    table = window.issues_table
+
+    qtbot.keyClicks(window.search_edit, "csv")
+    qtbot.waitUntil(lambda: table.model().rowCount() == 1)
+
+    table.selectRow(0)
+    window.notes_plain_text.setPlainText("Exported files have no header.")
+    window.title_edit.setText("Export missing header row")
+    qtbot.mouseClick(window.save_button, Qt.MouseButton.LeftButton)
+    assert table.model().rowCount() == 0
+
+    window.search_edit.clear()
+    qtbot.waitUntil(lambda: table.model().rowCount() == len(get_samples()))
+
+
+def test_window_shows_best_match_first(qtbot):
+    window = IssuesTableWindow()
+    qtbot.addWidget(window)
+    table = window.issues_table
+    ranked = [get_samples()[row].title for row in (0, 2, 1, 5)]
+
+    window.search_edit.setText("page")
+    qtbot.waitUntil(lambda: table.model().rowCount() == 4)
+
+    titles = [table.model().index(row, 0).data() for row in range(4)]
+    assert titles == ranked
+    # the rank goes before the sort columns while searching
+    table.sortByColumn(0, Qt.SortOrder.DescendingOrder)
+    assert [table.model().index(row, 0).data() for row in range(4)] == ranked
+    window.search_edit.clear()
+    qtbot.waitUntil(lambda: table.model().rowCount() == len(get_samples()))
+    titles = [table.model().index(row, 0).data() for row in range(len(titles))]
+    assert titles == sorted(titles, key=str.casefold, reverse=True)
+
+
+def test_window_search_index_comes_from_the_loader(qtbot, tmp_path, monkeypatch):
+    # the loader reads no further than the table shows
+    monkeypatch.setattr(IssueLoader, "first_page_size", 2)
+    monkeypatch.setattr(IssueLoader, "page_size", 2)
+    monkeypatch.setattr(IssueLoader, "rows_ahead", 2)
+    path = str(tmp_path / "issues.db")
+    with IssueDB(path) as db:
+        db.save_all(get_samples())
+        window = IssuesTableWindow(db)
+        qtbot.addWidget(window)
+        assert not window.search_edit.isEnabled()
+        qtbot.waitUntil(lambda: window._model.rowCount() >= 2)
+        # changed before the index arrives
+        window.issues_table.selectRow(0)
+        window.title_edit.setText("Unicorn sighting")
+        window.save_button.click()
+        assert not window.search_edit.isEnabled()
+
+        window.wait_for_loading()
+        assert window.search_edit.isEnabled()
+        assert window._search_index.search("unicorn") == [window._model.issue(0).id]
+        assert window._search_index.search("login") == []
+        window.close()
+
+    assert os.path.exists(path + ".search")
+    with IssueDB(path) as db:
+        window = IssuesTableWindow(db)
+        qtbot.addWidget(window)
+        window.wait_for_loading()
+        # loaded, and written again only when the window closes
+        assert not os.path.exists(path + ".search")
+        assert len(window._search_index.search("unicorn")) == 1
+        window.close()
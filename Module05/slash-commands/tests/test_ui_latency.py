@@ -0,0 +1,118 @@
+from issue_tracker.issue import Issue, Priority, Status
+from issue_tracker.issue_db import IssueDB
+from issue_tracker.issue_editor import IssueEditor
+from issue_tracker.issues_table_window import IssuesTableWindow
+from issue_tracker.sample_issues import get_samples
+
+
+def test_issues_table_window_latency(ui_latency):
+    window = IssuesTableWindow()
+    ui_latency.show(window)
+    table = window.issues_table
+
+    for row in range(table.model().rowCount()):
+        ui_latency.measure(
+            f"select row {row}", lambda: table.selectRow(row), expect_repaint=True
+        )
+    ui_latency.type("type title", window.title_edit, "!")
+    ui_latency.click("save", window.save_button)
+    ui_latency.click("new issue", window.new_issue_button)
+    ui_latency.type("type assignee", window.assigned_to_edit, "Bob")
+    ui_latency.click("save new issue", window.save_button)
+    ui_latency.click("delete issue", window.delete_issue_button)
+
+    ui_latency.assert_within_budget()
+    ui_latency.assert_repainted()
+
+
+def test_bulk_edit_and_delete_latency(ui_latency):
+    window = IssuesTableWindow()
+    ui_latency.show(window)
+    table = window.issues_table
+    issues = list(window._model.issues())
+    window.large_selection_rows = 2  # put the selection aside during changes
+
+    ui_latency.measure("select all", table.selectAll)
+    assert not window.title_edit.isEnabled()
+    ui_latency.measure(
+        "choose status",
+        lambda: window.status_combo.setCurrentIndex(
+            window.status_combo.findData(Status.CLOSED)
+        ),
+    )
+    ui_latency.click("save all", window.save_button)
+    assert all(issue.status == Status.CLOSED for issue in issues)
+    assert window.undo_stack().count() == 1
+    assert len(window._get_selected_rows()) == len(issues)
+
+    ui_latency.click("delete all", window.delete_issue_button)
+    assert table.model().rowCount() == 0
+    ui_latency.measure("undo delete", window.undo_stack().undo)
+    assert window._model.issues() == issues
+
+    ui_latency.assert_within_budget()
+    ui_latency.assert_repainted()
+
+
+def test_database_loads_in_background(ui_latency, tmp_path):
+    with IssueDB(str(tmp_path / "issues.db")) as database:
+        issues = [issue for _ in range(2000) for issue in get_samples()]
+        database.save_all(issues)
+        window = None
+
+        def open_window():
+            nonlocal window
+            window = IssuesTableWindow(database)
+            ui_latency.show(window)
+
+        ui_latency.measure("open window", open_window, budget_ms=200)
+        model = window.issues_table.model()
+        ui_latency.qtbot.waitUntil(lambda: model.rowCount() > 0, timeout=1000)
+        ui_latency.measure(
+            "select row while loading",
+            lambda: window.issues_table.selectRow(0),
+            expect_repaint=True,
+        )
+
+        window.wait_for_loading()
+        assert window._model.issues() == issues
+        assert model.rowCount() == len(issues)
+        window.close()
+
+    ui_latency.assert_within_budget()
+    ui_latency.assert_repainted()
+
+
+def test_loaded_issues_are_added_once_per_frame(qtbot):
+    window = IssuesTableWindow()
+    qtbot.addWidget(window)
+    count = window._model.rowCount()
+    appends = []
+    window._model.rowsInserted.connect(lambda *args: appends.append(args))
+
+    for issues in (get_samples(), get_samples(), get_samples()):
+        window._issues_loaded(issues)
+    assert window._model.rowCount() == count + 12  # the first right away
+
+    qtbot.waitUntil(lambda: window._model.rowCount() == count + 36)
+    assert len(appends) == 2
+
+
+def test_large_notes_editor_latency(ui_latency):
+    editor = IssueEditor()
+    ui_latency.show(editor)
+    notes = "A line of notes about the issue and how to reproduce it.\n" * 20_000
+    issues = [
+        Issue(f"Issue {n}", Status.NEW, Priority.LOW, None, notes) for n in range(3)
+    ]
+
+    ui_latency.measure("show large notes", lambda: editor.show_issue(issues[0]), 500)
+    ui_latency.measure("show same notes", lambda: editor.show_issue(issues[1]))
+    ui_latency.measure("save unchanged", lambda: editor.update_issue(issues[1]))
+    ui_latency.type("type title", editor.title_edit, "!")
+    ui_latency.measure("save title", lambda: editor.update_issue(issues[1]))
+    assert issues[1].title == "Issue 1!"
+    ui_latency.measure("show next issue", lambda: editor.show_issue(issues[2]))
+
+    ui_latency.assert_within_budget()
+    ui_latency.assert_repainted()
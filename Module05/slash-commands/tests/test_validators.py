@@ -0,0 +1,147 @@
+import pytest
+from PySide6.QtGui import QValidator
+from PySide6.QtWidgets import QMessageBox
+
+from issue_tracker.issue import Issue, Priority, Status
+from issue_tracker.issue_io import write_issues
+from issue_tracker.issue_transfer import IssueImporter, start_worker
+from issue_tracker.issues_table_window import IssuesTableWindow
+from issue_tracker.sample_issues import get_samples
+from issue_tracker.validators import (
+    ISSUE_RULES,
+    NOT_BLANK,
+    TRIMMED,
+    NonBlankValidator,
+    check_issues,
+    check_values,
+)
+
+
+def invalid_issues():
+    return [
+        Issue("  ", Status.NEW, Priority.LOW, None, ""),
+        Issue(" Padded", Status.NEW, Priority.LOW, "Bob ", ""),
+        Issue("x" * 256, Status.NEW, Priority.LOW, None, ""),
+    ]
+
+
+@pytest.mark.parametrize(
+    "value", ["", "  ", " a", "a ", "a", "a b", None, 3, "x" * 256]
+)
+def test_rules_accept_a_value_as_part_of_a_column(value):
+    column = ["ok", value, " no"]
+    for rules in ISSUE_RULES.values():
+        for rule in rules:
+            try:
+                accepted = rule.accepts(value)
+            except (TypeError, AttributeError):
+                continue  # checked by the rules before
+            assert (1 in rule.failures(column)) != accepted
+
+
+def test_check_issues():
+    issues = get_samples() + invalid_issues()
+    first_invalid = len(issues) - 3
+
+    report = check_issues(issues)
+
+    assert report.count == len(issues)
+    assert [
+        (f.index - first_invalid, f.field, f.rule.name) for f in report.failures
+    ] == [
+        (0, "title", "not blank"),
+        (1, "title", "trimmed"),
+        (1, "assigned_to", "trimmed"),
+        (2, "title", "at most 255"),
+    ]
+    assert (
+        str(report.failures[0])
+        == f"record {first_invalid + 1}: title must not be blank"
+    )
+    assert "title: not blank" in report.timings
+    assert "notes" in report.timings
+
+
+def test_only_the_values_that_passed_are_checked_further():
+    issue = Issue(None, "NEW", Priority.LOW, 3, "")
+
+    report = check_issues([issue])
+
+    assert [(f.field, f.rule.name) for f in report.failures] == [
+        ("title", "is str"),
+        ("status", "is Status"),
+        ("assigned_to", "is str"),
+    ]
+
+
+def test_check_values():
+    failures = check_values({"title": "  ", "assigned_to": ""})
+
+    assert [failure.message for failure in failures] == ["title must not be blank"]
+    assert check_values({"status": Status.CLOSED}) == []
+
+
+def test_non_blank_validator():
+    validator = NonBlankValidator()
+
+    assert validator.validate("Broken", 0)[0] == QValidator.State.Acceptable
+    assert validator.validate("  ", 0)[0] == QValidator.State.Intermediate
+    assert validator.validate(" Broken", 0)[0] == QValidator.State.Intermediate
+    assert validator.fixup("  Broken  ") == "Broken"
+    assert NOT_BLANK.accepts(validator.fixup(" ")) is False
+    assert TRIMMED.accepts(validator.fixup(" ")) is True
+
+
+def test_importer_skips_invalid_issues(qtbot, tmp_path):
+    path = str(tmp_path / "issues.jsonl")
+    valid = get_samples()
+    write_issues(path, invalid_issues() + valid)
+    worker = IssueImporter(path)
+    worker.batch_size = 2
+    batches = []
+    worker.issues_read.connect(batches.append)
+    reports = []
+    worker.validated.connect(reports.append)
+
+    with qtbot.waitSignal(worker.finished) as blocker:
+        thread = start_worker(worker)
+    qtbot.waitUntil(thread.isFinished)
+
+    assert blocker.args == [len(valid)]
+    assert [issue for batch in batches for issue in batch] == valid
+    (report,) = reports
+    assert report.count == len(valid) + 3
+    assert report.failed_indexes() == {0, 1, 2}
+
+
+def test_window_reports_skipped_issues(qtbot, tmp_path, monkeypatch):
+    window = IssuesTableWindow()
+    qtbot.addWidget(window)
+    count = len(window._model.issues())
+    path = str(tmp_path / "issues.csv")
+    write_issues(path, invalid_issues() + get_samples())
+    warnings = []
+    monkeypatch.setattr(
+        QMessageBox, "warning", lambda parent, title, text: warnings.append(text)
+    )
+
+    window.import_issues(path)
+    window.wait_for_transfer()
+
+    assert len(window._model.issues()) == 2 * count
+    assert "skipped 3 invalid" in window.statusbar.currentMessage()
+    assert warnings[0].startswith("record 1: title must not be blank")
+
+
+def test_window_refuses_to_save_a_blank_title(qtbot):
+    window = IssuesTableWindow()
+    qtbot.addWidget(window)
+    window.issues_table.selectRow(0)
+    issue = window.issues_table.model().index(0, 0).data()
+
+    window.title_edit.setText("   ")
+    window.save_button.click()
+
+    assert window.issues_table.model().index(0, 0).data() == issue
+    assert window._undo_stack.count() == 0
+    assert window.statusbar.currentMessage() == "Title must not be blank"
@@ -0,0 +1,52 @@
+"""Measure the cost of a long undo history of issue edits.
+Run with: uv run python undo_benchmark.py [STEPS]"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtGui import QUndoStack
+
+from issue_tracker.issue import Priority, Status
+from issue_tracker.issue_commands import EditIssueCommand
+from issue_tracker.issue_table_model import IssueTableModel
+from issue_tracker.sample_issues import get_samples
+
+steps = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+app = QCoreApplication(sys.argv)
+rng = random.Random(0)
+
+issues = [issue for _ in range(10_000) for issue in get_samples()]
+model = IssueTableModel(issues)
+stack = QUndoStack()
+stack.setUndoLimit(0)  # unlimited, to see what a long history costs
+# the edits reuse existing values so that only the history is measured
+values = [
+    {"status": rng.choice(list(Status))},
+    {"priority": rng.choice(list(Priority))},
+    {"assigned_to": rng.choice(["Alice", "Bob", "Carol"])},
+]
+
+tracemalloc.start()
+start = time.perf_counter()
+for step in range(steps):
+    row = rng.randrange(len(issues))
+    stack.push(EditIssueCommand(model, row, values[step % len(values)]))
+push_time = time.perf_counter() - start
+size = tracemalloc.get_traced_memory()[0]
+tracemalloc.stop()
+
+start = time.perf_counter()
+stack.setIndex(0)
+undo_time = time.perf_counter() - start
+start = time.perf_counter()
+stack.setIndex(stack.count())
+redo_time = time.perf_counter() - start
+
+print(f"{stack.count()} commands from {steps} edits")
+print(f"push  {push_time * 1e6 / steps:6.1f} us/edit")
+print(f"undo  {undo_time * 1e6 / stack.count():6.1f} us/edit")
+print(f"redo  {redo_time * 1e6 / stack.count():6.1f} us/edit")
+print(f"memory {size / stack.count():6.0f} B/command (Python objects only)")
@@ -1,12 +1,13 @@
 import sys
 from functools import partial
 
-from PySide6.QtCore import QRegularExpression, Signal
+from PySide6.QtCore import QEvent, QRegularExpression, Signal
 from PySide6.QtGui import QRegularExpressionValidator
 from PySide6.QtWidgets import (
     QApplication,
     QFormLayout,
     QHBoxLayout,
+    QLabel,
     QLineEdit,
     QMessageBox,
     QPlainTextEdit,
@@ -33,6 +34,24 @@ class ContactEditor(ThemeableWidgetMixin, QWidget):
         layout.addWidget(form)
 
         self._configure_validated_inputs()
+        self._set_style_scope("contact_editor")
+        self.retranslateUi()
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.LanguageChange:
+            self.retranslateUi()
+        super().changeEvent(event)
+
+    def retranslateUi(self):
+        self._cancel_button.setText(self.tr("Cancel"))
+        self._save_button.setText(self.tr("Save"))
+        for field, text in [
+            (self._name_input, self.tr("Name")),
+            (self._address_input, self.tr("Address")),
+            (self._phone_input, self.tr("Phone")),
+            (self._email_input, self.tr("Email")),
+        ]:
+            self._form_layout.labelForField(field).setText(text)
 
     def _create_contact_form(self):
         self._name_input = QLineEdit()
@@ -47,11 +66,9 @@ class ContactEditor(ThemeableWidgetMixin, QWidget):
         validator = QRegularExpressionValidator(regex)
         self._email_input.setValidator(validator)
 
-        self._cancel_button = QPushButton(
-            theme_manager.icon("cancel.svg"), self.tr("Cancel")
-        )
+        self._cancel_button = QPushButton(theme_manager.icon("cancel.svg"), "")
         self._cancel_button.clicked.connect(self._cancel_button_clicked)
-        self._save_button = QPushButton(theme_manager.icon("save.svg"), self.tr("Save"))
+        self._save_button = QPushButton(theme_manager.icon("save.svg"), "")
         self._save_button.clicked.connect(self._save_button_clicked)
 
         self._add_themed_icon_targets(
@@ -62,10 +79,10 @@ class ContactEditor(ThemeableWidgetMixin, QWidget):
         )
 
         form_layout = QFormLayout()
-        form_layout.addRow(self.tr("Name"), self._name_input)
-        form_layout.addRow(self.tr("Address"), self._address_input)
-        form_layout.addRow(self.tr("Phone"), self._phone_input)
-        form_layout.addRow(self.tr("Email"), self._email_input)
+        form_layout.addRow(QLabel(), self._name_input)
+        form_layout.addRow(QLabel(), self._address_input)
+        form_layout.addRow(QLabel(), self._phone_input)
+        form_layout.addRow(QLabel(), self._email_input)
         form_layout.setFieldGrowthPolicy(
             QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow
         )
@@ -75,6 +92,8 @@ class ContactEditor(ThemeableWidgetMixin, QWidget):
         button_layout.addWidget(self._cancel_button, 0)
         button_layout.addWidget(self._save_button, 0)
 
+        self._form_layout = form_layout
+
         form_widget = QWidget()
         widget_layout = QVBoxLayout(form_widget)
         widget_layout.addLayout(form_layout)
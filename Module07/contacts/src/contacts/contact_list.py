@@ -1,7 +1,7 @@
 import sys
 from typing import Optional
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QEvent, Qt, Signal
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QApplication,
@@ -14,7 +14,6 @@ from PySide6.QtWidgets import (
 )
 
 from contacts.contact import Contact
-from contacts.sample_data import get_samples
 from themes.theme import ThemeableWidgetMixin, theme_manager
 
 
@@ -30,12 +29,10 @@ class ContactList(ThemeableWidgetMixin, QWidget):
 
         self._create_contact_list()
 
-        self._remove_contact_button = QPushButton(self.tr("delete"))
+        self._remove_contact_button = QPushButton()
         self._remove_contact_button.setObjectName("remove-contact-button")
         self._remove_contact_button.clicked.connect(self._remove_contact_button_clicked)
-        self._new_contact_button = QPushButton(
-            theme_manager.icon("add.svg"), self.tr("new")
-        )
+        self._new_contact_button = QPushButton(theme_manager.icon("add.svg"), "")
         self._new_contact_button.clicked.connect(self._new_contact_button_clicked)
 
         self._add_themed_icon_targets(
@@ -53,6 +50,17 @@ class ContactList(ThemeableWidgetMixin, QWidget):
         layout.addLayout(button_layout)
 
         self.setLayout(layout)
+        self._set_style_scope("contact_list")
+        self.retranslateUi()
+
+    def changeEvent(self, event) -> None:
+        if event.type() == QEvent.Type.LanguageChange:
+            self.retranslateUi()
+        super().changeEvent(event)
+
+    def retranslateUi(self) -> None:
+        self._remove_contact_button.setText(self.tr("delete"))
+        self._new_contact_button.setText(self.tr("new"))
 
     def show_contacts(self, contacts) -> None:
         self._contacts = contacts
@@ -126,6 +134,8 @@ class ContactList(ThemeableWidgetMixin, QWidget):
 
 
 if __name__ == "__main__":
+    from contacts.sample_data import get_samples
+
     app = QApplication(sys.argv)
     w = ContactList()
     w.show_contacts(get_samples())
@@ -1,7 +1,10 @@
+import logging
+import os
 import sys
 
-from PySide6.QtCore import QLocale, QTranslator
-from PySide6.QtGui import QAction
+from event_loop_monitor import EventLoopMonitor, timed_slot
+from PySide6.QtCore import QEvent, QLocale
+from PySide6.QtGui import QAction, QActionGroup
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -13,7 +16,9 @@ import contacts.resources_rc  # noqa: F401
 from contacts.contact_db import ContactDB
 from contacts.contact_editor import ContactEditor
 from contacts.contact_list import ContactList
+from contacts.translation_manager import translation_manager
 from themes.theme import DarkTheme, LightTheme, ThemeableWidgetMixin, theme_manager
+from themes.theme_watcher import ThemeWatcher
 
 
 class ContactsWindow(ThemeableWidgetMixin, QMainWindow):
@@ -38,70 +43,110 @@ class ContactsWindow(ThemeableWidgetMixin, QMainWindow):
         splitter.addWidget(self._contact_editor)
         self.setCentralWidget(splitter)
 
+        self.retranslateUi()
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.LanguageChange:
+            self.retranslateUi()
+        super().changeEvent(event)
+
+    def retranslateUi(self):
+        self._new_action.setText(self.tr("New Contact"))
+        self._new_action.setStatusTip(self.tr("Create a new contact"))
+        self._delete_action.setText(self.tr("Delete Contact"))
+        self._delete_action.setStatusTip(self.tr("Delete selected contact"))
+        self._save_action.setText(self.tr("Save"))
+        self._save_action.setStatusTip(self.tr("Save current contact"))
+        self._view_menu.setTitle(self.tr("&View"))
+        self._language_menu.setTitle(self.tr("&Language"))
+        if self._is_dark:
+            self._toggle_theme_action.setText(self.tr("Switch to Light Theme"))
+        else:
+            self._toggle_theme_action.setText(self.tr("Switch to Dark Theme"))
+
     def _create_toolbar(self):
         toolbar = self.addToolBar("Main")
         toolbar.setMovable(False)
 
-        self._new_action = QAction(theme_manager.icon("add.svg"), "New Contact", self)
-        self._new_action.setStatusTip("Create a new contact")
+        self._new_action = QAction(theme_manager.icon("add.svg"), "", self)
         self._new_action.triggered.connect(self._toolbar_new_contact)
         toolbar.addAction(self._new_action)
 
-        self._delete_action = QAction(
-            theme_manager.icon("delete.svg"), "Delete Contact", self
-        )
-        self._delete_action.setStatusTip("Delete selected contact")
+        self._delete_action = QAction(theme_manager.icon("delete.svg"), "", self)
         self._delete_action.triggered.connect(self._toolbar_delete_contact)
         toolbar.addAction(self._delete_action)
 
         toolbar.addSeparator()
 
-        self._save_action = QAction(theme_manager.icon("save.svg"), "Save", self)
-        self._save_action.setStatusTip("Save current contact")
+        self._save_action = QAction(theme_manager.icon("save.svg"), "", self)
         self._save_action.triggered.connect(self._toolbar_save)
         toolbar.addAction(self._save_action)
 
     def _create_menus(self):
         menu_bar = self.menuBar()
-        view_menu = menu_bar.addMenu("&View")
+        self._view_menu = menu_bar.addMenu("")
 
-        self._toggle_theme_action = QAction(
-            theme_manager.icon("theme.svg"),
-            "Switch to Dark Theme",
-            self,
-        )
+        self._toggle_theme_action = QAction(theme_manager.icon("theme.svg"), "", self)
         self._toggle_theme_action.triggered.connect(self._toggle_theme)
-        view_menu.addAction(self._toggle_theme_action)
+        self._view_menu.addAction(self._toggle_theme_action)
+
+        self._language_menu = self._view_menu.addMenu("")
+        self._language_group = QActionGroup(self)
+        for locale in translation_manager.available_locales():
+            action = QAction(
+                f"{locale.nativeLanguageName()} ({locale.nativeTerritoryName()})",
+                self,
+                checkable=True,
+            )
+            action.setChecked(locale == translation_manager.locale())
+            action.triggered.connect(
+                lambda checked, locale=locale: self._switch_language(locale)
+            )
+            self._language_group.addAction(action)
+            self._language_menu.addAction(action)
 
         self._add_themed_icon_target(self._new_action, "add.svg")
         self._add_themed_icon_target(self._delete_action, "delete.svg")
         self._add_themed_icon_target(self._save_action, "save.svg")
         self._add_themed_icon_target(self._toggle_theme_action, "theme.svg")
 
+    @timed_slot
     def _toggle_theme(self):
         app = QApplication.instance()
         if self._is_dark:
             theme_manager.set_theme(LightTheme())
             theme_manager.install(app)
-            self._toggle_theme_action.setText("Switch to Dark Theme")
         else:
             theme_manager.set_theme(DarkTheme())
             theme_manager.install(app)
-            self._toggle_theme_action.setText("Switch to Light Theme")
         self._is_dark = not self._is_dark
+        self.retranslateUi()
+
+    @timed_slot
+    def _switch_language(self, locale):
+        translation_manager.set_locale(locale)
+        self.statusBar().showMessage(
+            f"{locale.nativeLanguageName()}: {translation_manager.last_switch_ms:.1f} ms",
+            3000,
+        )
 
+    @timed_slot
     def _toolbar_new_contact(self):
         self._contact_list._new_contact_button_clicked()
 
+    @timed_slot
     def _toolbar_delete_contact(self):
         self._contact_list._remove_contact_button_clicked()
 
+    @timed_slot
     def _toolbar_save(self):
         self._contact_editor._save_button_clicked()
 
+    @timed_slot
     def _contact_selected(self, selected_contact):
         self._contact_editor.edit_contact(selected_contact)
 
+    @timed_slot
     def _contact_editor_saved(self, contact):
         if contact.id is None:
             self._database.save(contact)
@@ -110,9 +155,11 @@ class ContactsWindow(ThemeableWidgetMixin, QMainWindow):
 
         self._contact_list.update_contact(contact)
 
+    @timed_slot
     def _contact_editor_cancelled(self):
         self._list_item_selection_changed()
 
+    @timed_slot
     def _contact_list_contact_removed(self, contact):
         if contact.id is not None:
             self._database.delete(contact)
@@ -120,25 +167,47 @@ class ContactsWindow(ThemeableWidgetMixin, QMainWindow):
 
 def load_translations(app):
     locale = QLocale.system()
-    translator = QTranslator(app)
-    if translator.load(locale, "translation", "_", ":/translations"):
-        app.installTranslator(translator)
-    else:
+    if not translation_manager.set_locale(locale):
         print(f"translations for {locale} not found")
 
 
+def report_theme_reload(changes, elapsed_ms):
+    summary = ", ".join(sorted(changes)) or "no changes"
+    print(f"theme reloaded in {elapsed_ms:.1f} ms: {summary}")
+
+
 def main():
+    """With CONTACTS_MONITOR_MS set, the event loop blocking and slots taking
+    longer than that many milliseconds are logged, and the times of the
+    slots are printed at exit."""
     app = QApplication(sys.argv)
     app.setStyle(QStyleFactory.create("Fusion"))
-
+    monitor = None
+    if os.environ.get("CONTACTS_MONITOR_MS"):
+        logging.basicConfig()
+        monitor = EventLoopMonitor(float(os.environ["CONTACTS_MONITOR_MS"]))
+        monitor.start()
+
+    # point this at resources/themes to edit themes while the app is running
+    theme_directory = os.environ.get("CONTACTS_THEME_DIR")
+    if theme_directory:
+        theme_manager.theme_directory = theme_directory
     theme_manager.set_theme(LightTheme())
     theme_manager.install(app)
+    if theme_directory:
+        watcher = ThemeWatcher(app, parent=app)
+        watcher.theme_reloaded.connect(report_theme_reload)
+        watcher.reload_failed.connect(print)
 
     load_translations(app)
 
     window = ContactsWindow()
     window.show()
-    sys.exit(app.exec())
+    result = app.exec()
+    if monitor is not None:
+        monitor.stop()
+        print(monitor.report())
+    sys.exit(result)
 
 
 if __name__ == "__main__":
@@ -1,32 +1,131 @@
 # Resource object code (Python 3)
 # Created by: object code
-# Created by: The Resource Compiler for Qt version 6.10.2
+# Created by: The Resource Compiler for Qt version 6.12.0
 # WARNING! All changes made in this file will be lost!
 
 from PySide6 import QtCore
 
 qt_resource_data = b"\
+\x00\x00\x02\xb5\
+#\
+ Dark color them\
+e.  Paths are re\
+lative to this f\
+ile so the same \
+definition\x0a# wor\
+ks from the comp\
+iled resources (\
+\x22:/themes/\x22) and\
+ from disk (hot \
+reload).\x0aname = \
+\x22dark\x22\x0aicon_path\
+ = \x22../icons/dar\
+k/\x22\x0a# applicatio\
+n wide style she\
+ets, keep this s\
+hort: every widg\
+et pays for it\x0as\
+tyle_sheets = []\
+\x0a\x0a[scoped_style_\
+sheets]\x0acontact_\
+list = [\x22../styl\
+es/contact_list.\
+qss\x22]\x0acontact_ed\
+itor = [\x22../styl\
+es/contact_edito\
+r.qss\x22, \x22../styl\
+es/dark.qss\x22]\x0a\x0a[\
+palette]\x0aWindow \
+= \x22#2b2b2b\x22\x0aWind\
+owText = \x22#ddddd\
+d\x22\x0aBase = \x22#3c3c\
+3c\x22\x0aText = \x22#eee\
+eee\x22\x0aButton = \x22#\
+444444\x22\x0aButtonTe\
+xt = \x22#dddddd\x22\x0aH\
+ighlight = \x22#3d8\
+ec9\x22\x0aHighlighted\
+Text = \x22#ffffff\x22\
+\x0a\x0a# Disabled (ex\
+plicit!)\x0a[palett\
+e.Disabled]\x0aText\
+ = \x22#777777\x22\x0aBut\
+tonText = \x22#7777\
+77\x22\x0a\
+\x00\x00\x02\xa2\
+#\
+ Light color the\
+me.  Paths are r\
+elative to this \
+file so the same\
+ definition\x0a# wo\
+rks from the com\
+piled resources \
+(\x22:/themes/\x22) an\
+d from disk (hot\
+ reload).\x0aname =\
+ \x22light\x22\x0aicon_pa\
+th = \x22../icons/l\
+ight/\x22\x0a# applica\
+tion wide style \
+sheets, keep thi\
+s short: every w\
+idget pays for i\
+t\x0astyle_sheets =\
+ []\x0a\x0a[scoped_sty\
+le_sheets]\x0aconta\
+ct_list = [\x22../s\
+tyles/contact_li\
+st.qss\x22]\x0acontact\
+_editor = [\x22../s\
+tyles/contact_ed\
+itor.qss\x22, \x22../s\
+tyles/light.qss\x22\
+]\x0a\x0a[palette]\x0aWin\
+dow = \x22#f0f0f0\x22\x0a\
+WindowText = \x22#0\
+00000\x22\x0aBase = \x22#\
+ffffff\x22\x0aText = \x22\
+#000000\x22\x0aButton \
+= \x22#e0e0e0\x22\x0aButt\
+onText = \x22#00000\
+0\x22\x0aHighlight = \x22\
+#2a82da\x22\x0aHighlig\
+htedText = \x22#fff\
+fff\x22\x0a\x0a[palette.D\
+isabled]\x0aText = \
+\x22#888888\x22\x0aButton\
+Text = \x22#888888\x22\
+\x0a\
 \x00\x00\x00<\
 Q\
 LineEdit[invalid\
 =\x22true\x22] {\x0a    b\
 order: 3px solid\
  #ff8a65;\x0a}\
-\x00\x00\x00\xc4\
+\x00\x00\x00\x92\
 /\
-*\x0a * Default app\
-lication style\x0a \
-*/\x0aQLineEdit[inv\
-alid=\x22false\x22]:fo\
-cus {\x0a    border\
-: 3px solid pale\
-tte(highlight);\x0a\
-}\x0a\x0a*#remove-cont\
-act-button {\x0a   \
- qproperty-icon:\
- url(\x22{{icon_pat\
-h}}delete.svg\x22);\
-\x0a}\x0a\
+*\x0a * Contact edi\
+tor style, scope\
+d to the Contact\
+Editor widget\x0a *\
+/\x0aQLineEdit[inva\
+lid=\x22false\x22]:foc\
+us {\x0a    border:\
+ 3px solid palet\
+te(highlight);\x0a}\
+\x0a\
+\x00\x00\x00\x8f\
+/\
+*\x0a * Contact lis\
+t style, scoped \
+to the ContactLi\
+st widget\x0a */\x0a*#\
+remove-contact-b\
+utton {\x0a    qpro\
+perty-icon: url(\
+\x22{{icon_path}}de\
+lete.svg\x22);\x0a}\x0a\
 \x00\x00\x00<\
 Q\
 LineEdit[invalid\
@@ -494,14 +593,31 @@ qt_resource_name = b"\
 \x07\xac\x02\xc3\
 \x00s\
 \x00t\x00y\x00l\x00e\x00s\
+\x00\x06\
+\x07\xae\xc3\xc3\
+\x00t\
+\x00h\x00e\x00m\x00e\x00s\
+\x00\x09\
+\x08\xe5c<\
+\x00d\
+\x00a\x00r\x00k\x00.\x00t\x00o\x00m\x00l\
+\x00\x0a\
+\x0f{\xed\x9c\
+\x00l\
+\x00i\x00g\x00h\x00t\x00.\x00t\x00o\x00m\x00l\
 \x00\x08\
 \x08\x8eU\xe3\
 \x00d\
 \x00a\x00r\x00k\x00.\x00q\x00s\x00s\
-\x00\x0b\
-\x0c\xe2!\xa3\
-\x00d\
-\x00e\x00f\x00a\x00u\x00l\x00t\x00.\x00q\x00s\x00s\
+\x00\x12\
+\x04\xb7Gc\
+\x00c\
+\x00o\x00n\x00t\x00a\x00c\x00t\x00_\x00e\x00d\x00i\x00t\x00o\x00r\x00.\x00q\x00s\
+\x00s\
+\x00\x10\
+\x04H\x8d\xa3\
+\x00c\
+\x00o\x00n\x00t\x00a\x00c\x00t\x00_\x00l\x00i\x00s\x00t\x00.\x00q\x00s\x00s\
 \x00\x09\
 \x0d\xf7\xbdC\
 \x00l\
@@ -557,52 +673,60 @@ qt_resource_name = b"\
 "
 
 qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x0f\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x0b\
+\x00\x00\x00.\x00\x02\x00\x00\x00\x04\x00\x00\x00\x0b\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00.\x00\x02\x00\x00\x00\x03\x00\x00\x00\x08\
+\x00\x00\x00@\x00\x02\x00\x00\x00\x02\x00\x00\x00\x09\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x00\x02\x00\x00\x00\x04\x00\x00\x00\x04\
+\x00\x00\x00\x10\x00\x02\x00\x00\x00\x04\x00\x00\x00\x05\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xb8\x00\x00\x00\x00\x00\x01\x00\x00\x04S\
-\x00\x00\x01\x9e\xbc\x9d\xbf\x05\
-\x00\x00\x00\x8a\x00\x00\x00\x00\x00\x01\x00\x00\x01H\
-\x00\x00\x01\x9e\xbc\x9d\xbf\x05\
-\x00\x00\x00\xe6\x00\x00\x00\x00\x00\x01\x00\x00\x07\x9e\
-\x00\x00\x01\x9e\xbc\x9d\xbf\x03\
-\x00\x00\x01\x14\x00\x00\x00\x00\x00\x01\x00\x00\x0a\x85\
-\x00\x00\x01\x9e\xbc\x9d\xbf\x04\
-\x00\x00\x00@\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x9e\xbde\x15\x1f\
-\x00\x00\x00V\x00\x00\x00\x00\x00\x01\x00\x00\x00@\
-\x00\x00\x01\x9e\xbdg2\x89\
-\x00\x00\x00r\x00\x00\x00\x00\x00\x01\x00\x00\x01\x08\
-\x00\x00\x01\x9e\xbdeK\xcb\
-\x00\x00\x01B\x00\x02\x00\x00\x00\x05\x00\x00\x00\x12\
+\x00\x00\x010\x00\x00\x00\x00\x00\x01\x00\x00\x0a\x13\
+\x00\x00\x01\x9f\x90\x8d\x01\xe0\
+\x00\x00\x01\x02\x00\x00\x00\x00\x00\x01\x00\x00\x07\x08\
+\x00\x00\x01\x9f\x90\x8d\x01\xe0\
+\x00\x00\x01^\x00\x00\x00\x00\x00\x01\x00\x00\x0d^\
+\x00\x00\x01\x9f\x90\x8d\x01\xe0\
+\x00\x00\x01\x8c\x00\x00\x00\x00\x00\x01\x00\x00\x10E\
+\x00\x00\x01\x9f\x90\x8d\x01\xe0\
+\x00\x00\x00R\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1T\xf6\x22j\
+\x00\x00\x00j\x00\x00\x00\x00\x00\x01\x00\x00\x02\xb9\
+\x00\x00\x01\xa1T\xf6\x22i\
+\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x01\x00\x00\x065\
+\x00\x00\x01\xa1T\xf6\x227\
+\x00\x00\x00\x9a\x00\x00\x00\x00\x00\x01\x00\x00\x05\x9f\
+\x00\x00\x01\xa1T\xf6\x226\
+\x00\x00\x00\x84\x00\x00\x00\x00\x00\x01\x00\x00\x05_\
+\x00\x00\x01\x9f\x90\x8d\x01\xe0\
+\x00\x00\x00\xea\x00\x00\x00\x00\x00\x01\x00\x00\x06\xc8\
+\x00\x00\x01\x9f\x90\x8d\x01\xe0\
+\x00\x00\x01\xba\x00\x02\x00\x00\x00\x05\x00\x00\x00\x16\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x01P\x00\x02\x00\x00\x00\x05\x00\x00\x00\x0d\
+\x00\x00\x01\xc8\x00\x02\x00\x00\x00\x05\x00\x00\x00\x11\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x01\x94\x00\x00\x00\x00\x00\x01\x00\x00\x0fi\
-\x00\x00\x01\x9e\xbc\x9d\xbe\xfe\
-\x00\x00\x01\xc0\x00\x00\x00\x00\x00\x01\x00\x00\x13`\
-\x00\x00\x01\x9e\xbc\x9d\xbe\xfe\
-\x00\x00\x01z\x00\x00\x00\x00\x00\x01\x00\x00\x0e \
-\x00\x00\x01\x9e\xbc\x9d\xbe\xfd\
-\x00\x00\x01\xa8\x00\x00\x00\x00\x00\x01\x00\x00\x10m\
-\x00\x00\x01\x9e\xbc\x9d\xbe\xfd\
-\x00\x00\x01`\x00\x00\x00\x00\x00\x01\x00\x00\x0dl\
-\x00\x00\x01\x9e\xbc\x9d\xbe\xff\
-\x00\x00\x01\x94\x00\x00\x00\x00\x00\x01\x00\x00\x16V\
-\x00\x00\x01\x9e\xbc\x9d\xbf\x00\
-\x00\x00\x01\xc0\x00\x00\x00\x00\x00\x01\x00\x00\x1aM\
-\x00\x00\x01\x9e\xbc\x9d\xbf\x01\
-\x00\x00\x01z\x00\x00\x00\x00\x00\x01\x00\x00\x15\x0d\
-\x00\x00\x01\x9e\xbc\x9d\xbf\x00\
-\x00\x00\x01\xa8\x00\x00\x00\x00\x00\x01\x00\x00\x17Z\
-\x00\x00\x01\x9e\xbc\x9d\xbe\xff\
-\x00\x00\x01`\x00\x00\x00\x00\x00\x01\x00\x00\x14Y\
-\x00\x00\x01\x9e\xbc\x9d\xbf\x01\
+\x00\x00\x02\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x15)\
+\x00\x00\x01\x9f\x90\x8d\x01\xe0\
+\x00\x00\x028\x00\x00\x00\x00\x00\x01\x00\x00\x19 \
+\x00\x00\x01\x9f\x90\x8d\x01\xe0\
+\x00\x00\x01\xf2\x00\x00\x00\x00\x00\x01\x00\x00\x13\xe0\
+\x00\x00\x01\x9f\x90\x8d\x01\xe0\
+\x00\x00\x02 \x00\x00\x00\x00\x00\x01\x00\x00\x16-\
+\x00\x00\x01\x9f\x90\x8d\x01\xe0\
+\x00\x00\x01\xd8\x00\x00\x00\x00\x00\x01\x00\x00\x13,\
+\x00\x00\x01\x9f\x90\x8d\x01\xe0\
+\x00\x00\x02\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x1c\x16\
+\x00\x00\x01\x9f\x90\x8d\x01\xe0\
+\x00\x00\x028\x00\x00\x00\x00\x00\x01\x00\x00 \x0d\
+\x00\x00\x01\x9f\x90\x8d\x01\xe0\
+\x00\x00\x01\xf2\x00\x00\x00\x00\x00\x01\x00\x00\x1a\xcd\
+\x00\x00\x01\x9f\x90\x8d\x01\xe0\
+\x00\x00\x02 \x00\x00\x00\x00\x00\x01\x00\x00\x1d\x1a\
+\x00\x00\x01\x9f\x90\x8d\x01\xe0\
+\x00\x00\x01\xd8\x00\x00\x00\x00\x00\x01\x00\x00\x1a\x19\
+\x00\x00\x01\x9f\x90\x8d\x01\xe0\
 "
 
 def qInitResources():
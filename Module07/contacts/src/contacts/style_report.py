@@ -0,0 +1,44 @@
+"""Report which widgets the theme's style sheet rules apply to and how long it
+takes to polish each part of the contacts window.  Run with:
+uv run contacts-style-report"""
+
+import sys
+
+from PySide6.QtWidgets import QApplication, QStyleFactory
+
+import contacts.resources_rc  # noqa: F401
+from contacts.contacts_ui import ContactsWindow
+from themes.qss_analysis import analyse_style_sheet, format_report, measure_polish_time
+from themes.theme import LightTheme, theme_manager
+
+
+def main():
+    app = QApplication(sys.argv)
+    app.setStyle(QStyleFactory.create("Fusion"))
+    theme = LightTheme()
+    theme_manager.set_theme(theme)
+    theme_manager.install(app)
+
+    window = ContactsWindow()
+    window.show()
+    app.processEvents()
+
+    print("== application wide style sheets")
+    print(format_report(analyse_style_sheet(app.styleSheet(), window)) or "(none)")
+    for scope in theme.scoped_style_sheet_paths:
+        print(f"\n== style sheets scoped to {scope}")
+        print(
+            format_report(analyse_style_sheet(theme.scoped_style_sheet(scope), window))
+        )
+
+    print("\n== polish time")
+    for name, widget in [
+        ("window", window),
+        ("contact list", window._contact_list),
+        ("contact editor", window._contact_editor),
+    ]:
+        print(f"{name}: {measure_polish_time(widget):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Switching the application language while it is running."""
+
+import time
+from typing import Optional
+
+from PySide6.QtCore import (
+    QCoreApplication,
+    QDir,
+    QEvent,
+    QLocale,
+    QObject,
+    QTranslator,
+    Signal,
+)
+
+
+class TranslationManager(QObject):
+    """I install the translator for the current locale.  Normally you would
+    access my only instance using the module scope variable
+    `translation_manager`.
+
+    Translators are loaded the first time their locale is used and then kept,
+    so switching back to a language costs nothing but the re-translation of the
+    widgets.  Catalogs loaded from the compiled resources are used in place,
+    catalogs on disk are memory-mapped by QTranslator.
+
+    Widgets re-translate themselves when they receive a LanguageChange event
+    (see `ContactsWindow.changeEvent`).  Qt compresses those events so swapping
+    the translators causes a single re-translation pass."""
+
+    locale_changed = Signal(QLocale, float)  # new locale, switch time in ms
+
+    def __init__(self, directory: str = ":/translations", prefix: str = "translation"):
+        super().__init__()
+        self._directory = directory
+        self._prefix = prefix
+        self._translators: dict[str, Optional[QTranslator]] = {}
+        self._installed: Optional[QTranslator] = None
+        self._locale = QLocale(QLocale.Language.C)
+        self.last_switch_ms = 0.0
+
+    def locale(self) -> QLocale:
+        return self._locale
+
+    def available_locales(self) -> list[QLocale]:
+        """Answer the locales there is a translation catalog for."""
+        file_names = QDir(self._directory).entryList([f"{self._prefix}_*.qm"])
+        names = [name[len(self._prefix) + 1 : -len(".qm")] for name in file_names]
+        return [QLocale(name) for name in sorted(names)]
+
+    def set_locale(self, locale: QLocale) -> bool:
+        """Translate the application for `locale`.  Answer false if there is no
+        catalog for it, the source language is used in that case."""
+        app = QCoreApplication.instance()
+        start = time.perf_counter()
+        translator = self._translator(locale)
+        if translator is not self._installed:
+            if self._installed is not None:
+                app.removeTranslator(self._installed)
+            if translator is not None:
+                app.installTranslator(translator)
+            self._installed = translator
+            # deliver the (compressed) LanguageChange events now so that the
+            # switch time includes re-translating the widgets
+            QCoreApplication.sendPostedEvents(None, QEvent.Type.LanguageChange)
+        self._locale = locale
+        self.last_switch_ms = (time.perf_counter() - start) * 1000
+        self.locale_changed.emit(locale, self.last_switch_ms)
+        return translator is not None
+
+    def _translator(self, locale: QLocale) -> Optional[QTranslator]:
+        if locale.name() not in self._translators:
+            translator = QTranslator(self)
+            if not translator.load(locale, self._prefix, "_", self._directory):
+                translator.deleteLater()
+                translator = None
+            self._translators[locale.name()] = translator
+        return self._translators[locale.name()]
+
+
+translation_manager = TranslationManager()
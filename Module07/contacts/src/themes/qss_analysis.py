@@ -0,0 +1,129 @@
+"""Tools for finding out what a style sheet costs.
+
+`analyse_style_sheet` reports, for every selector of a style sheet, which
+widget classes of a widget tree it may apply to.  Only the subject of each
+selector (the part after the last combinator) is compared with the widgets:
+its type, `.Type` and `#name` parts are checked, property and pseudo-state
+conditions are not (those rules are reported as conditional).  That is enough
+to spot rules that are installed far wider than they need to be.
+
+`measure_polish_time` re-polishes every widget of a tree and answers how long
+that took, which is what Qt has to do whenever the style sheets change.
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from PySide6.QtWidgets import QWidget
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_RULE = re.compile(r"([^{}]+)\{[^{}]*\}")
+# a selector token is a compound selector or a combinator, brackets may hold spaces
+_TOKEN = re.compile(r"(?:\[[^\]]*\]|[^\s>\[])+|>")
+_SUBJECT = re.compile(r"^(?P<type>\*|\.?[A-Za-z_]\w*)?")
+_ID = re.compile(r"#([\w-]+)")
+
+
+@dataclass(frozen=True)
+class Selector:
+    """The parts of a selector's subject that decide which widgets it targets."""
+
+    text: str
+    type_name: Optional[str]
+    exact_type: bool
+    object_name: Optional[str]
+    conditional: bool
+
+    def may_match(self, widget: QWidget) -> bool:
+        if self.type_name is not None:
+            if self.exact_type:
+                if widget.metaObject().className() != self.type_name:
+                    return False
+            elif not widget.inherits(self.type_name):
+                return False
+        if self.object_name is not None and widget.objectName() != self.object_name:
+            return False
+        return True
+
+
+@dataclass
+class RuleReport:
+    selector: Selector
+    widget_classes: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def widget_count(self) -> int:
+        return sum(self.widget_classes.values())
+
+
+def parse_selectors(style_sheet: str) -> list[Selector]:
+    """Answer the selectors of all rules in `style_sheet`, in order."""
+    result = []
+    for match in _RULE.finditer(_COMMENT.sub("", style_sheet)):
+        for text in match.group(1).split(","):
+            text = " ".join(text.split())
+            if text:
+                result.append(_parse_selector(text))
+    return result
+
+
+def _parse_selector(text: str) -> Selector:
+    subject = _TOKEN.findall(text)[-1]
+    type_name = _SUBJECT.match(subject).group("type")
+    rest = subject[len(type_name or "") :]
+    object_name = _ID.search(rest)
+    return Selector(
+        text=text,
+        type_name=None if type_name in (None, "*") else type_name.lstrip("."),
+        exact_type=bool(type_name and type_name.startswith(".")),
+        object_name=object_name.group(1) if object_name else None,
+        conditional="[" in rest or ":" in rest,
+    )
+
+
+def widget_tree(root: QWidget) -> list[QWidget]:
+    return [root, *root.findChildren(QWidget)]
+
+
+def analyse_style_sheet(style_sheet: str, root: QWidget) -> list[RuleReport]:
+    """Answer, for every selector of `style_sheet`, the classes (and number) of
+    the widgets below `root` it may apply to."""
+    widgets = widget_tree(root)
+    reports = []
+    for selector in parse_selectors(style_sheet):
+        report = RuleReport(selector)
+        for widget in widgets:
+            if selector.may_match(widget):
+                class_name = widget.metaObject().className()
+                report.widget_classes[class_name] = (
+                    report.widget_classes.get(class_name, 0) + 1
+                )
+        reports.append(report)
+    return reports
+
+
+def format_report(reports: list[RuleReport]) -> str:
+    lines = []
+    for report in reports:
+        flag = " (conditional)" if report.selector.conditional else ""
+        classes = ", ".join(
+            f"{name} x{count}" for name, count in sorted(report.widget_classes.items())
+        )
+        lines.append(f"{report.selector.text}{flag}")
+        lines.append(f"    {report.widget_count} widgets: {classes or 'none'}")
+    return "\n".join(lines)
+
+
+def measure_polish_time(root: QWidget, repeat: int = 10) -> float:
+    """Answer the average time in milliseconds it takes to re-polish every
+    widget below (and including) `root`."""
+    widgets = widget_tree(root)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for widget in widgets:
+            style = widget.style()
+            style.unpolish(widget)
+            style.polish(widget)
+    return (time.perf_counter() - start) * 1000 / repeat
@@ -6,30 +6,60 @@ from abc import ABC, abstractmethod
 from typing import Optional, Protocol, Sequence, runtime_checkable
 
 from PySide6.QtCore import QFile, QObject, Signal
-from PySide6.QtGui import QColor, QIcon, QPalette
+from PySide6.QtGui import QIcon, QPalette
 from PySide6.QtWidgets import QApplication
 
+from themes.theme_file import is_resource_path, load_theme_definition, resolve_path
+
 
 class ThemeManager(QObject):
     """I hold onto a theme and pass on theme messages to it.  Normally you would access my only instance
     using the module scope variable `theme_manager`."""
 
     theme_changed = Signal()
+    scoped_style_sheets_changed = Signal()
 
     def __init__(self) -> None:
         super().__init__()
         self._theme: Optional[Theme] = None
+        self.theme_directory = ":/themes"
 
     def set_theme(self, theme: Theme):
         self._theme = theme
         self.theme_changed.emit()
+        self.scoped_style_sheets_changed.emit()
+
+    def theme(self) -> Theme:
+        return self._current_theme()
+
+    def theme_path(self, file_name: str) -> str:
+        """Answer the path of the theme file `file_name` in my theme directory.
+        Set `theme_directory` to a directory on disk to load (and hot reload)
+        themes from there instead of from the compiled resources."""
+        return resolve_path(self.theme_directory, file_name)
 
     def icon(self, icon_name: str) -> QIcon:
         return self._current_theme().icon(icon_name)
 
+    def style_sheet(self, scope: str) -> str:
+        return self._current_theme().scoped_style_sheet(scope)
+
     def install(self, app: QApplication) -> None:
         self._current_theme().install(app)
 
+    def apply_changes(self, app: QApplication, changes: set[str]) -> None:
+        """Re-apply only the parts of the current theme named in `changes` (see
+        `FileTheme.reload`)."""
+        theme = self._current_theme()
+        if "palette" in changes:
+            app.setPalette(theme._build_palette())
+        if "style_sheets" in changes:
+            app.setStyleSheet(theme._load_style_sheets())
+        if "scoped_style_sheets" in changes:
+            self.scoped_style_sheets_changed.emit()
+        if "icons" in changes:
+            self.theme_changed.emit()
+
     def _current_theme(self) -> Theme:
         if self._theme is None:
             raise RuntimeError("Theme was not specified")
@@ -41,7 +71,8 @@ theme_manager = ThemeManager()
 
 class Theme(ABC):
     icon_path = ":/icons/default/"
-    style_sheet_paths = [":/styles/default.qss"]
+    style_sheet_paths: list[str] = []
+    scoped_style_sheet_paths: dict[str, list[str]] = {}
 
     def install(self, app: QApplication) -> None:
         app.setPalette(self._build_palette())
@@ -53,9 +84,17 @@ class Theme(ABC):
     def icon(self, icon_name: str) -> QIcon:
         return QIcon(self.icon_path + icon_name)
 
+    def scoped_style_sheet(self, scope: str) -> str:
+        """Answer the style sheet for the widgets that use `scope` (see
+        `ThemeableWidgetMixin._set_style_scope`)."""
+        return self._join_style_sheets(self.scoped_style_sheet_paths.get(scope, []))
+
     def _load_style_sheets(self) -> str:
+        return self._join_style_sheets(self.style_sheet_paths)
+
+    def _join_style_sheets(self, paths: Sequence[str]) -> str:
         result = ""
-        for style_sheet_path in self.style_sheet_paths:
+        for style_sheet_path in paths:
             result += self._load_style_sheet(style_sheet_path) + "\n\n"
         return result
 
@@ -98,64 +137,98 @@ class ThemeableWidgetMixin:
         for widget, icon_name in self._themed_icon_targets():
             widget.setIcon(theme_manager.icon(icon_name))
 
+    def _set_style_scope(self, scope: str) -> None:
+        """Style me and my children with the theme's style sheets for `scope`
+        rather than installing those rules on the whole application."""
+        if not hasattr(self, "_style_scope"):
+            theme_manager.scoped_style_sheets_changed.connect(self._update_style_scope)
+        self._style_scope = scope
+        self._update_style_scope()
+
+    def _update_style_scope(self) -> None:
+        self.setStyleSheet(theme_manager.style_sheet(self._style_scope))
+
+
+class FileTheme(Theme):
+    """A theme whose palette, style sheets and icons are described by a theme
+    file (see `themes.theme_file`).  The file is parsed once; the palette and
+    the style sheet text are built on first use and kept until `reload`."""
+
+    file_name = ""
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        if path is None:
+            path = theme_manager.theme_path(self.file_name)
+        self.path = path
+        self._use_definition(load_theme_definition(self.path))
+
+    def _use_definition(self, definition) -> None:
+        self._definition = definition
+        self.icon_path = definition.icon_path
+        self.style_sheet_paths = list(definition.style_sheet_paths)
+        self.scoped_style_sheet_paths = {
+            scope: list(paths) for scope, paths in definition.scoped_style_sheet_paths
+        }
+        self._palette: Optional[QPalette] = None
+        self._style_sheets: Optional[str] = None
+        self._scoped_style_sheets: dict[str, str] = {}
 
-class LightTheme(Theme):
+    def _build_palette(self) -> QPalette:
+        if self._palette is None:
+            self._palette = self._definition.build_palette()
+        return self._palette
+
+    def _load_style_sheets(self) -> str:
+        if self._style_sheets is None:
+            self._style_sheets = super()._load_style_sheets()
+        return self._style_sheets
+
+    def scoped_style_sheet(self, scope: str) -> str:
+        if scope not in self._scoped_style_sheets:
+            self._scoped_style_sheets[scope] = super().scoped_style_sheet(scope)
+        return self._scoped_style_sheets[scope]
+
+    def _all_scoped_style_sheets(self) -> dict[str, str]:
+        return {
+            scope: self.scoped_style_sheet(scope)
+            for scope in self.scoped_style_sheet_paths
+        }
+
+    def watched_paths(self) -> list[str]:
+        """Answer the files on disk that make up this theme."""
+        paths = [self.path, *self.style_sheet_paths]
+        for scoped_paths in self.scoped_style_sheet_paths.values():
+            paths.extend(p for p in scoped_paths if p not in paths)
+        return [path for path in paths if not is_resource_path(path)]
+
+    def reload(self) -> set[str]:
+        """Re-read the theme file and the style sheets and answer the parts of
+        the theme that changed: any of "palette", "style_sheets",
+        "scoped_style_sheets" and "icons"."""
+        old_definition = self._definition
+        old_style_sheets = self._load_style_sheets()
+        old_scoped_style_sheets = self._all_scoped_style_sheets()
+        self._use_definition(load_theme_definition(self.path, reload=True))
+
+        changes = set()
+        if self._definition.palette_entries != old_definition.palette_entries:
+            changes.add("palette")
+        if self._load_style_sheets() != old_style_sheets:
+            changes.add("style_sheets")
+        if self._all_scoped_style_sheets() != old_scoped_style_sheets:
+            changes.add("scoped_style_sheets")
+        if self.icon_path != old_definition.icon_path:
+            changes.add("icons")
+        return changes
+
+
+class LightTheme(FileTheme):
     """Define a light color theme."""
 
-    icon_path = ":/icons/light/"
-    style_sheet_paths = [":/styles/default.qss", ":/styles/light.qss"]
+    file_name = "light.toml"
 
-    def _build_palette(self) -> QPalette:
-        p = QPalette()
-
-        p.setColor(QPalette.ColorRole.Window, QColor("#f0f0f0"))
-        p.setColor(QPalette.ColorRole.WindowText, QColor("#000000"))
-        p.setColor(QPalette.ColorRole.Base, QColor("#ffffff"))
-        p.setColor(QPalette.ColorRole.Text, QColor("#000000"))
-        p.setColor(QPalette.ColorRole.Button, QColor("#e0e0e0"))
-        p.setColor(QPalette.ColorRole.ButtonText, QColor("#000000"))
-        p.setColor(QPalette.ColorRole.Highlight, QColor("#2a82da"))
-        p.setColor(QPalette.ColorRole.HighlightedText, QColor("#ffffff"))
-
-        p.setColor(
-            QPalette.ColorGroup.Disabled, QPalette.ColorRole.Text, QColor("#888888")
-        )
-        p.setColor(
-            QPalette.ColorGroup.Disabled,
-            QPalette.ColorRole.ButtonText,
-            QColor("#888888"),
-        )
-
-        return p
-
-
-class DarkTheme(Theme):
-    """Define a dark color theme"""
 
-    icon_path = ":/icons/dark/"
-    style_sheet_paths = [":/styles/default.qss", ":/styles/dark.qss"]
+class DarkTheme(FileTheme):
+    """Define a dark color theme"""
 
-    def _build_palette(self) -> QPalette:
-        p = QPalette()
-
-        # Active / general
-        p.setColor(QPalette.ColorRole.Window, QColor("#2b2b2b"))
-        p.setColor(QPalette.ColorRole.WindowText, QColor("#dddddd"))
-        p.setColor(QPalette.ColorRole.Base, QColor("#3c3c3c"))
-        p.setColor(QPalette.ColorRole.Text, QColor("#eeeeee"))
-        p.setColor(QPalette.ColorRole.Button, QColor("#444444"))
-        p.setColor(QPalette.ColorRole.ButtonText, QColor("#dddddd"))
-        p.setColor(QPalette.ColorRole.Highlight, QColor("#3d8ec9"))
-        p.setColor(QPalette.ColorRole.HighlightedText, QColor("#ffffff"))
-
-        # Disabled (explicit!)
-        p.setColor(
-            QPalette.ColorGroup.Disabled, QPalette.ColorRole.Text, QColor("#777777")
-        )
-        p.setColor(
-            QPalette.ColorGroup.Disabled,
-            QPalette.ColorRole.ButtonText,
-            QColor("#777777"),
-        )
-
-        return p
+    file_name = "dark.toml"
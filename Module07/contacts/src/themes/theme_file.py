@@ -0,0 +1,166 @@
+"""Theme definition files.
+
+A theme file is a small TOML document naming the palette colors, the style
+sheets and the icon directory of a theme:
+
+    name = "light"
+    icon_path = "../icons/light/"
+    style_sheets = []
+
+    [scoped_style_sheets]
+    contact_editor = ["../styles/contact_editor.qss", "../styles/light.qss"]
+
+    [palette]
+    Window = "#f0f0f0"
+
+    [palette.Disabled]
+    Text = "#888888"
+
+`style_sheets` are installed application wide, `scoped_style_sheets` only on
+the widgets that ask for that scope (and their children), so rules that only
+matter in one widget do not cost anything anywhere else.  Top level palette
+entries apply to every color group, entries in a sub-table only to that
+group.  Relative paths are resolved against the directory holding
+the theme file so the same file works from the compiled resources and from
+disk.  Parsed definitions are cached by path; `load_theme_definition(path,
+reload=True)` re-reads the file.
+"""
+
+import os
+import posixpath
+import tomllib
+from dataclasses import dataclass
+from typing import Optional
+
+from PySide6.QtCore import QFile
+from PySide6.QtGui import QColor, QPalette
+
+PaletteEntry = tuple[Optional[QPalette.ColorGroup], QPalette.ColorRole, str]
+
+
+@dataclass(frozen=True)
+class ThemeDefinition:
+    """The parsed, path-resolved contents of a theme file."""
+
+    path: str
+    name: str
+    icon_path: str
+    style_sheet_paths: tuple[str, ...]
+    scoped_style_sheet_paths: tuple[tuple[str, tuple[str, ...]], ...]
+    palette_entries: tuple[PaletteEntry, ...]
+
+    def build_palette(self) -> QPalette:
+        p = QPalette()
+        for group, role, color in self.palette_entries:
+            if group is None:
+                p.setColor(role, QColor(color))
+            else:
+                p.setColor(group, role, QColor(color))
+        return p
+
+
+_definitions: dict[str, tuple[Optional[int], ThemeDefinition]] = {}
+
+
+def load_theme_definition(path: str, reload: bool = False) -> ThemeDefinition:
+    """Answer the definition stored in the theme file at `path`.  The file is
+    only read the first time, when `reload` is true or, for files on disk, when
+    it has been modified since it was read."""
+    stamp = _modification_time(path)
+    cached = _definitions.get(path)
+    if reload or cached is None or cached[0] != stamp:
+        cached = (stamp, parse_theme_definition(path, read_text(path)))
+        _definitions[path] = cached
+    return cached[1]
+
+
+def parse_theme_definition(path: str, text: str) -> ThemeDefinition:
+    try:
+        data = tomllib.loads(text)
+    except tomllib.TOMLDecodeError as e:
+        raise ValueError(f"Theme file {path} is not valid TOML: {e}") from e
+    directory = _directory_of(path)
+    icon_path = resolve_path(directory, data.get("icon_path", ""))
+    if not icon_path.endswith("/"):
+        icon_path += "/"
+    return ThemeDefinition(
+        path=path,
+        name=data.get("name", posixpath.basename(path)),
+        icon_path=icon_path,
+        style_sheet_paths=_resolve_paths(directory, data.get("style_sheets", [])),
+        scoped_style_sheet_paths=tuple(
+            (scope, _resolve_paths(directory, paths))
+            for scope, paths in data.get("scoped_style_sheets", {}).items()
+        ),
+        palette_entries=_parse_palette(path, data.get("palette", {})),
+    )
+
+
+def read_text(path: str) -> str:
+    """Read a text file from disk or from the compiled resources."""
+    file = QFile(path)
+    if not file.open(QFile.OpenModeFlag.ReadOnly):
+        raise RuntimeError(f"Failed to open {path}")
+    result = file.readAll().toStdString()
+    file.close()
+    return result
+
+
+def is_resource_path(path: str) -> bool:
+    return path.startswith(":")
+
+
+def resolve_path(directory: str, path: str) -> str:
+    if is_resource_path(path) or os.path.isabs(path):
+        return path
+    if is_resource_path(directory):
+        return posixpath.normpath(posixpath.join(directory, path))
+    return os.path.abspath(os.path.join(directory, path))
+
+
+def _resolve_paths(directory: str, paths: list[str]) -> tuple[str, ...]:
+    return tuple(resolve_path(directory, path) for path in paths)
+
+
+def _modification_time(path: str) -> Optional[int]:
+    if is_resource_path(path):
+        return None
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _directory_of(path: str) -> str:
+    if is_resource_path(path):
+        return posixpath.dirname(path)
+    return os.path.dirname(os.path.abspath(path))
+
+
+def _parse_palette(path: str, palette: dict) -> tuple[PaletteEntry, ...]:
+    # general entries first so that group specific ones override them
+    general: list[PaletteEntry] = []
+    grouped: list[PaletteEntry] = []
+    for key, value in palette.items():
+        if isinstance(value, dict):
+            group = _enum_member(path, QPalette.ColorGroup, key)
+            for role_name, color in value.items():
+                role = _enum_member(path, QPalette.ColorRole, role_name)
+                grouped.append((group, role, _color(path, color)))
+        else:
+            role = _enum_member(path, QPalette.ColorRole, key)
+            general.append((None, role, _color(path, value)))
+    return tuple(general + grouped)
+
+
+def _enum_member(path, enum, name):
+    try:
+        return enum[name]
+    except KeyError:
+        raise ValueError(f"Theme file {path}: unknown {enum.__name__} {name!r}")
+
+
+def _color(path: str, value) -> str:
+    if not isinstance(value, str) or not QColor.isValidColorName(value):
+        raise ValueError(f"Theme file {path}: invalid color {value!r}")
+    return value
@@ -0,0 +1,72 @@
+"""Hot reload of file themes while the application is running."""
+
+import time
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, QTimer, Signal
+from PySide6.QtWidgets import QApplication
+
+from themes.theme import FileTheme, ThemeManager, theme_manager
+
+
+class ThemeWatcher(QObject):
+    """I watch the files of the current theme and, when they change on disk,
+    re-apply only the parts of the theme that actually changed.  Themes loaded
+    from the compiled resources cannot change so there is nothing to watch for
+    them; set `theme_manager.theme_directory` to a directory on disk first."""
+
+    theme_reloaded = Signal(object, float)  # set of changes, milliseconds
+    reload_failed = Signal(str)
+
+    # editors often write a file in several steps, wait for them to finish
+    settle_time_ms = 50
+
+    def __init__(
+        self, app: QApplication, manager: ThemeManager = theme_manager, parent=None
+    ) -> None:
+        super().__init__(parent)
+        self._app = app
+        self._manager = manager
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._file_changed)
+
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(self.settle_time_ms)
+        self._reload_timer.timeout.connect(self.reload)
+
+        self._manager.theme_changed.connect(self._watch_current_theme)
+        self._watch_current_theme()
+
+    def watched_paths(self) -> list[str]:
+        return self._watcher.files()
+
+    def reload(self) -> None:
+        theme = self._manager.theme()
+        if not isinstance(theme, FileTheme):
+            return
+        start = time.perf_counter()
+        try:
+            changes = theme.reload()
+        except (RuntimeError, ValueError) as e:
+            self.reload_failed.emit(str(e))
+        else:
+            self._manager.apply_changes(self._app, changes)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.theme_reloaded.emit(changes, elapsed_ms)
+        # files replaced by an editor drop out of the watcher, watch them again
+        self._watch_current_theme()
+
+    def _file_changed(self, path: str) -> None:
+        self._reload_timer.start()
+
+    def _watch_current_theme(self) -> None:
+        theme = self._manager.theme()
+        paths = theme.watched_paths() if isinstance(theme, FileTheme) else []
+        watched = self._watcher.files()
+        if set(watched) == set(paths):
+            return
+        if watched:
+            self._watcher.removePaths(watched)
+        if paths:
+            self._watcher.addPaths(paths)
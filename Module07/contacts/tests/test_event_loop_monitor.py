@@ -0,0 +1,27 @@
+import pytest
+from event_loop_monitor import EventLoopMonitor
+
+import contacts.resources_rc  # noqa: F401
+from contacts.contacts_ui import ContactsWindow
+from themes.theme import LightTheme, theme_manager
+
+
+@pytest.fixture
+def monitor():
+    monitor = EventLoopMonitor(threshold_ms=50, heartbeat_ms=10)
+    monitor.start()
+    yield monitor
+    monitor.stop()
+
+
+def test_window_slots_are_timed(qtbot, monitor, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # ContactDB creates contacts.db here
+    theme_manager.set_theme(LightTheme())
+    window = ContactsWindow()
+    qtbot.addWidget(window)
+
+    window._toggle_theme_action.trigger()
+    window._toggle_theme_action.trigger()
+
+    assert monitor.slot_times["ContactsWindow._toggle_theme"].calls == 2
+    window._database.close()
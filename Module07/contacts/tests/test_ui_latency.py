@@ -0,0 +1,42 @@
+import pytest
+
+import contacts.resources_rc  # noqa: F401
+from contacts.contacts_ui import ContactsWindow
+from themes.theme import LightTheme, theme_manager
+
+
+@pytest.fixture
+def window(ui_latency, tmp_path, monkeypatch):
+    monkeypatch.chdir(
+        tmp_path
+    )  # ContactDB creates contacts.db in the working directory
+    theme_manager.set_theme(LightTheme())
+    window = ContactsWindow()
+    ui_latency.show(window)
+    yield window
+    window._database.close()
+
+
+def test_contacts_window_latency(ui_latency, window):
+    contact_list = window._contact_list
+    editor = window._contact_editor
+
+    for i in range(5):
+        ui_latency.click(f"new contact {i}", contact_list._new_contact_button)
+        editor._name_input.clear()
+        ui_latency.type(f"type name {i}", editor._name_input, f"Contact {i}")
+        editor._phone_input.setText(f"(334) 555-010{i}")
+        editor._email_input.setText(f"contact{i}@example.com")
+        ui_latency.click(f"save contact {i}", editor._save_button)
+    for row in range(contact_list._list.count()):
+        ui_latency.measure(
+            f"select contact {row}",
+            lambda: contact_list._list.setCurrentRow(row),
+            expect_repaint=True,
+        )
+    ui_latency.measure("dark theme", window._toggle_theme_action.trigger, 100)
+    ui_latency.measure("light theme", window._toggle_theme_action.trigger, 100)
+    ui_latency.click("delete contact", contact_list._remove_contact_button)
+
+    ui_latency.assert_within_budget()
+    ui_latency.assert_repainted()
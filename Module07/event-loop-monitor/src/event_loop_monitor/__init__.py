@@ -0,0 +1,143 @@
+"""Find out what freezes the GUI.
+
+While a slot runs, the event loop waits: nothing is repainted and no input
+is handled.  An `EventLoopMonitor` notices that in two ways:
+
+* a heartbeat timer that should fire every `heartbeat_ms`; when it fires
+  late, the event loop was blocked that long (`lagged`);
+* slots decorated with `timed_slot` report how long they took and who sent
+  the signal; those taking longer than the threshold are reported as they
+  return (`slow_slot`), and `report()` sums up all of them.
+
+A timed slot called while another one runs, directly or from a nested
+event loop, is not timed on its own: its time counts toward the outer
+slot only, so the times of the slots add up to the time spent in them.
+
+Both are logged as warnings too.  A decorated slot costs one check while
+no monitor is running.
+"""
+
+import functools
+import inspect
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
+
+_log = logging.getLogger(__name__)
+_monitor: Optional["EventLoopMonitor"] = None
+# whether a timed slot runs in the current thread
+_timing = threading.local()
+
+
+@dataclass
+class SlotTimes:
+    calls: int = 0
+    total: float = 0.0  # seconds
+    longest: float = 0.0  # seconds
+    slow_calls: int = 0
+
+
+class EventLoopMonitor(QObject):
+    # how many ms later than due the heartbeat fired
+    lagged = Signal(float)
+    # the slot, who sent the signal and how many ms the slot took
+    slow_slot = Signal(str, str, float)
+
+    def __init__(
+        self, threshold_ms: float = 100.0, heartbeat_ms: int = 50, parent=None
+    ):
+        super().__init__(parent)
+        self.threshold_ms = threshold_ms
+        self.heartbeat_ms = heartbeat_ms
+        self.longest_lag_ms = 0.0
+        self.slot_times: dict[str, SlotTimes] = {}
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(heartbeat_ms)
+        self._timer.timeout.connect(self._heartbeat)
+        self._last_beat = 0.0
+
+    def start(self) -> None:
+        """Start the heartbeat and have the `timed_slot`s report here."""
+        global _monitor
+        _monitor = self
+        self._last_beat = time.perf_counter()
+        self._timer.start()
+
+    def stop(self) -> None:
+        global _monitor
+        if _monitor is self:
+            _monitor = None
+        self._timer.stop()
+
+    def report(self) -> str:
+        """Answer the times of the slots, the longest total first."""
+        lines = [f"longest event loop lag {self.longest_lag_ms:.1f} ms"]
+        for name, times in sorted(
+            self.slot_times.items(), key=lambda item: item[1].total, reverse=True
+        ):
+            lines.append(
+                f"{name:<50}{times.calls:7} calls {times.total * 1000:9.1f} ms"
+                f"  longest {times.longest * 1000:7.1f} ms"
+                f"  {times.slow_calls} slow"
+            )
+        return "\n".join(lines)
+
+    def _heartbeat(self) -> None:
+        now = time.perf_counter()
+        lag_ms = (now - self._last_beat) * 1000 - self.heartbeat_ms
+        self._last_beat = now
+        self.longest_lag_ms = max(self.longest_lag_ms, lag_ms)
+        if lag_ms > self.threshold_ms:
+            _log.warning("event loop blocked for %.0f ms", lag_ms)
+            self.lagged.emit(lag_ms)
+
+    def _slot_done(self, name: str, sender: Optional[QObject], seconds: float) -> None:
+        times = self.slot_times.setdefault(name, SlotTimes())
+        times.calls += 1
+        times.total += seconds
+        times.longest = max(times.longest, seconds)
+        ms = seconds * 1000
+        if ms > self.threshold_ms:
+            times.slow_calls += 1
+            sender_name = _describe(sender)
+            _log.warning("slot %s (sent by %s) took %.0f ms", name, sender_name, ms)
+            self.slow_slot.emit(name, sender_name, ms)
+
+
+def timed_slot(slot):
+    """Decorate the method `slot` of a QObject so that it reports its
+    duration and sender to the running `EventLoopMonitor`, if any."""
+    code = slot.__code__
+    count = None if code.co_flags & inspect.CO_VARARGS else code.co_argcount - 1
+
+    @functools.wraps(slot)
+    def timed(self, *args, **kwargs):
+        sender = self.sender()
+        if sender is not None:
+            # like Qt, pass no more of the signal's arguments than the slot
+            # takes; a direct call gets the arguments it gives
+            args = args[:count]
+        monitor = _monitor
+        if monitor is None or getattr(_timing, "active", False):
+            return slot(self, *args, **kwargs)
+        _timing.active = True
+        start = time.perf_counter()
+        try:
+            return slot(self, *args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            _timing.active = False
+            monitor._slot_done(slot.__qualname__, sender, seconds)
+
+    return timed
+
+
+def _describe(sender: Optional[QObject]) -> str:
+    if sender is None:
+        return "a direct call"
+    return sender.objectName() or type(sender).__name__
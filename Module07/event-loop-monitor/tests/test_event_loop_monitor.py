@@ -0,0 +1,112 @@
+import time
+
+import pytest
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from event_loop_monitor import EventLoopMonitor, timed_slot
+
+
+class Sleeper(QObject):
+    poke = Signal(int)
+
+    def __init__(self):
+        super().__init__()
+        self.setObjectName("sleeper")
+        self.calls = []
+
+    @timed_slot
+    def sleep(self, ms):
+        self.calls.append(ms)
+        time.sleep(ms / 1000)
+
+    @timed_slot
+    def no_arguments(self):
+        self.calls.append(None)
+
+    @timed_slot
+    def sleep_twice(self, ms, times=2):
+        for _ in range(times):
+            self.sleep(ms)
+
+
+@pytest.fixture
+def monitor():
+    monitor = EventLoopMonitor(threshold_ms=50, heartbeat_ms=10)
+    monitor.start()
+    yield monitor
+    monitor.stop()
+
+
+def test_heartbeat_notices_a_blocked_event_loop(qtbot, monitor):
+    QTimer.singleShot(0, lambda: time.sleep(0.2))
+
+    with qtbot.waitSignal(monitor.lagged) as blocker:
+        pass
+
+    assert blocker.args[0] > 100
+    assert monitor.longest_lag_ms > 100
+
+
+def test_slow_slot_is_reported_with_its_sender(qtbot, monitor):
+    sleeper = Sleeper()
+    sleeper.poke.connect(sleeper.sleep)
+
+    with qtbot.waitSignal(monitor.slow_slot) as blocker:
+        sleeper.poke.emit(80)
+
+    name, sender, ms = blocker.args
+    assert name == "Sleeper.sleep"
+    assert sender == "sleeper"
+    assert ms >= 80
+    sleeper.sleep(1)
+    times = monitor.slot_times["Sleeper.sleep"]
+    assert (times.calls, times.slow_calls) == (2, 1)
+    assert "Sleeper.sleep" in monitor.report()
+
+
+def test_timed_slot_passes_only_the_arguments_taken(monitor):
+    sleeper = Sleeper()
+    sleeper.poke.connect(sleeper.no_arguments)
+
+    sleeper.poke.emit(5)
+
+    assert sleeper.calls == [None]
+    assert monitor.slot_times["Sleeper.no_arguments"].calls == 1
+
+
+def test_timed_slot_called_directly_gets_all_its_arguments(monitor):
+    sleeper = Sleeper()
+
+    with pytest.raises(TypeError):
+        sleeper.no_arguments(5)
+
+    assert sleeper.calls == []
+
+
+def test_timed_slot_without_monitor():
+    sleeper = Sleeper()
+
+    sleeper.sleep(1)
+
+    assert sleeper.calls == [1]
+
+
+def test_timed_slot_passes_keyword_arguments(monitor):
+    sleeper = Sleeper()
+
+    sleeper.sleep_twice(1, times=3)
+
+    assert sleeper.calls == [1, 1, 1]
+
+
+def test_nested_slots_count_toward_the_outer_one(monitor):
+    sleeper = Sleeper()
+    sleeper.poke.connect(sleeper.sleep_twice)
+
+    sleeper.poke.emit(30)
+
+    assert "Sleeper.sleep" not in monitor.slot_times
+    times = monitor.slot_times["Sleeper.sleep_twice"]
+    assert (times.calls, times.slow_calls) == (1, 1)
+    sleeper.sleep(1)
+    assert monitor.slot_times["Sleeper.sleep"].calls == 1
@@ -0,0 +1,169 @@
+"""Measure how long the demo applications take to start.
+
+Every application is started in a fresh interpreter with ``-X importtime``
+under the offscreen platform.  Its ``main`` runs unchanged; the benchmark only
+replaces ``QApplication`` with a subclass that quits as soon as the event loop
+has started, i.e. once the main window has been shown.  For each application
+it reports the total import time, the time to first show (measured from just
+before the interpreter was launched) and the slowest top level imports.
+
+The applications are run from their ``src`` directories, with those of the
+shared packages they use (``LIBRARIES``) on the path too, so the interpreter
+given with ``--python`` must have their other dependencies installed.
+
+Run with: python3.14 startup_benchmark.py [--runs N] [--top N] [app ...]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+APPS = {
+    "pycalc": ("Module02/pycalc", "pycalc.calculator:main"),
+    "loan_with_signals": (
+        "Module03/loan-with-signals",
+        "loan_with_signals.loan_calculator:main",
+    ),
+    "contacts": ("Module07/contacts", "contacts.contacts_ui:main"),
+    "issue_tracker": (
+        "Module05/slash-commands",
+        "issue_tracker.issues_table_window:main",
+    ),
+    "standard_dialogs": (
+        "Module03/standard-dialogs",
+        "standard_dialogs.standard_dialogs_showcase:main",
+    ),
+}
+
+# the projects of this repository an application imports, besides its own
+LIBRARIES = {
+    "contacts": ("Module07/event-loop-monitor",),
+    "issue_tracker": ("Module07/event-loop-monitor",),
+}
+
+RESULT_MARKER = "STARTUP_RESULT "
+
+DRIVER = f"""
+import importlib, sys, time
+
+launched = float(sys.argv[1])
+module_name, function_name = sys.argv[2].split(":")
+
+from PySide6 import QtWidgets
+from PySide6.QtCore import QTimer
+
+
+class FirstShowApplication(QtWidgets.QApplication):
+    def exec(self):
+        QTimer.singleShot(0, self._first_show)
+        return super().exec()
+
+    def _first_show(self):
+        first_show_ms = (time.time() - launched) * 1000
+        print({RESULT_MARKER!r} + repr(first_show_ms))
+        sys.stdout.flush()
+        self.quit()
+
+
+QtWidgets.QApplication = FirstShowApplication
+sys.argv = [module_name]
+try:
+    getattr(importlib.import_module(module_name), function_name)()
+except SystemExit:
+    pass
+"""
+
+
+@dataclass
+class StartupRun:
+    import_ms: float
+    first_show_ms: float
+    imports: dict[str, float] = field(default_factory=dict)  # top level, cumulative
+
+
+def run_once(
+    python: str, project: Path, entry_point: str, libraries: tuple[Path, ...] = ()
+) -> StartupRun:
+    env = dict(os.environ)
+    env["QT_QPA_PLATFORM"] = "offscreen"
+    env["PYTHONPATH"] = os.pathsep.join(
+        str(path / "src") for path in (project, *libraries)
+    )
+    launched = time.time()
+    completed = subprocess.run(
+        [python, "-X", "importtime", "-c", DRIVER, str(launched), entry_point],
+        cwd=project,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    results = [
+        line[len(RESULT_MARKER) :]
+        for line in completed.stdout.splitlines()
+        if line.startswith(RESULT_MARKER)
+    ]
+    if not results:
+        raise RuntimeError(f"{entry_point} did not start:\n{completed.stderr[-2000:]}")
+    import_ms, imports = parse_import_times(completed.stderr)
+    return StartupRun(import_ms, float(results[0]), imports)
+
+
+def parse_import_times(output: str) -> tuple[float, dict[str, float]]:
+    """Answer the total import time and the cumulative time of every top level
+    import found in the output of ``python -X importtime``."""
+    total_us = 0
+    top_level = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        total_us += int(self_us)
+        if not name.startswith("  "):  # one space follows the separator
+            top_level[name.strip()] = int(cumulative_us) / 1000
+    return total_us / 1000, top_level
+
+
+def benchmark(python: str, app: str, runs: int) -> list[StartupRun]:
+    project_dir, entry_point = APPS[app]
+    libraries = tuple(ROOT / library for library in LIBRARIES.get(app, ()))
+    return [
+        run_once(python, ROOT / project_dir, entry_point, libraries)
+        for _ in range(runs)
+    ]
+
+
+def report(app: str, runs: list[StartupRun], top: int) -> None:
+    import_ms = statistics.median(run.import_ms for run in runs)
+    first_show_ms = statistics.median(run.first_show_ms for run in runs)
+    print(f"{app:<20}{import_ms:>12.1f}{first_show_ms:>18.1f}")
+    slowest = sorted(runs[-1].imports.items(), key=lambda item: -item[1])[:top]
+    for name, cumulative_ms in slowest:
+        print(f"    {name:<40}{cumulative_ms:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("apps", nargs="*", help=f"any of {', '.join(APPS)}")
+    parser.add_argument("--python", default=sys.executable)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5, help="slowest imports to list")
+    args = parser.parse_args()
+    for app in args.apps:
+        if app not in APPS:
+            parser.error(f"unknown application {app}")
+
+    print(f"{'app':<20}{'imports (ms)':>12}{'first show (ms)':>18}")
+    for app in args.apps or APPS:
+        report(app, benchmark(args.python, app, args.runs), args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Offscreen UI latency harness, a pytest plugin.
+
+The `ui_latency` fixture drives widgets through qtbot and measures, for every
+scripted user action, the time from the action until the event loop has
+delivered everything it caused, and whether the action repainted a widget.
+A test checks both with `assert_within_budget()` and `assert_repainted()`.
+Set UI_LATENCY_SCALE to scale all budgets (e.g. 3 on a slow CI machine).
+
+The timings are recorded as properties of the test (they appear in the
+JUnit XML report) and listed in the terminal summary with `-v`.
+"""
+
+import os
+import time
+from dataclasses import dataclass
+
+import pytest
+from PySide6.QtCore import QEvent, QObject, Qt
+from PySide6.QtWidgets import QApplication
+
+DEFAULT_BUDGET_MS = 50.0
+PROPERTY_PREFIX = "ui_latency "
+
+
+@dataclass
+class ActionTiming:
+    name: str
+    elapsed_ms: float
+    budget_ms: float
+    repainted: bool
+    expect_repaint: bool
+
+
+class _PaintCounter(QObject):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.Paint:
+            self.count += 1
+        return False
+
+
+class UiLatency:
+    def __init__(self, qtbot, budget_scale=1.0, record_property=None):
+        self.qtbot = qtbot
+        self.budget_scale = budget_scale
+        self._record_property = record_property
+        self.timings: list[ActionTiming] = []
+        self._paints = _PaintCounter()
+        QApplication.instance().installEventFilter(self._paints)
+
+    def close(self):
+        QApplication.instance().removeEventFilter(self._paints)
+
+    def show(self, widget):
+        self.qtbot.addWidget(widget)
+        widget.show()
+        self.qtbot.waitExposed(widget)
+
+    def measure(
+        self, name, action, budget_ms=DEFAULT_BUDGET_MS, expect_repaint=False
+    ) -> float:
+        """Run `action` and answer the milliseconds until the events it caused
+        have been processed.  With `expect_repaint`, `assert_repainted` checks
+        that a widget was repainted meanwhile."""
+        app = QApplication.instance()
+        app.processEvents()
+        paints = self._paints.count
+        start = time.perf_counter()
+        action()
+        app.processEvents()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.timings.append(
+            ActionTiming(
+                name,
+                elapsed_ms,
+                budget_ms * self.budget_scale,
+                self._paints.count > paints,
+                expect_repaint,
+            )
+        )
+        if self._record_property is not None:
+            self._record_property(PROPERTY_PREFIX + name, round(elapsed_ms, 2))
+        return elapsed_ms
+
+    def click(self, name, widget, budget_ms=DEFAULT_BUDGET_MS) -> float:
+        """Click `widget`, which must repaint something."""
+        return self.measure(
+            name,
+            lambda: self.qtbot.mouseClick(widget, Qt.MouseButton.LeftButton),
+            budget_ms,
+            expect_repaint=True,
+        )
+
+    def type(self, name, widget, text, budget_ms=DEFAULT_BUDGET_MS) -> float:
+        """Type `text` into `widget`, which must repaint something."""
+        return self.measure(
+            name,
+            lambda: self.qtbot.keyClicks(widget, text),
+            budget_ms,
+            expect_repaint=True,
+        )
+
+    def report(self) -> str:
+        return "\n".join(
+            f"{t.name:<30}{t.elapsed_ms:>8.2f} ms  (budget {t.budget_ms:.0f} ms)"
+            + ("" if t.repainted else "  no repaint")
+            for t in self.timings
+        )
+
+    def assert_within_budget(self):
+        over = [t for t in self.timings if t.elapsed_ms > t.budget_ms]
+        if over:
+            pytest.fail(
+                "UI actions over budget:\n"
+                + "\n".join(
+                    f"  {t.name}: {t.elapsed_ms:.1f} ms > {t.budget_ms:.1f} ms"
+                    for t in over
+                )
+            )
+
+    def assert_repainted(self):
+        missing = [t for t in self.timings if t.expect_repaint and not t.repainted]
+        if missing:
+            pytest.fail(
+                "UI actions without a repaint:\n"
+                + "\n".join(f"  {t.name}" for t in missing)
+            )
+
+
+def pytest_configure(config):
+    # before pytest-qt creates the application
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture
+def ui_latency(qtbot, record_property):
+    latency = UiLatency(
+        qtbot, float(os.environ.get("UI_LATENCY_SCALE", "1")), record_property
+    )
+    yield latency
+    latency.close()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if config.getoption("verbose") < 1:
+        return
+    reports = [
+        report
+        for report in terminalreporter.getreports("passed")
+        + terminalreporter.getreports("failed")
+        if report.when == "call"
+    ]
+    lines = [
+        f"{report.nodeid}\n"
+        + "\n".join(
+            f"  {name.removeprefix(PROPERTY_PREFIX):<30}{ms:>8.2f} ms"
+            for name, ms in report.user_properties
+            if name.startswith(PROPERTY_PREFIX)
+        )
+        for report in reports
+        if any(name.startswith(PROPERTY_PREFIX) for name, _ in report.user_properties)
+    ]
+    if lines:
+        terminalreporter.write_sep("-", "UI latency")
+        terminalreporter.write_line("\n".join(lines))